@@ -1,6 +1,11 @@
 import numpy as np  # Importamos numpy para operaciones matemáticas.
-from typing import List, Dict, Tuple  # Importamos tipos para mejor documentación del código.
+from typing import List, Dict, Optional, Tuple  # Importamos tipos para mejor documentación del código.
 from dataclasses import dataclass  # Importamos dataclass para crear clases de datos.
+import os  # Importamos os para construir la ruta a la carpeta del GCM con parámetros definidos.
+import sys  # Importamos sys para agregar esa carpeta a la ruta de búsqueda de módulos.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "GCM con parametros definidos"))  # Carpeta del generador compartido.
+from GCM_ParametrosDefinidos import ciclo_gcm, generar_estados_gcm  # Importamos la detección del período con memoria constante y los bloques vectorizados.
+from FuentesAleatorias import FuenteAleatoria  # Importamos el protocolo común de fuentes de números aleatorios.
 
 class GCM:
     def __init__(self, m: int, X0: int, a: int):  # Constructor de la clase con parámetros del GCM.
@@ -12,20 +17,31 @@ class GCM:
     def generar_numero(self) -> float:  # Método para generar un número pseudoaleatorio.
         self.Xn = (self.a * self.Xn) % self.m  # Fórmula del GCM: Xn+1 = (a*Xn) mod m.
         return self.Xn / self.m  # Normalizamos el número al intervalo [0,1].
+
+    def generar_estados(self, n: int) -> np.ndarray:  # Método para avanzar n iteraciones de una sola vez.
+        estados = generar_estados_gcm(self.Xn, self.a, self.m, n)  # Bloques vectorizados del generador compartido, sin desbordar 64 bits.
+        if n > 0:  # Con n = 0 el generador no avanza.
+            self.Xn = int(estados[-1])  # El último estado es la base de la siguiente iteración.
+        return estados  # Retornamos los n estados generados.
+
+    def generar_bloque(self, n: int) -> np.ndarray:  # Método para generar n números pseudoaleatorios en un arreglo.
+        return self.generar_estados(n) / self.m  # Normalizamos todos los estados al intervalo [0,1] en una sola operación.
+
+    def saltar(self, k: int) -> int:  # Método para avanzar k iteraciones en O(log k) sin generar los valores intermedios.
+        self.Xn = (self.Xn * pow(self.a, k, self.m)) % self.m  # X_{t+k} = (X_t * a^k) mod m; con k negativo retrocede.
+        return self.Xn  # Retornamos el nuevo valor actual del generador.
+
+    def posicion(self, k: int) -> int:  # Método para colocar el generador en la iteración k contada desde la semilla.
+        self.Xn = (self.X0 * pow(self.a, k, self.m)) % self.m  # X_k = (X0 * a^k) mod m.
+        return self.Xn  # Retornamos X_k, que será la base de la siguiente iteración.
         
-    def generar_hasta_periodo(self) -> List[float]:  # Método para generar todos los números posibles.
-        numeros = []  # Lista para almacenar los números generados.
-        numeros_generados = set()  # Conjunto para detectar ciclos.
+    def calcular_periodo(self) -> int:  # Método para obtener el período sin generar la secuencia.
+        return ciclo_gcm(self.a, self.m, self.X0)[1]  # Analítico si m es primo; con el algoritmo de Brent si no.
+
+    def generar_hasta_periodo(self) -> np.ndarray:  # Método para generar todos los números posibles.
+        mu, periodo = ciclo_gcm(self.a, self.m, self.X0)  # Detectamos el ciclo sin guardar los números (memoria constante).
         self.Xn = self.X0  # Reiniciamos el generador a la semilla inicial.
-        
-        while True:  # Bucle hasta encontrar un ciclo.
-            numero = self.generar_numero()  # Generamos un nuevo número.
-            if numero in numeros_generados:  # Si el número ya existe, hemos encontrado un ciclo.
-                break
-            numeros.append(numero)  # Agregamos el número a la lista.
-            numeros_generados.add(numero)  # Agregamos el número al conjunto de control.
-            
-        return numeros  # Retornamos la lista completa de números generados.
+        return self.generar_bloque(max(mu - 1, 0) + periodo)  # Generamos de una vez X1, X2, ... hasta antes de repetir, en un arreglo float64 contiguo.
 
 @dataclass
 class ConfiguracionJuego:  # Clase para almacenar la configuración del juego.
@@ -36,10 +52,15 @@ class ConfiguracionJuego:  # Clase para almacenar la configuración del juego.
         self.apuesta_inicial = apuesta_inicial  # Apuesta inicial en cada volado.
 
 class SimulacionVolados:  # Clase principal de la simulación.
-    def __init__(self, config: ConfiguracionJuego):  # Constructor con la configuración.
+    def __init__(self, config: ConfiguracionJuego, fuente: Optional[FuenteAleatoria] = None, cantidad: int = 32056):  # Constructor con la configuración.
         self.config = config  # Guardamos la configuración.
-        self.gcm = GCM(m=32057, X0=20855, a=9600)  # Inicializamos el GCM con parámetros óptimos.
-        self.numeros = self.gcm.generar_hasta_periodo()  # Generamos todos los números posibles.
+        self.fuente = fuente  # Fuente de números aleatorios; sin ella se usa el GCM del curso.
+        if fuente is None:  # Sin fuente: GCM con los parámetros del curso.
+            self.gcm = GCM(m=32057, X0=20855, a=9600)  # Inicializamos el GCM con parámetros óptimos.
+            self.numeros = self.gcm.generar_hasta_periodo()  # Generamos todos los números posibles.
+        else:  # Con fuente: 'cantidad' números de ella (por omisión, tantos como el período del GCM).
+            self.gcm = None
+            self.numeros = fuente.bloque(cantidad)
         self.indice_actual = 0  # Índice para recorrer la lista de números.
         self.detalles_corridas = []  # Lista para almacenar los detalles de cada corrida.
         self.exitos = 0  # Contador de éxitos (alcanzar la meta).
@@ -49,7 +70,7 @@ class SimulacionVolados:  # Clase principal de la simulación.
         if self.indice_actual >= len(self.numeros):  # Verificamos si hay números disponibles.
             return None, None, None, None, None
             
-        r = self.numeros[self.indice_actual]  # Obtenemos el siguiente número pseudoaleatorio.
+        r = float(self.numeros[self.indice_actual])  # Obtenemos el siguiente número pseudoaleatorio.
         self.indice_actual += 1  # Avanzamos el índice.
         
         resultado = "Águila" if r < 0.5 else "Sol"  # Determinamos el resultado del volado.
@@ -191,11 +212,14 @@ class SimulacionVolados:  # Clase principal de la simulación.
         print(f"Promedio de volados por corrida: {total_volados/total_corridas:.2f}")  # Promedio de volados.
         print(f"Período del GCM: {len(self.numeros)}")  # Período del generador.
 
-        print("\nParámetros del Generador Congruencial Multiplicativo (GCM)")  # Parámetros del GCM.
-        print("="*60)
-        print(f"Módulo (m): {self.gcm.m}")  # Módulo.
-        print(f"Semilla (X₀): {self.gcm.X0}")  # Semilla.
-        print(f"Multiplicador (a): {self.gcm.a}")  # Multiplicador.
+        if self.gcm is not None:  # Con el GCM del curso se muestran sus parámetros.
+            print("\nParámetros del Generador Congruencial Multiplicativo (GCM)")  # Parámetros del GCM.
+            print("="*60)
+            print(f"Módulo (m): {self.gcm.m}")  # Módulo.
+            print(f"Semilla (X₀): {self.gcm.X0}")  # Semilla.
+            print(f"Multiplicador (a): {self.gcm.a}")  # Multiplicador.
+        else:  # Con otra fuente solo se indica cuál fue.
+            print(f"\nFuente aleatoria: {self.fuente.nombre}")
         print("="*60)
 
 def main():  # Función principal.
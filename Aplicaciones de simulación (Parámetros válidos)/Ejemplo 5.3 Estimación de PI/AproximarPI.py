@@ -1,41 +1,78 @@
 import math  # Importamos math para operaciones matemáticas como raíz cuadrada.
 import random  # Importamos random para generación de números aleatorios.
-from typing import List, Tuple  # Importamos tipos para mejor documentación del código.
+import numpy as np  # Importamos numpy para generar bloques de números con operaciones vectorizadas.
+from typing import List, Optional, Tuple  # Importamos tipos para mejor documentación del código.
 from dataclasses import dataclass  # Importamos dataclass para crear clases de datos.
+import os  # Importamos os para construir la ruta a la carpeta del GCM con parámetros definidos.
+import sys  # Importamos sys para agregar esa carpeta a la ruta de búsqueda de módulos.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "GCM con parametros definidos"))  # Carpeta del generador compartido.
+from GCM_ParametrosDefinidos import ciclo_gcm, FlujoGCM, generar_estados_gcm, PeriodoGCM, periodo_en_cache  # Importamos la detección del período, el flujo con cursor, los bloques vectorizados, el período compacto y su caché en disco.
+from FuentesAleatorias import FuenteAleatoria  # Importamos el protocolo común de fuentes de números aleatorios.
 
 class GCM:  # Clase para el Generador Congruencial Multiplicativo.
-    def __init__(self, m: int = 32057, X0: int = 20855, a: int = 9600):  # Constructor con parámetros por defecto.
+    def __init__(self, m: int = 32057, X0: int = 20855, a: int = 9600, al_terminar: str = "reiniciar"):  # Constructor con parámetros por defecto.
         self.m = m  # Módulo del GCM (32057).
         self.X0 = X0  # Semilla inicial (20855).
         self.a = a  # Multiplicador (9600).
         self.Xn = X0  # Valor actual del generador.
-        self.numeros = []  # Lista para almacenar todos los números generados.
+        self._secuencia = None  # Período completo en un arreglo compacto; se construye solo cuando se pide.
+        self.al_terminar = al_terminar  # Qué hacer al agotar el período: "error", "reiniciar" o "continuar".
+        self._flujo = None  # Flujo con cursor sobre el período, creado la primera vez que se pide.
         self._generar_hasta_periodo()  # Generamos todos los números al inicializar.
     
-    def _generar_hasta_periodo(self) -> None:  # Método privado para generar números hasta el período completo.
-        self.Xn = self.X0  # Reiniciamos el generador a la semilla inicial.
-        self.numeros = [self.X0]  # Incluimos X0 en la lista de números.
-        numeros_generados = set([self.X0])  # Conjunto para detectar ciclos.
-        
-        while True:  # Bucle hasta encontrar un ciclo.
-            self.Xn = (self.a * self.Xn) % self.m  # Fórmula del GCM: Xn+1 = (a*Xn) mod m.
-            if self.Xn in numeros_generados:  # Si el número ya existe, hemos encontrado un ciclo.
-                break
-            numeros_generados.add(self.Xn)  # Agregamos el número al conjunto de control.
-            self.numeros.append(self.Xn)  # Agregamos el número a la lista.
+    def _generar_hasta_periodo(self) -> None:  # Método privado para calcular el período completo sin recorrerlo.
+        self.mu, self.periodo = ciclo_gcm(self.a, self.m, self.X0)  # Cola y longitud del ciclo con memoria constante.
+        self._secuencia = None  # El período se construirá la próxima vez que se pida.
+        total = self.mu + self.periodo  # Cantidad de números distintos desde X0 hasta la primera repetición.
         
         print(f"\nVerificación del GCM:")  # Imprimimos información de verificación.
         print(f"Parámetros: m={self.m}, X0={self.X0}, a={self.a}")  # Mostramos los parámetros usados.
-        print(f"Números generados: {len(self.numeros)}")  # Total de números generados.
+        print(f"Números generados: {total}")  # Total de números generados.
         print(f"Deberían ser: {self.m}")  # Número esperado de números.
-        print(f"¿Se generaron todos?: {'Sí' if len(self.numeros) == self.m else 'No'}")  # Verificación de completitud.
-        print(f"Números únicos generados: {len(numeros_generados)}")  # Cantidad de números únicos.
-        print(f"Período del GCM: {len(self.numeros)}")  # Longitud del período.
+        print(f"¿Se generaron todos?: {'Sí' if total == self.m else 'No'}")  # Verificación de completitud.
+        print(f"Números únicos generados: {total}")  # Cantidad de números únicos.
+        print(f"Período del GCM: {total}")  # Longitud del período.
     
+    @property
+    def secuencia(self) -> PeriodoGCM:  # Período completo [X0, X1, ...] en uint16/uint32, construido solo la primera vez que se pide.
+        if self._secuencia is None:  # Si todavía no se ha construido.
+            self._secuencia = periodo_en_cache(self.m, self.a, self.X0)  # Lo leemos mapeado de la caché en disco; solo se genera la primera vez.
+            self.posicion(self.mu + self.periodo - 1)  # Dejamos el generador en el último estado del período; el siguiente es X_{mu+p}.
+        return self._secuencia  # Retornamos el período compacto.
+
+    @property
+    def numeros(self) -> np.ndarray:  # Estados enteros del período completo.
+        return self.secuencia.estados  # Arreglo compacto de solo lectura.
+
+    @property
+    def uniformes(self) -> np.ndarray:  # Números uniformes del período completo, divididos entre m una sola vez.
+        return self.secuencia.uniformes  # Vista flotante guardada en el período.
+    
+    @property
+    def flujo(self) -> FlujoGCM:  # Flujo con cursor sobre el período completo, creado la primera vez que se pide.
+        if self._flujo is None:  # Si todavía no se ha creado.
+            self._flujo = FlujoGCM(self.secuencia, al_terminar=self.al_terminar, generador=self)  # Reutiliza los uniformes ya calculados.
+        return self._flujo  # Retornamos el flujo.
+
     def generar_numero_aleatorio(self) -> float:  # Método para generar un número aleatorio normalizado.
-        if not self.numeros:  # Si no hay números generados.
-            self._generar_hasta_periodo()  # Los generamos.
-        return self.numeros.pop(0) / self.m  # Retornamos el siguiente número normalizado.
+        return self.flujo.siguiente()  # Avanzamos el cursor en O(1) en lugar de desplazar la lista con pop(0).
+
+    def generar_estados(self, n: int) -> np.ndarray:  # Método para avanzar n iteraciones de una sola vez.
+        estados = generar_estados_gcm(self.Xn, self.a, self.m, n)  # Bloques vectorizados del generador compartido, sin desbordar 64 bits.
+        if n > 0:  # Con n = 0 el generador no avanza.
+            self.Xn = int(estados[-1])  # El último estado es la base de la siguiente iteración.
+        return estados  # Retornamos los n estados generados.
+
+    def generar_bloque(self, n: int) -> np.ndarray:  # Método para generar n números pseudoaleatorios en un arreglo.
+        return self.generar_estados(n) / self.m  # Normalizamos todos los estados al intervalo [0,1] en una sola operación.
+
+    def saltar(self, k: int) -> int:  # Método para avanzar k iteraciones en O(log k) sin generar los valores intermedios.
+        self.Xn = (self.Xn * pow(self.a, k, self.m)) % self.m  # X_{t+k} = (X_t * a^k) mod m; con k negativo retrocede.
+        return self.Xn  # Retornamos el nuevo valor actual del generador.
+
+    def posicion(self, k: int) -> int:  # Método para colocar el generador en la iteración k contada desde la semilla.
+        self.Xn = (self.X0 * pow(self.a, k, self.m)) % self.m  # X_k = (X0 * a^k) mod m.
+        return self.Xn  # Retornamos X_k, que será la base de la siguiente iteración.
 
 @dataclass
 class ConfiguracionSimulacion:  # Clase para almacenar la configuración de la simulación.
@@ -45,10 +82,17 @@ class ConfiguracionSimulacion:  # Clase para almacenar la configuración de la s
         self.Z_alpha_2 = 1.96  # Valor crítico para 95% de confianza.
 
 class SimulacionPI:  # Clase principal de la simulación.
-    def __init__(self, config: ConfiguracionSimulacion):  # Constructor con la configuración.
+    def __init__(self, config: ConfiguracionSimulacion, fuente: Optional[FuenteAleatoria] = None, cantidad: int = 32056):  # Constructor con la configuración.
         self.config = config  # Guardamos la configuración.
-        self.gcm = GCM(m=32057, X0=20855, a=9600)  # Inicializamos el GCM con parámetros óptimos.
-        self.numeros = self.gcm.numeros  # Obtenemos la lista de números generados.
+        self.fuente = fuente  # Fuente de números aleatorios; sin ella se usa el GCM del curso.
+        if fuente is None:  # Sin fuente: GCM con los parámetros del curso.
+            self.gcm = GCM(m=32057, X0=20855, a=9600)  # Inicializamos el GCM con parámetros óptimos.
+            self.numeros = self.gcm.numeros  # Obtenemos los estados generados.
+            self.uniformes = self.gcm.uniformes  # Obtenemos los números normalizados, calculados una sola vez.
+        else:  # Con fuente: 'cantidad' números de ella (por omisión, tantos como el período del GCM).
+            self.gcm = None
+            self.uniformes = fuente.bloque(cantidad)
+            self.numeros = self.uniformes  # Solo se usa su longitud.
         self.indice_actual = 0  # Índice para recorrer la lista de números.
         self.puntos_dentro = 0  # Contador de puntos dentro del círculo (x).
         self.puntos_totales = 0  # Contador de puntos totales (n).
@@ -77,9 +121,9 @@ class SimulacionPI:  # Clase principal de la simulación.
         if self.indice_actual + 2 > len(self.numeros):  # Si no hay suficientes números.
             self.indice_actual = 0  # Reiniciamos el índice.
             
-        R1 = self.numeros[self.indice_actual] / self.gcm.m  # Primer número aleatorio uniforme.
+        R1 = self.uniformes[self.indice_actual]  # Primer número aleatorio uniforme.
         self.indice_actual += 1  # Avanzamos el índice.
-        R2 = self.numeros[self.indice_actual] / self.gcm.m  # Segundo número aleatorio uniforme.
+        R2 = self.uniformes[self.indice_actual]  # Segundo número aleatorio uniforme.
         self.indice_actual += 1  # Avanzamos el índice.
         
         return R1, R2  # Retornamos los números aleatorios uniformes.
@@ -142,12 +186,15 @@ class SimulacionPI:  # Clase principal de la simulación.
         print(f"Error relativo:\t\t{error_relativo:.6f}%")
         print("=" * 60)
         
-        print("\nParámetros del Generador Congruencial Multiplicativo (GCM)")
-        print("=" * 60)
-        print(f"Módulo (m): {self.gcm.m}")
-        print(f"Semilla (X₀): {self.gcm.X0}")
-        print(f"Multiplicador (a): {self.gcm.a}")
-        print(f"Período del GCM: {len(self.numeros)}")
+        if self.gcm is not None:  # Con el GCM del curso se muestran sus parámetros.
+            print("\nParámetros del Generador Congruencial Multiplicativo (GCM)")
+            print("=" * 60)
+            print(f"Módulo (m): {self.gcm.m}")
+            print(f"Semilla (X₀): {self.gcm.X0}")
+            print(f"Multiplicador (a): {self.gcm.a}")
+            print(f"Período del GCM: {len(self.numeros)}")
+        else:  # Con otra fuente solo se indica cuál fue.
+            print(f"\nFuente aleatoria: {self.fuente.nombre}")
         print("=" * 60)
 
 def main():  # Función principal.
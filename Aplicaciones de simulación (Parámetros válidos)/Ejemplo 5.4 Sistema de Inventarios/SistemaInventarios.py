@@ -1,34 +1,35 @@
 import numpy as np
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+import os  # Importamos os para construir la ruta a la carpeta del GCM con parámetros definidos.
+import sys  # Importamos sys para agregar esa carpeta a la ruta de búsqueda de módulos.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "GCM con parametros definidos"))  # Carpeta del generador compartido.
+from GCM_ParametrosDefinidos import ciclo_gcm, FlujoGCM, generar_estados_gcm, PeriodoGCM, periodo_en_cache  # Importamos la detección del período, el flujo con cursor, los bloques vectorizados, el período compacto y su caché en disco.
+from Distribuciones import DistribucionDiscreta  # Importamos el muestreo por tablas de probabilidad acumulada.
+from FuentesAleatorias import FuenteAleatoria  # Importamos el protocolo común de fuentes de números aleatorios.
 
 class GCM:
-    def __init__(self, m: int = 32057, X0: int = 20855, a: int = 9600):
+    def __init__(self, m: int = 32057, X0: int = 20855, a: int = 9600, al_terminar: str = "reiniciar"):
         self.m = m  # Módulo del GCM, valor primo que determina el período máximo del generador.
         self.X0 = X0  # Semilla inicial, valor de inicio para la generación de números pseudoaleatorios.
         self.a = a  # Multiplicador, constante que determina la secuencia de números generados.
         self.Xn = X0  # Valor actual del generador, se actualiza en cada iteración.
-        self.numeros = []  # Lista para almacenar todos los números generados en el período completo.
+        self._secuencia = None  # Período completo en un arreglo compacto; se construye solo cuando se pide.
+        self.al_terminar = al_terminar  # Qué hacer al agotar el período: "error", "reiniciar" o "continuar".
+        self._flujo = None  # Flujo con cursor sobre el período, creado la primera vez que se pide.
         self._generar_hasta_periodo()  # Genera todos los números del período al inicializar el generador.
     
     def _generar_hasta_periodo(self) -> None:
-        self.Xn = self.X0  # Inicializa Xn con la semilla X0 para comenzar la generación.
-        self.numeros = [self.X0]  # Almacena la semilla inicial en la lista de números generados.
-        numeros_generados = set([self.X0])  # Conjunto para verificar números únicos generados.
-        
-        while True:
-            self.Xn = (self.a * self.Xn) % self.m  # Fórmula del GCM: Xn+1 = (a * Xn) mod m.
-            if self.Xn in numeros_generados:  # Verifica si el número generado ya existe (período completo).
-                break
-            numeros_generados.add(self.Xn)  # Agrega el nuevo número al conjunto de números únicos.
-            self.numeros.append(self.Xn)  # Almacena el número generado en la lista.
+        self.mu, self.periodo = ciclo_gcm(self.a, self.m, self.X0)  # Calcula la cola y el período sin guardar la secuencia.
+        self._secuencia = None  # El período se construirá la próxima vez que se pida.
+        total = self.mu + self.periodo  # Cantidad de números distintos desde X0 hasta la primera repetición.
         
         print(f"\nVerificación del GCM:")
         print(f"Parámetros: m={self.m}, X0={self.X0}, a={self.a}")  # Muestra los parámetros utilizados.
-        print(f"Números generados: {len(self.numeros)}")  # Muestra la cantidad total de números generados.
+        print(f"Números generados: {total}")  # Muestra la cantidad total de números generados.
         print(f"Deberían ser: {self.m}")  # Muestra el período teórico (m-1).
-        print(f"¿Se generaron todos?: {'Sí' if len(self.numeros) == self.m else 'No'}")  # Verifica si se generó el período completo.
-        print(f"Números únicos generados: {len(numeros_generados)}")  # Muestra la cantidad de números únicos.
-        print(f"Período del GCM: {len(self.numeros)}")  # Muestra el período real del generador.
+        print(f"¿Se generaron todos?: {'Sí' if total == self.m else 'No'}")  # Verifica si se generó el período completo.
+        print(f"Números únicos generados: {total}")  # Muestra la cantidad de números únicos.
+        print(f"Período del GCM: {total}")  # Muestra el período real del generador.
         
         # Muestra los últimos 5 números generados y sus valores uniformes.
         print("\nÚltimos 5 números generados:")
@@ -36,11 +37,46 @@ class GCM:
         print("-" * 30)
         for xn in self.numeros[-5:]:
             print(f"{xn}\t\t{xn/self.m:.5f}")  # Calcula el número uniforme dividiendo Xn entre m.
+
+    @property
+    def secuencia(self) -> PeriodoGCM:
+        if self._secuencia is None:  # El período se obtiene solo la primera vez que se pide.
+            self._secuencia = periodo_en_cache(self.m, self.a, self.X0)  # Se lee mapeado de la caché en disco; solo se genera si no existe.
+            self.posicion(self.mu + self.periodo - 1)  # Deja Xn en el último estado del período para que "continuar" siga con X_{mu+p}.
+        return self._secuencia
+
+    @property
+    def numeros(self) -> np.ndarray:
+        return self.secuencia.estados  # Estados del período en uint16/uint32, de solo lectura.
     
+    @property
+    def flujo(self) -> FlujoGCM:
+        if self._flujo is None:  # El flujo recorre el período con un cursor en lugar de desplazar la lista.
+            self._flujo = FlujoGCM(self.secuencia, al_terminar=self.al_terminar, generador=self)  # Reutiliza los uniformes del período.
+        return self._flujo
+
     def generar_numero_aleatorio(self) -> float:
-        if not self.numeros:  # Verifica si hay números disponibles.
-            self._generar_hasta_periodo()  # Regenera los números si es necesario.
-        return self.numeros.pop(0) / self.m  # Retorna el siguiente número uniforme [0,1).
+        return self.flujo.siguiente()  # Retorna el siguiente número uniforme [0,1) en O(1).
+
+    def siguiente(self) -> float:
+        return self.generar_numero_aleatorio()  # Mismo número, con el nombre del protocolo FuenteAleatoria.
+
+    def generar_estados(self, n: int) -> np.ndarray:  # Método para avanzar n iteraciones de una sola vez.
+        estados = generar_estados_gcm(self.Xn, self.a, self.m, n)  # Bloques vectorizados del generador compartido, sin desbordar 64 bits.
+        if n > 0:  # Con n = 0 el generador no avanza.
+            self.Xn = int(estados[-1])  # El último estado es la base de la siguiente iteración.
+        return estados  # Retornamos los n estados generados.
+
+    def generar_bloque(self, n: int) -> np.ndarray:  # Método para generar n números pseudoaleatorios en un arreglo.
+        return self.generar_estados(n) / self.m  # Normalizamos todos los estados al intervalo [0,1] en una sola operación.
+
+    def saltar(self, k: int) -> int:  # Método para avanzar k iteraciones en O(log k) sin generar los valores intermedios.
+        self.Xn = (self.Xn * pow(self.a, k, self.m)) % self.m  # X_{t+k} = (X_t * a^k) mod m; con k negativo retrocede.
+        return self.Xn  # Retornamos el nuevo valor actual del generador.
+
+    def posicion(self, k: int) -> int:  # Método para colocar el generador en la iteración k contada desde la semilla.
+        self.Xn = (self.X0 * pow(self.a, k, self.m)) % self.m  # X_k = (X0 * a^k) mod m.
+        return self.Xn  # Retornamos X_k, que será la base de la siguiente iteración.
 
 # Parámetros fijos del sistema de inventarios.
 q = 200  # Cantidad fija a ordenar cuando se realiza un pedido.
@@ -56,36 +92,17 @@ tiempos_entrega = [1, 3, 2]  # Tiempos de entrega para órdenes 1, 2 y 3 respect
 def redondear(valor):
     return int(valor + 0.5)  # Función para redondear tradicionalmente (sumando 0.5 y truncando).
 
+# Tabla 5.9: demanda base y su probabilidad acumulada (el límite superior de cada intervalo de r).
+DEMANDA_BASE = DistribucionDiscreta(
+    [35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60],
+    [0.010, 0.025, 0.045, 0.065, 0.087, 0.110, 0.135, 0.162, 0.190, 0.219, 0.254, 0.299, 0.359,
+     0.424, 0.494, 0.574, 0.649, 0.719, 0.784, 0.844, 0.894, 0.934, 0.964, 0.980, 0.995, 1.000])
+
 def demanda_base(r):
-    # Función para determinar la demanda base según la Tabla 5.9.
-    if r < 0.010: return 35  # Si r < 0.010, la demanda base es 35.
-    elif r < 0.025: return 36  # Si 0.010 ≤ r < 0.025, la demanda base es 36.
-    elif r < 0.045: return 37  # Si 0.025 ≤ r < 0.045, la demanda base es 37.
-    elif r < 0.065: return 38  # Si 0.045 ≤ r < 0.065, la demanda base es 38.
-    elif r < 0.087: return 39  # Si 0.065 ≤ r < 0.087, la demanda base es 39.
-    elif r < 0.110: return 40  # Si 0.087 ≤ r < 0.110, la demanda base es 40.
-    elif r < 0.135: return 41  # Si 0.110 ≤ r < 0.135, la demanda base es 41.
-    elif r < 0.162: return 42  # Si 0.135 ≤ r < 0.162, la demanda base es 42.
-    elif r < 0.190: return 43  # Si 0.162 ≤ r < 0.190, la demanda base es 43.
-    elif r < 0.219: return 44  # Si 0.190 ≤ r < 0.219, la demanda base es 44.
-    elif r < 0.254: return 45  # Si 0.219 ≤ r < 0.254, la demanda base es 45.
-    elif r < 0.299: return 46  # Si 0.254 ≤ r < 0.299, la demanda base es 46.
-    elif r < 0.359: return 47  # Si 0.299 ≤ r < 0.359, la demanda base es 47.
-    elif r < 0.424: return 48  # Si 0.359 ≤ r < 0.424, la demanda base es 48.
-    elif r < 0.494: return 49  # Si 0.424 ≤ r < 0.494, la demanda base es 49.
-    elif r < 0.574: return 50  # Si 0.494 ≤ r < 0.574, la demanda base es 50.
-    elif r < 0.649: return 51  # Si 0.574 ≤ r < 0.649, la demanda base es 51.
-    elif r < 0.719: return 52  # Si 0.649 ≤ r < 0.719, la demanda base es 52.
-    elif r < 0.784: return 53  # Si 0.719 ≤ r < 0.784, la demanda base es 53.
-    elif r < 0.844: return 54  # Si 0.784 ≤ r < 0.844, la demanda base es 54.
-    elif r < 0.894: return 55  # Si 0.844 ≤ r < 0.894, la demanda base es 55.
-    elif r < 0.934: return 56  # Si 0.894 ≤ r < 0.934, la demanda base es 56.
-    elif r < 0.964: return 57  # Si 0.934 ≤ r < 0.964, la demanda base es 57.
-    elif r < 0.980: return 58  # Si 0.964 ≤ r < 0.980, la demanda base es 58.
-    elif r < 0.995: return 59  # Si 0.980 ≤ r < 0.995, la demanda base es 59.
-    else: return 60  # Si r ≥ 0.995, la demanda base es 60.
-
-def simular_anio(gcm: GCM, anio: int) -> List[List]:
+    # Función para determinar la demanda base según la Tabla 5.9, por búsqueda binaria en la tabla.
+    return DEMANDA_BASE.muestra(r)  # Valor cuyo intervalo [acumulada anterior, acumulada) contiene a r.
+
+def simular_anio(fuente: FuenteAleatoria, anio: int) -> List[List]:
     # Estado inicial del sistema.
     inventario_actual = inventario_inicial  # Inventario al inicio del año.
     faltante_pendiente = 0  # Cantidad de unidades faltantes pendientes de surtir.
@@ -107,7 +124,7 @@ def simular_anio(gcm: GCM, anio: int) -> List[List]:
                     faltante_pendiente = 0  # Se reinicia el faltante pendiente.
         
         # Paso 2: Calcular demanda con redondeo tradicional.
-        r = gcm.generar_numero_aleatorio()  # Genera número aleatorio para la demanda.
+        r = fuente.siguiente()  # Genera número aleatorio para la demanda.
         demanda_base_val = demanda_base(r)  # Obtiene la demanda base según la tabla.
         demanda_ajustada = redondear(demanda_base_val * factores_estacionales[mes-1])  # Ajusta la demanda por el factor estacional.
         
@@ -152,16 +169,19 @@ def simular_anio(gcm: GCM, anio: int) -> List[List]:
     
     return resultados  # Retorna los resultados de todo el año.
 
-def main():
-    # Inicializar el GCM con los parámetros definidos.
-    gcm = GCM()
+def main(fuente: Optional[FuenteAleatoria] = None, cantidad: int = 32056):
+    # Inicializar el GCM con los parámetros definidos, salvo que se indique otra fuente.
+    gcm = GCM() if fuente is None else None
+    if fuente is None:
+        fuente = gcm
+        cantidad = len(gcm.numeros)  # Con el GCM se usa su período completo.
     
     # Calcular cuántos años podemos simular.
     numeros_por_anio = 12  # 12 meses por año.
-    anios_posibles = len(gcm.numeros) // numeros_por_anio  # División entera para obtener años completos.
-    numeros_sobrantes = len(gcm.numeros) % numeros_por_anio  # Números que sobran después de los años completos.
+    anios_posibles = cantidad // numeros_por_anio  # División entera para obtener años completos.
+    numeros_sobrantes = cantidad % numeros_por_anio  # Números que sobran después de los años completos.
     
-    print(f"\nPodemos simular {anios_posibles} años completos con el GCM")  # Muestra años posibles.
+    print(f"\nPodemos simular {anios_posibles} años completos con {'el GCM' if gcm is not None else fuente.nombre}")  # Muestra años posibles.
     print(f"Nos sobran {numeros_sobrantes} números")  # Muestra números sobrantes.
     
     # Simular cada año.
@@ -171,7 +191,7 @@ def main():
         print(f"{'Mes':<5}{'Inv Inicial':<12}{'Núm Aleat':<12}{'Demanda Aj':<12}{'Inv Final':<12}{'Faltante':<10}{'Orden':<8}{'Inv Prom':<10}")  # Encabezados.
         print("-" * 95)  # Línea separadora.
         
-        resultados = simular_anio(gcm, anio)  # Simula el año actual.
+        resultados = simular_anio(fuente, anio)  # Simula el año actual.
         
         for res in resultados:  # Imprime resultados de cada mes.
             print(f"{res[0]:<5}{res[1]:<12}{res[2]:<12.5f}{res[3]:<12}{res[4]:<12}{res[5]!s:<10}{res[6]!s:<8}{res[7]:<10}")
@@ -188,10 +208,11 @@ def main():
         print(f"Total: ${costo_ordenar + redondear(costo_inventario) + costo_faltante}")  # Costo total del año.
     
     # Mostrar estadísticas finales.
-    print(f"\nNúmeros generados en total: {len(gcm.numeros) + (anios_posibles * 12)}")  # Total de números generados.
+    restantes = gcm.flujo.restantes if gcm is not None else cantidad - anios_posibles * 12  # Números que quedaron sin usar.
+    print(f"\nNúmeros generados en total: {restantes + (anios_posibles * 12)}")  # Total de números generados.
     print(f"Números usados en la simulación: {anios_posibles * 12}")  # Números utilizados.
-    print(f"Números restantes en el GCM: {len(gcm.numeros)}")  # Números que quedaron sin usar.
-    print(f"¿Se usaron todos los números?: {'Sí' if len(gcm.numeros) == 0 else 'No'}")  # Verificación de uso completo.
+    print(f"Números restantes en el GCM: {restantes}")  # Números que quedaron sin usar.
+    print(f"¿Se usaron todos los números?: {'Sí' if restantes == 0 else 'No'}")  # Verificación de uso completo.
 
 if __name__ == "__main__":
     main()  # Ejecuta la simulación principal.
\ No newline at end of file
@@ -1,10 +1,18 @@
 import heapq
 from collections import deque
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import random
+import numpy as np
+import os  # Importamos os para construir la ruta a la carpeta del GCM con parámetros definidos.
+import sys  # Importamos sys para agregar esa carpeta a la ruta de búsqueda de módulos.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "GCM con parametros definidos"))  # Carpeta del generador compartido.
+from GCM_ParametrosDefinidos import generar_estados_gcm, subflujos_gcm  # Importamos los bloques vectorizados y la división de la secuencia en subflujos disjuntos.
+from Distribuciones import DistribucionDiscreta  # Importamos el muestreo por tablas de probabilidad acumulada.
+from FuentesAleatorias import FuenteAleatoria, FuentePrecargada  # Importamos el protocolo común de fuentes y la envoltura con generación en segundo plano.
 
 class GCM:
     def __init__(self, semilla: int, a: int, m: int):
+        self.semilla = semilla
         self.actual = semilla
         self.a = a
         self.m = m
@@ -13,6 +21,26 @@ class GCM:
         self.actual = (self.a * self.actual) % self.m
         return self.actual / self.m
 
+    def generar_estados(self, n: int) -> np.ndarray:  # Método para avanzar n iteraciones de una sola vez.
+        estados = generar_estados_gcm(self.actual, self.a, self.m, n)  # Bloques vectorizados del generador compartido, sin desbordar 64 bits.
+        if n > 0:  # Con n = 0 el generador no avanza.
+            self.actual = int(estados[-1])  # El último estado es la base de la siguiente iteración.
+        return estados  # Retornamos los n estados generados.
+
+    def generar_bloque(self, n: int) -> np.ndarray:  # Método para generar n números pseudoaleatorios en un arreglo.
+        return self.generar_estados(n) / self.m  # Normalizamos todos los estados al intervalo [0,1] en una sola operación.
+
+    def bloque(self, n: int) -> np.ndarray:  # Mismo bloque, con el nombre del protocolo FuenteAleatoria.
+        return self.generar_bloque(n)
+
+    def saltar(self, k: int) -> int:  # Método para avanzar k iteraciones en O(log k) sin generar los valores intermedios.
+        self.actual = (self.actual * pow(self.a, k, self.m)) % self.m  # X_{t+k} = (X_t * a^k) mod m; con k negativo retrocede.
+        return self.actual  # Retornamos el nuevo valor actual del generador.
+
+    def posicion(self, k: int) -> int:  # Método para colocar el generador en la iteración k contada desde la semilla.
+        self.actual = (self.semilla * pow(self.a, k, self.m)) % self.m  # X_k = (X0 * a^k) mod m.
+        return self.actual  # Retornamos X_k, que será la base de la siguiente iteración.
+
 class Evento:
     def __init__(self, tiempo: float, tipo: str):
         self.tiempo = tiempo
@@ -22,66 +50,26 @@ class Evento:
         return self.tiempo < other.tiempo
 
 # FUNCIONES CORREGIDAS (IGUALES AL DOCUMENTO)
+# Tablas de probabilidad acumulada (valor, límite superior del intervalo de r) de los datos del problema.
+CAMIONES_INICIALES = DistribucionDiscreta([0, 1, 2, 3], [0.50, 0.75, 0.90, 1.00])  # Camiones esperando al inicio del turno.
+TIEMPO_ENTRE_LLEGADAS = DistribucionDiscreta([20, 25, 30, 35, 40, 45, 50, 55, 60], [0.02, 0.10, 0.22, 0.47, 0.67, 0.82, 0.92, 0.97, 1.00])  # Minutos entre llegadas.
+TIEMPO_SERVICIO = {  # Minutos de servicio según el tamaño k del equipo.
+    3: DistribucionDiscreta([20, 25, 30, 35, 40, 45, 50, 55, 60], [0.05, 0.15, 0.35, 0.60, 0.72, 0.82, 0.90, 0.96, 1.00]),
+    4: DistribucionDiscreta([15, 20, 25, 30, 35, 40, 45, 50, 55], [0.05, 0.20, 0.40, 0.60, 0.75, 0.87, 0.95, 0.99, 1.00]),
+    5: DistribucionDiscreta([10, 15, 20, 25, 30, 35, 40, 45, 50], [0.10, 0.28, 0.50, 0.68, 0.78, 0.86, 0.92, 0.97, 1.00]),
+    6: DistribucionDiscreta([5, 10, 15, 20, 25, 30, 35, 40, 45], [0.12, 0.27, 0.53, 0.68, 0.80, 0.88, 0.94, 0.98, 1.00]),
+}
+
 def generar_camiones_iniciales(r: float) -> int:  # Función para generar número de camiones al inicio del turno.
-    if r < 0.50: return 0  # 50% de probabilidad de 0 camiones.
-    elif r < 0.75: return 1  # 25% de probabilidad de 1 camión.
-    elif r < 0.90: return 2  # 15% de probabilidad de 2 camiones.
-    else: return 3  # 10% de probabilidad de 3 camiones.
+    return CAMIONES_INICIALES.muestra(r)  # Búsqueda binaria en la tabla acumulada.
 
 def generar_tiempo_entre_llegadas(r: float) -> int:  # Función para generar tiempo entre llegadas de camiones.
-    if r < 0.02: return 20  # 2% de probabilidad de 20 minutos.
-    elif r < 0.10: return 25  # 8% de probabilidad de 25 minutos.
-    elif r < 0.22: return 30  # 12% de probabilidad de 30 minutos.
-    elif r < 0.47: return 35  # 25% de probabilidad de 35 minutos.
-    elif r < 0.67: return 40  # 20% de probabilidad de 40 minutos.
-    elif r < 0.82: return 45  # 15% de probabilidad de 45 minutos.
-    elif r < 0.92: return 50  # 10% de probabilidad de 50 minutos.
-    elif r < 0.97: return 55  # 5% de probabilidad de 55 minutos.
-    else: return 60  # 3% de probabilidad de 60 minutos.
+    return TIEMPO_ENTRE_LLEGADAS.muestra(r)  # Búsqueda binaria en la tabla acumulada.
 
 def generar_tiempo_servicio(k: int, r: float) -> int:  # Función para generar tiempo de servicio según tamaño del equipo.
-    if k == 3:  # Distribución para equipo de 3 personas.
-        if r < 0.05: return 20  # 5% de probabilidad de 20 minutos.
-        elif r < 0.15: return 25  # 10% de probabilidad de 25 minutos.
-        elif r < 0.35: return 30  # 20% de probabilidad de 30 minutos.
-        elif r < 0.60: return 35  # 25% de probabilidad de 35 minutos.
-        elif r < 0.72: return 40  # 12% de probabilidad de 40 minutos.
-        elif r < 0.82: return 45  # 10% de probabilidad de 45 minutos.
-        elif r < 0.90: return 50  # 8% de probabilidad de 50 minutos.
-        elif r < 0.96: return 55  # 6% de probabilidad de 55 minutos.
-        else: return 60  # 4% de probabilidad de 60 minutos.
-    elif k == 4:  # Distribución para equipo de 4 personas.
-        if r < 0.05: return 15  # 5% de probabilidad de 15 minutos.
-        elif r < 0.20: return 20  # 15% de probabilidad de 20 minutos.
-        elif r < 0.40: return 25  # 20% de probabilidad de 25 minutos.
-        elif r < 0.60: return 30  # 20% de probabilidad de 30 minutos.
-        elif r < 0.75: return 35  # 15% de probabilidad de 35 minutos.
-        elif r < 0.87: return 40  # 12% de probabilidad de 40 minutos.
-        elif r < 0.95: return 45  # 8% de probabilidad de 45 minutos.
-        elif r < 0.99: return 50  # 4% de probabilidad de 50 minutos.
-        else: return 55  # 1% de probabilidad de 55 minutos.
-    elif k == 5:  # Distribución para equipo de 5 personas.
-        if r < 0.10: return 10  # 10% de probabilidad de 10 minutos.
-        elif r < 0.28: return 15  # 18% de probabilidad de 15 minutos.
-        elif r < 0.50: return 20  # 22% de probabilidad de 20 minutos.
-        elif r < 0.68: return 25  # 18% de probabilidad de 25 minutos.
-        elif r < 0.78: return 30  # 10% de probabilidad de 30 minutos.
-        elif r < 0.86: return 35  # 8% de probabilidad de 35 minutos.
-        elif r < 0.92: return 40  # 6% de probabilidad de 40 minutos.
-        elif r < 0.97: return 45  # 5% de probabilidad de 45 minutos.
-        else: return 50  # 3% de probabilidad de 50 minutos.
-    else:  # k == 6, distribución para equipo de 6 personas.
-        if r < 0.12: return 5  # 12% de probabilidad de 5 minutos.
-        elif r < 0.27: return 10  # 15% de probabilidad de 10 minutos.
-        elif r < 0.53: return 15  # 26% de probabilidad de 15 minutos.
-        elif r < 0.68: return 20  # 15% de probabilidad de 20 minutos.
-        elif r < 0.80: return 25  # 12% de probabilidad de 25 minutos.
-        elif r < 0.88: return 30  # 8% de probabilidad de 30 minutos.
-        elif r < 0.94: return 35  # 6% de probabilidad de 35 minutos.
-        elif r < 0.98: return 40  # 4% de probabilidad de 40 minutos.
-        else: return 45  # 2% de probabilidad de 45 minutos.
+    return TIEMPO_SERVICIO[k].muestra(r)  # Tabla del equipo de k personas.
 
-def simular_turno(k: int, gen_llegadas: GCM, gen_servicio: GCM) -> Dict[str, float]:
+def simular_turno(k: int, gen_llegadas: FuenteAleatoria, gen_servicio: FuenteAleatoria) -> Dict[str, float]:
     reloj = 0  # Inicializamos el reloj de simulación (11:00 PM = minuto 0).
     cola = deque()  # Cola FIFO para camiones en espera.
     equipo_libre = True  # Estado del equipo (libre/ocupado).
@@ -157,10 +145,17 @@ def simular_turno(k: int, gen_llegadas: GCM, gen_servicio: GCM) -> Dict[str, flo
         "horas_operacion": horas_operacion  # Horas totales de operación.
     }
 
-def main():  # Función principal del programa.
+def main(fuente: Optional[FuenteAleatoria] = None, precargar: bool = False):  # Función principal del programa; sin fuente se usa el GCM del curso.
     a = 9600  # Multiplicador del GCM.
     m = 32057  # Módulo del GCM.
     semilla_base = 20855  # Semilla base para generadores.
+    turnos = 60  # Turnos simulados por tamaño de equipo.
+    
+    # Un subflujo de llegadas y otro de servicios por cada (k, turno), tomados de bloques disjuntos del mismo ciclo.
+    if fuente is None:
+        subflujos, _ = subflujos_gcm(a, m, semilla_base, 2 * 4 * turnos, modo="bloques")
+    else:  # Con otra fuente, los subflujos son los que ella misma reparte.
+        subflujos = fuente.subflujos(2 * 4 * turnos)
     
     resultados = {k: {  # Diccionario para almacenar resultados por tamaño de equipo.
         "salario_normal": 0,  # Inicializamos contadores en 0.
@@ -172,14 +167,24 @@ def main():  # Función principal del programa.
     } for k in range(3, 7)}  # Para equipos de 3 a 6 personas.
     
     for k in range(3, 7):  # Iteramos sobre cada tamaño de equipo.
-        for turno in range(60):  # Simulamos 60 turnos.
-            semilla_llegadas = (semilla_base + k*1000 + turno) % m  # Calculamos semilla para llegadas.
-            semilla_servicios = (semilla_base + k*1000 + turno + 10000) % m  # Calculamos semilla para servicios.
-            
-            gen_llegadas = GCM(semilla_llegadas, a, m)  # Creamos generador para llegadas.
-            gen_servicios = GCM(semilla_servicios, a, m)  # Creamos generador para servicios.
+        for turno in range(turnos):  # Simulamos 60 turnos.
+            indice = 2 * ((k - 3) * turnos + turno)  # Posición de los dos subflujos de este turno.
+            if fuente is None:
+                semilla_llegadas, a_llegadas = subflujos[indice]  # Subflujo para llegadas.
+                semilla_servicios, a_servicios = subflujos[indice + 1]  # Subflujo para servicios.
+                
+                gen_llegadas = GCM(semilla_llegadas, a_llegadas, m)  # Creamos generador para llegadas.
+                gen_servicios = GCM(semilla_servicios, a_servicios, m)  # Creamos generador para servicios.
+            else:
+                gen_llegadas, gen_servicios = subflujos[indice], subflujos[indice + 1]
+            if precargar:  # Los números se generan en otro hilo mientras se simula; la secuencia es la misma.
+                gen_llegadas = FuentePrecargada(gen_llegadas, tamano_bloque=256)
+                gen_servicios = FuentePrecargada(gen_servicios, tamano_bloque=256)
             
             res_turno = simular_turno(k, gen_llegadas, gen_servicios)  # Simulamos un turno.
+            if precargar:  # Se detienen los hilos de este turno.
+                gen_llegadas.cerrar()
+                gen_servicios.cerrar()
             
             for key in resultados[k]:  # Acumulamos resultados.
                 resultados[k][key] += res_turno[key]
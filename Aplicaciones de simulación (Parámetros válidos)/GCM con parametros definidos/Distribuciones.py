@@ -0,0 +1,188 @@
+import bisect  # Importa bisect para la búsqueda binaria en la tabla acumulada.
+import numpy as np  # Importa numpy para transformar bloques de uniformes en una sola operación.
+from typing import Callable, List, Sequence  # Importa tipos para funciones, listas y secuencias.
+
+# Las transformaciones continuas reciben un arreglo de uniformes en [0,1) (por ejemplo gcm.generar_bloque(n))
+# y devuelven un arreglo de variables aleatorias. Las que usan aceptación y rechazo (zigurat, gamma) no pueden
+# saber de antemano cuántos uniformes necesitan, así que reciben la fuente: una función n -> n uniformes.
+FuenteUniformes = Callable[[int], np.ndarray]
+
+def uniforme(u: np.ndarray, a: float, b: float) -> np.ndarray:
+    # Uniforme continua en [a, b): a + (b - a) * u.
+    return a + (b - a) * np.asarray(u)
+
+def triangular(u: np.ndarray, minimo: float, moda: float, maximo: float) -> np.ndarray:
+    # Transformada inversa de la triangular: minimo + sqrt(u (max-min)(moda-min)) antes de la moda
+    # y maximo - sqrt((1-u)(max-min)(max-moda)) después; con (190, 210, 230) son las fórmulas del camión.
+    u = np.asarray(u)
+    corte = (moda - minimo) / (maximo - minimo)  # F(moda).
+    izquierda = minimo + np.sqrt(u * ((maximo - minimo) * (moda - minimo)))
+    derecha = maximo - np.sqrt((1 - u) * ((maximo - minimo) * (maximo - moda)))
+    return np.where(u < corte, izquierda, derecha)
+
+def exponencial(u: np.ndarray, media: float) -> np.ndarray:
+    # Transformada inversa de la exponencial: -media * ln(1 - u); con u en [0,1) nunca se evalúa ln(0).
+    return -media * np.log1p(-np.asarray(u))
+
+def normal_box_muller(u: np.ndarray, media: float = 0.0, desviacion: float = 1.0) -> np.ndarray:
+    # Normal por Box–Muller: cada par de uniformes (u1, u2) da dos normales independientes.
+    u = np.asarray(u)
+    if len(u) % 2:
+        raise ValueError("Box–Muller necesita una cantidad par de uniformes")
+    u1, u2 = u[0::2], u[1::2]
+    radio = np.sqrt(-2 * np.log1p(-u1))  # ln(1 - u1) evita ln(0).
+    angulo = 2 * np.pi * u2
+    z = np.empty(len(u))
+    z[0::2], z[1::2] = radio * np.cos(angulo), radio * np.sin(angulo)
+    return media + desviacion * z
+
+def _tablas_zigurat(capas: int = 128, r: float = 3.442619855899, area: float = 9.91256303526217e-3) -> np.ndarray:
+    # Bordes x_0 > x_1 = r > ... > x_capas = 0 del zigurat de Marsaglia–Tsang para la normal: capas de igual área.
+    x = np.empty(capas + 1)
+    x[0] = area / np.exp(-r * r / 2)  # Ancho virtual de la base, que incluye la cola más allá de r.
+    x[1] = r
+    for i in range(1, capas - 1):
+        x[i + 1] = np.sqrt(-2 * np.log(area / x[i] + np.exp(-x[i] * x[i] / 2)))
+    x[capas] = 0.0
+    return x
+
+_BORDES_ZIGURAT = _tablas_zigurat()  # Se calculan una vez al importar el módulo.
+
+def normal_zigurat(fuente: FuenteUniformes, n: int, media: float = 0.0, desviacion: float = 1.0) -> np.ndarray:
+    # Normal por el método del zigurat: casi todas se aceptan con una comparación; los rechazos se repiten en bloque.
+    x, capas = _BORDES_ZIGURAT, len(_BORDES_ZIGURAT) - 1
+    z = np.empty(n)
+    pendientes = np.arange(n)  # Posiciones que todavía no tienen valor.
+    while len(pendientes):
+        k = len(pendientes)
+        u = fuente(2 * k)
+        capa = np.minimum((u[:k] * capas).astype(np.int64), capas - 1)  # Capa elegida al azar.
+        candidato = (2 * u[k:] - 1) * x[capa]  # Punto con signo dentro del rectángulo de la capa.
+        aceptado = np.abs(candidato) < x[capa + 1]  # Dentro del rectángulo interior: siempre bajo la curva.
+        franja = ~aceptado & (capa > 0)  # Franja entre los dos bordes: se compara contra la densidad.
+        if franja.any():
+            f_arriba, f_abajo = np.exp(-x[capa[franja] + 1] ** 2 / 2), np.exp(-x[capa[franja]] ** 2 / 2)
+            y = f_abajo + fuente(int(franja.sum())) * (f_arriba - f_abajo)
+            aceptado[franja] = y < np.exp(-candidato[franja] ** 2 / 2)
+        cola = ~aceptado & (capa == 0)  # Base fuera del rectángulo: se muestrea la cola más allá de r.
+        restantes = np.flatnonzero(cola)  # La cola se repite hasta aceptar; volver a elegir capa la dejaría corta.
+        while len(restantes):
+            c = len(restantes)
+            v = fuente(2 * c)
+            a_cola = -np.log1p(-v[:c]) / x[1]
+            b_cola = -np.log1p(-v[c:])
+            dentro = 2 * b_cola > a_cola * a_cola
+            indices = restantes[dentro]
+            candidato[indices] = np.sign(candidato[indices]) * (x[1] + a_cola[dentro])
+            restantes = restantes[~dentro]
+        aceptado[cola] = True
+        z[pendientes[aceptado]] = candidato[aceptado]
+        pendientes = pendientes[~aceptado]
+    return media + desviacion * z
+
+def gamma(fuente: FuenteUniformes, n: int, forma: float, escala: float = 1.0) -> np.ndarray:
+    # Gamma(forma, escala) por el método de Marsaglia–Tsang; para forma < 1 se usa Gamma(forma+1) * U^(1/forma).
+    if forma <= 0 or escala <= 0:
+        raise ValueError("La forma y la escala deben ser positivas")
+    if forma < 1:
+        return gamma(fuente, n, forma + 1, escala) * fuente(n) ** (1 / forma)
+    d = forma - 1 / 3
+    c = 1 / np.sqrt(9 * d)
+    resultado = np.empty(n)
+    pendientes = np.arange(n)
+    while len(pendientes):
+        k = len(pendientes)
+        z = normal_zigurat(fuente, k)
+        u = fuente(k)
+        v = (1 + c * z) ** 3
+        aceptado = v > 0
+        aceptado[aceptado] = np.log(u[aceptado]) < (0.5 * z[aceptado] ** 2 + d - d * v[aceptado] + d * np.log(v[aceptado]))
+        resultado[pendientes[aceptado]] = d * v[aceptado]
+        pendientes = pendientes[~aceptado]
+    return escala * resultado
+
+def empirica_continua(u: np.ndarray, datos: Sequence[float]) -> np.ndarray:
+    # Distribución empírica continua: la acumulada lineal por tramos entre los datos ordenados, invertida con np.interp.
+    ordenados = np.sort(np.asarray(datos, dtype=float))
+    return np.interp(u, np.linspace(0.0, 1.0, len(ordenados)), ordenados)
+
+class TablaAlias:
+    # Método de alias de Walker con la construcción de Vose: muestreo de una distribución discreta en O(1).
+    # La tabla tiene n columnas de ancho 1/n; la columna i devuelve su propio valor con probabilidad umbral[i]
+    # y el valor alias[i] en otro caso. Un solo uniforme r elige la columna (parte entera de r*n) y decide
+    # entre ambos valores (parte fraccionaria), así que el costo no depende de cuántos valores tenga la tabla.
+
+    def __init__(self, valores: Sequence, probabilidades: Sequence[float]):
+        # Construye las columnas en O(n) repartiendo el exceso de las probabilidades grandes entre las pequeñas.
+        n = len(valores)
+        escaladas = np.asarray(probabilidades, dtype=float) * n / np.sum(probabilidades)  # Probabilidad por columna.
+        self.umbral = np.ones(n)  # Las columnas que no reciben alias devuelven siempre su valor.
+        self.alias = np.arange(n)  # Índice del valor alterno de cada columna.
+        pequenas = [i for i in range(n) if escaladas[i] < 1]  # Columnas que no se llenan solas.
+        grandes = [i for i in range(n) if escaladas[i] >= 1]  # Columnas con probabilidad de sobra.
+        while pequenas and grandes:
+            chica, grande = pequenas.pop(), grandes.pop()
+            self.umbral[chica] = escaladas[chica]  # La columna chica se completa con el valor grande.
+            self.alias[chica] = grande
+            escaladas[grande] -= 1 - escaladas[chica]  # Lo que se cedió se descuenta del grande.
+            (pequenas if escaladas[grande] < 1 else grandes).append(grande)
+        self.valores = np.asarray(valores)  # Valores posibles de la variable.
+
+    def muestra(self, r: float):
+        # Valor que corresponde al uniforme r, en O(1).
+        n = len(self.valores)
+        columna = min(int(r * n), n - 1)  # Parte entera: la columna.
+        return self.valores[columna if r * n - columna < self.umbral[columna] else self.alias[columna]].item()
+
+    def muestras(self, uniformes: np.ndarray) -> np.ndarray:
+        # Valores que corresponden a un bloque de uniformes, en O(1) por número y sin ciclos de Python.
+        n = len(self.valores)
+        escalados = np.asarray(uniformes) * n
+        columnas = np.minimum(escalados.astype(np.int64), n - 1)
+        propias = escalados - columnas < self.umbral[columnas]  # Parte fraccionaria contra el umbral de la columna.
+        return self.valores[np.where(propias, columnas, self.alias[columnas])]
+
+class DistribucionDiscreta:
+    # Distribución discreta dada por una tabla (valor, probabilidad acumulada), como las tablas de los ejemplos.
+    # Con un uniforme r se elige el primer valor cuya acumulada es mayor que r (método de la transformada inversa),
+    # igual que una cadena "if r < 0.10: ... elif r < 0.25: ...", pero con búsqueda binaria.
+
+    def __init__(self, valores: Sequence, acumuladas: Sequence[float], tolerancia: float = 1e-9):
+        # Constructor; valida que la tabla sea una distribución: acumuladas crecientes, en [0,1] y que terminen en 1.
+        if len(valores) != len(acumuladas) or not valores:
+            raise ValueError("Se necesita la misma cantidad (no nula) de valores y de probabilidades acumuladas")
+        if any(b < a for a, b in zip(acumuladas, acumuladas[1:])) or acumuladas[0] < 0:
+            raise ValueError("Las probabilidades acumuladas deben ser no negativas y no decrecientes")
+        if abs(acumuladas[-1] - 1) > tolerancia:
+            raise ValueError(f"Las probabilidades suman {acumuladas[-1]}, no 1")
+        self.valores = list(valores)  # Valores posibles de la variable.
+        self.acumuladas = list(acumuladas[:-1]) + [1.0]  # Límites superiores de cada intervalo; el último es 1 exacto.
+        self._limites = self.acumuladas[:-1]  # El último intervalo no tiene límite superior, como el "else" de la cadena.
+        self._valores_arreglo = np.asarray(self.valores)  # Copia en arreglo para el muestreo en bloque.
+        self._alias = None  # Tabla de alias, construida la primera vez que se pide.
+
+    @classmethod
+    def desde_probabilidades(cls, valores: Sequence, probabilidades: Sequence[float]) -> "DistribucionDiscreta":
+        # Construye la tabla a partir de las probabilidades puntuales en lugar de las acumuladas.
+        return cls(valores, np.cumsum(probabilidades).tolist())
+
+    @property
+    def probabilidades(self) -> List[float]:
+        # Probabilidad de cada valor, recuperada de la tabla acumulada.
+        return np.diff([0.0] + self.acumuladas).tolist()
+
+    @property
+    def alias(self) -> TablaAlias:
+        # Tabla de alias de la misma distribución, construida una sola vez y guardada con la distribución.
+        # Da los mismos valores con las mismas probabilidades en O(1), pero no el mismo valor para cada r.
+        if self._alias is None:
+            self._alias = TablaAlias(self.valores, self.probabilidades)
+        return self._alias
+
+    def muestra(self, r: float):
+        # Valor que corresponde al uniforme r, en O(log n).
+        return self.valores[bisect.bisect_right(self._limites, r)]
+
+    def muestras(self, uniformes: np.ndarray) -> np.ndarray:
+        # Valores que corresponden a un bloque de uniformes, todos a la vez con np.searchsorted.
+        return self._valores_arreglo[np.searchsorted(self._limites, uniformes, side="right")]
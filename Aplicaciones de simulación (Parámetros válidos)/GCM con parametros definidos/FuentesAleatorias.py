@@ -0,0 +1,197 @@
+import queue  # Importa queue para la cola acotada de bloques precargados.
+import threading  # Importa threading para generar bloques en segundo plano.
+import weakref  # Importa weakref para detener el hilo cuando la fuente precargada ya no se usa.
+import numpy as np  # Importa numpy para los bloques y el generador PCG64 de referencia.
+from typing import List, Optional, Protocol  # Importa tipos para listas, valores opcionales y protocolos.
+from GCM_ParametrosDefinidos import GCM_Combinado, GCM_Primos  # Generadores del proyecto que se adaptan.
+
+class FuenteAleatoria(Protocol):
+    # Lo que una simulación necesita de un generador: números sueltos, bloques y subflujos independientes.
+    # Cualquier clase con estos métodos sirve como fuente; no hace falta heredar de esta.
+    nombre: str  # Descripción corta para los reportes.
+
+    def siguiente(self) -> float:
+        # Siguiente número uniforme en [0,1).
+        ...
+
+    def bloque(self, n: int) -> np.ndarray:
+        # Los siguientes n números uniformes en [0,1), como arreglo.
+        ...
+
+    def subflujos(self, n: int) -> List["FuenteAleatoria"]:
+        # n fuentes que no se traslapan entre sí, para repartir réplicas entre procesos.
+        ...
+
+class FuenteGCM:
+    # Adaptador del GCM del curso (GCM_Primos) al protocolo de fuentes.
+
+    def __init__(self, generador: Optional[GCM_Primos] = None):
+        self.generador = generador if generador is not None else GCM_Primos()  # Por omisión m=32057, X0=20855, a=9600.
+        self.nombre = f"GCM (m={self.generador.m}, X0={self.generador.X0}, a={self.generador.a})"
+
+    def siguiente(self) -> float:
+        # Un número del generador, igual que en las aplicaciones.
+        return self.generador.generar_numero_aleatorio()
+
+    def bloque(self, n: int) -> np.ndarray:
+        # Bloque vectorizado del generador.
+        return self.generador.generar_bloque(n)
+
+    def subflujos(self, n: int) -> List["FuenteGCM"]:
+        # Bloques disjuntos del ciclo, con salto hacia adelante (ver subflujos_gcm).
+        return [FuenteGCM(g) for g in self.generador.subflujos(n)]
+
+class FuenteCombinada:
+    # Adaptador del generador combinado de varios módulos primos (GCM_Combinado).
+    SEPARACION = 1 << 48  # Distancia entre subflujos; muy pequeña frente al período (~10^28) del combinado.
+
+    def __init__(self, generador: Optional[GCM_Combinado] = None):
+        self.generador = generador if generador is not None else GCM_Combinado()
+        self.nombre = f"GCM combinado de {len(self.generador.componentes)} módulos primos"
+
+    def siguiente(self) -> float:
+        # Un número del generador, igual que en las aplicaciones.
+        return self.generador.generar_numero_aleatorio()
+
+    def bloque(self, n: int) -> np.ndarray:
+        # Bloque vectorizado del generador.
+        return self.generador.generar_bloque(n)
+
+    def subflujos(self, n: int) -> List["FuenteCombinada"]:
+        # El subflujo i empieza SEPARACION*i iteraciones después: cada componente salta en O(log k).
+        fuentes = []
+        for i in range(n):
+            componentes = [GCM_Primos(m=c.m, X0=c.X0, a=c.a) for c in self.generador.componentes]
+            for c in componentes:
+                c.X0 = c.posicion(i * self.SEPARACION)  # La nueva semilla es la posición de inicio del subflujo.
+            fuentes.append(FuenteCombinada(GCM_Combinado(componentes)))
+        return fuentes
+
+class FuentePCG64:
+    # Generador de referencia de numpy (PCG64) para corridas de producción: rápido y de período 2^128.
+
+    def __init__(self, semilla: Optional[int] = None, bits: Optional[np.random.PCG64] = None):
+        self.bits = bits if bits is not None else np.random.PCG64(semilla)  # Generador de bits.
+        self.generador = np.random.Generator(self.bits)  # Interfaz de numpy para uniformes.
+        self.nombre = "numpy PCG64"
+
+    def siguiente(self) -> float:
+        # Un número como float de Python, igual que los demás adaptadores.
+        return float(self.generador.random())
+
+    def bloque(self, n: int) -> np.ndarray:
+        # Bloque de n uniformes en [0,1) de numpy.
+        return self.generador.random(n)
+
+    def subflujos(self, n: int) -> List["FuentePCG64"]:
+        # jumped(i) avanza el estado como si se hubieran generado i * (φ-1) * 2^128 números: subflujos sin traslape.
+        return [FuentePCG64(bits=self.bits.jumped(i + 1)) for i in range(n)]
+
+def _entregar(cola: queue.Queue, elemento, detener: threading.Event) -> None:
+    # Deja un elemento en la cola; si está llena espera, revisando de vez en cuando si hay que detenerse.
+    while not detener.is_set():
+        try:
+            cola.put(elemento, timeout=0.1)
+            return
+        except queue.Full:
+            pass
+
+def _producir(fuente: FuenteAleatoria, tamano_bloque: int, cola: queue.Queue, detener: threading.Event) -> None:
+    # Cuerpo del hilo productor: genera bloques y los deja en la cola hasta que se pida detenerse. No guarda una
+    # referencia a la FuentePrecargada, para que esta pueda liberarse y su finalizador detenga el hilo.
+    try:
+        while not detener.is_set():
+            _entregar(cola, fuente.bloque(tamano_bloque), detener)
+    except Exception as error:  # El error se entrega al consumidor en lugar de perderse en el hilo.
+        _entregar(cola, error, detener)
+
+class FuentePrecargada:
+    # Envuelve otra fuente y genera sus bloques en un hilo aparte, para que la generación se traslape con la lógica
+    # del modelo (numpy libera el GIL durante las operaciones de cada bloque). El consumidor lee el bloque actual
+    # con un cursor; la memoria queda acotada por 'profundidad' bloques en la cola más el que se está leyendo.
+    # La secuencia es la misma que daría la fuente envuelta, que a partir de aquí solo debe usar el hilo productor.
+
+    def __init__(self, fuente: FuenteAleatoria, tamano_bloque: int = 65536, profundidad: int = 4):
+        if tamano_bloque < 1 or profundidad < 1:
+            raise ValueError("El tamaño de bloque y la profundidad de la cola deben ser positivos")
+        self.fuente = fuente  # Fuente envuelta.
+        self.tamano_bloque = tamano_bloque  # Números por bloque precargado.
+        self.profundidad = profundidad  # Bloques que pueden esperar en la cola.
+        self.nombre = f"{getattr(fuente, 'nombre', type(fuente).__name__)} (precargada)"  # Basta con que la fuente tenga bloque(n).
+        self._cola = queue.Queue(maxsize=profundidad)  # Bloques listos para consumirse.
+        self._detener = threading.Event()  # Señal para que el productor termine.
+        self._hilo = None  # El hilo se crea con el primer número pedido.
+        self._bloque = np.empty(0)  # Bloque que se está leyendo.
+        self._indice = 0  # Cursor dentro del bloque actual.
+        self._error: Optional[Exception] = None  # Error del productor; se vuelve a lanzar en cada lectura posterior.
+        weakref.finalize(self, self._detener.set)  # Si la fuente se libera sin cerrar(), el hilo termina igual.
+
+    def _siguiente_bloque(self) -> None:
+        # Toma el siguiente bloque de la cola; la primera vez arranca el hilo productor. Nunca se queda esperando un
+        # bloque que no va a llegar: si el productor falló se relanza su error, y si la fuente se cerró (aun desde
+        # otro hilo mientras se esperaba) se avisa con ValueError.
+        if self._error is not None:
+            raise self._error
+        if self._hilo is None and not self._detener.is_set():
+            self._hilo = threading.Thread(target=_producir, daemon=True,
+                                          args=(self.fuente, self.tamano_bloque, self._cola, self._detener))
+            self._hilo.start()
+        while True:
+            if self._detener.is_set():
+                raise ValueError("La fuente precargada ya se cerró")
+            try:
+                bloque = self._cola.get(timeout=0.1)
+                break
+            except queue.Empty:
+                pass
+        if isinstance(bloque, Exception):  # El productor falló y terminó: el error aparece en el hilo que consume.
+            self._error = bloque
+            raise bloque
+        self._bloque, self._indice = bloque, 0
+
+    def siguiente(self) -> float:
+        # Siguiente número del bloque actual, en O(1).
+        if self._indice >= len(self._bloque):
+            self._siguiente_bloque()
+        numero = float(self._bloque[self._indice])
+        self._indice += 1
+        return numero
+
+    def bloque(self, n: int) -> np.ndarray:
+        # Los siguientes n números; si caben en el bloque actual es una rebanada sin copia.
+        if self._indice + n <= len(self._bloque):
+            vista = self._bloque[self._indice:self._indice + n]
+            self._indice += n
+            return vista
+        partes, faltan = [], n
+        while faltan > 0:
+            if self._indice >= len(self._bloque):
+                self._siguiente_bloque()
+            cantidad = min(faltan, len(self._bloque) - self._indice)
+            partes.append(self._bloque[self._indice:self._indice + cantidad])
+            self._indice += cantidad
+            faltan -= cantidad
+        return np.concatenate(partes)
+
+    def subflujos(self, n: int) -> List["FuentePrecargada"]:
+        # Subflujos de la fuente envuelta, cada uno con su propio productor; los hilos arrancan hasta que se usan.
+        return [FuentePrecargada(f, self.tamano_bloque, self.profundidad) for f in self.fuente.subflujos(n)]
+
+    def cerrar(self) -> None:
+        # Detiene el productor; los bloques que quedaban en la cola se descartan.
+        self._detener.set()
+        try:  # Vaciar la cola libera al productor si estaba esperando lugar para un bloque.
+            while True:
+                self._cola.get_nowait()
+        except queue.Empty:
+            pass
+        if self._hilo is not None:
+            self._hilo.join()
+
+    def __enter__(self) -> "FuentePrecargada":
+        # Permite usar la fuente con 'with', que la cierra al salir.
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        # Cierra la fuente al salir del bloque 'with'.
+        self.cerrar()
@@ -1,6 +1,360 @@
+import functools  # Importa functools para guardar en caché resultados que dependen solo de m.
 import math  # Importa el módulo math para operaciones matemáticas.
+import os  # Importa os para manejar el directorio de la caché de períodos.
 import random  # Importa el módulo random para generación de números aleatorios.
-from typing import List  # Importa List para tipado de listas.
+import tempfile  # Importa tempfile para escribir los archivos de la caché de forma atómica.
+import numpy as np  # Importa numpy para generar bloques de números con operaciones vectorizadas.
+from typing import List, Optional, Tuple  # Importa tipos para listas, valores opcionales y tuplas.
+
+# Módulos primos del generador de Java GCM_ModulosPrimos; se usan como componentes del generador combinado.
+MODULOS_PRIMOS = (32057, 32537, 32911, 32687, 32603, 32707, 32933)
+
+# Bases de Miller–Rabin: con estas doce la prueba es determinista para todo n < 3.3 * 10^24.
+BASES_MILLER_RABIN = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+def es_primo(n: int) -> bool:
+    # Prueba de primalidad de Miller–Rabin con las bases de BASES_MILLER_RABIN.
+    if n < 2:  # Los números menores que 2 no son primos.
+        return False
+    for p in BASES_MILLER_RABIN:  # Los primos pequeños se resuelven por división directa.
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0  # Se escribe n-1 = d * 2^s con d impar.
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for base in BASES_MILLER_RABIN:
+        x = pow(base, d, n)
+        if x == 1 or x == n - 1:  # La base no es testigo de que n sea compuesto.
+            continue
+        for _ in range(s - 1):  # Se eleva al cuadrado hasta encontrar n-1.
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:  # Nunca apareció n-1: la base demuestra que n es compuesto.
+            return False
+    return True
+
+def _pollard_brent(n: int) -> int:
+    # Encuentra un factor no trivial de n compuesto e impar con el método rho de Pollard en la variante de Brent.
+    aleatorio = random.Random(n)  # Semilla fija por n: el mismo n siempre sigue el mismo camino.
+    while True:
+        y, c, lote = aleatorio.randrange(1, n), aleatorio.randrange(1, n), 128  # Punto inicial, constante y tamaño de lote.
+        g = r = q = 1
+        while g == 1:
+            x = y  # Punto fijo de la ventana actual (como la tortuga de ciclo_brent).
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:  # Se acumulan productos |x-y| para hacer un solo mcd por lote.
+                ys = y  # Respaldo por si el mcd del lote resulta ser n.
+                for _ in range(min(lote, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += lote
+            r *= 2  # La ventana duplica su tamaño.
+        if g == n:  # El lote saltó el factor: se repite paso a paso desde el respaldo.
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:  # Factor propio encontrado; si no, se intenta con otra constante.
+            return g
+
+@functools.lru_cache(maxsize=1024)
+def _factores_primos(n: int) -> Tuple[int, ...]:
+    # Factores primos únicos de n en orden creciente; se guardan en caché por n para no volver a factorizar.
+    factores = set()  # Factores primos encontrados.
+    for p in BASES_MILLER_RABIN:  # Primero se quitan los factores primos pequeños por división.
+        if n % p == 0:
+            factores.add(p)
+            while n % p == 0:
+                n //= p
+    pendientes = [n] if n > 1 else []  # Partes de n que faltan por descomponer.
+    while pendientes:
+        parte = pendientes.pop()
+        if es_primo(parte):  # Miller–Rabin decide cuándo parar.
+            factores.add(parte)
+            continue
+        divisor = _pollard_brent(parte)  # Se parte en dos con rho y se siguen descomponiendo ambas mitades.
+        pendientes.extend((divisor, parte // divisor))
+    return tuple(sorted(factores))
+
+def factorizar_n(n: int) -> List[int]:
+    # Factoriza n en sus factores primos únicos con Miller–Rabin y rho de Pollard–Brent.
+    # Funciona igual para 32057 que para módulos de 31 a 61 bits; los resultados se reutilizan por n (caché LRU).
+    return list(_factores_primos(n))  # Copia: quien la reciba puede modificarla sin alterar la caché.
+
+def orden_multiplicativo(a: int, m: int, factores: Optional[List[int]] = None) -> int:
+    # Calcula el orden de 'a' módulo m primo: el menor k que divide a m-1 tal que a^k mod m = 1.
+    # Es el período exacto del GCM para cualquier semilla X0 en [1, m-1], y se obtiene sin recorrer la secuencia.
+    orden = m - 1  # Se parte de φ(m) = m-1, que siempre es múltiplo del orden.
+    for f in (factores if factores is not None else factorizar_n(m - 1)):  # Recorre los factores primos de m-1.
+        while orden % f == 0 and pow(a, orden // f, m) == 1:  # Mientras a^(orden/f) siga siendo 1...
+            orden //= f  # ...el orden es más pequeño y se elimina ese factor.
+    return orden  # Retorna el orden multiplicativo de 'a'.
+
+def _potencia_mod_vectorizada(bases: np.ndarray, exponentes: np.ndarray, m: int) -> np.ndarray:
+    # Calcula bases^exponentes mod m elemento a elemento por exponenciación binaria, con todos los candidatos a la vez.
+    resultado = np.ones_like(bases)  # Acumulador del producto.
+    bases = bases % m  # Copia reducida de las bases.
+    exponentes = exponentes.copy()  # Los exponentes se consumen bit por bit.
+    while exponentes.any():  # Mientras algún exponente tenga bits pendientes.
+        impares = (exponentes & 1).astype(bool)  # Elementos cuyo bit actual es 1.
+        resultado[impares] = (resultado[impares] * bases[impares]) % m
+        bases = (bases * bases) % m  # Siguiente potencia de dos de cada base.
+        exponentes >>= 1
+    return resultado
+
+def ordenes_multiplicativos(candidatos, m: int, factores: Optional[List[int]] = None) -> np.ndarray:
+    # Versión vectorizada de orden_multiplicativo: el orden de cada candidato módulo m primo, en un solo arreglo.
+    # Los productos se hacen en int64, así que m debe ser menor que 2^31.5 para que (m-1)^2 no se desborde.
+    if m * m >= 1 << 63:
+        raise ValueError(f"m = {m} es demasiado grande para la prueba vectorizada en int64")
+    candidatos = np.asarray(candidatos, dtype=np.int64) % m  # Multiplicadores a probar.
+    if (candidatos == 0).any():  # 0 no tiene orden multiplicativo.
+        raise ValueError("Los candidatos deben ser distintos de 0 módulo m")
+    ordenes = np.full(candidatos.shape, m - 1, dtype=np.int64)  # Se parte de φ(m) = m-1 para todos.
+    for f in (factores if factores is not None else factorizar_n(m - 1)):  # Igual que en orden_multiplicativo.
+        while True:
+            reducibles = ordenes % f == 0  # Candidatos cuyo orden todavía puede tener el factor f.
+            reducibles[reducibles] = _potencia_mod_vectorizada(candidatos[reducibles], ordenes[reducibles] // f, m) == 1
+            if not reducibles.any():  # Ningún candidato tiene ya el factor f de sobra.
+                break
+            ordenes[reducibles] //= f  # Se elimina una vez el factor f a los que lo permiten.
+    return ordenes
+
+@functools.lru_cache(maxsize=32)
+def raices_primitivas(m: int) -> np.ndarray:
+    # Retorna todas las raíces primitivas módulo m primo en orden creciente: los multiplicadores con período máximo m-1.
+    # El resultado se guarda en caché por m y es de solo lectura. Recorre los m-1 multiplicadores: solo para m pequeño.
+    if not es_primo(m):
+        raise ValueError(f"m = {m} no es primo")
+    if m * m >= 1 << 63:  # Antes de reservar el arreglo de candidatos, que no cabría en memoria.
+        raise ValueError(f"m = {m} es demasiado grande para enumerar todas sus raíces primitivas")
+    candidatos = np.arange(1, m, dtype=np.int64)  # Todos los multiplicadores posibles.
+    raices = candidatos[ordenes_multiplicativos(candidatos, m) == m - 1]  # Los de orden m-1.
+    raices.flags.writeable = False  # Compartido entre llamadas, no se puede modificar.
+    return raices
+
+def ciclo_brent(a: int, m: int, x0: int) -> Tuple[int, int]:
+    # Detecta el ciclo de X_{n+1} = (a * X_n) mod m con el algoritmo de Brent usando memoria constante.
+    # Retorna (mu, periodo): mu es la cantidad de valores antes de entrar al ciclo y periodo la longitud del ciclo.
+    potencia = periodo = 1  # Longitud de la ventana actual y pasos dados dentro de ella.
+    tortuga = x0  # La tortuga se queda fija al inicio de cada ventana.
+    liebre = (a * x0) % m  # La liebre avanza un paso cada iteración.
+    while tortuga != liebre:  # Hasta que la liebre alcance a la tortuga dentro del ciclo.
+        if potencia == periodo:  # Si se agotó la ventana, se duplica y la tortuga salta a la liebre.
+            tortuga = liebre  # Nueva posición de la tortuga.
+            potencia *= 2  # La ventana duplica su tamaño.
+            periodo = 0  # Reinicia los pasos dentro de la ventana.
+        liebre = (a * liebre) % m  # La liebre avanza un paso.
+        periodo += 1  # Cuenta el paso dado.
+
+    tortuga = liebre = x0  # Para encontrar mu, ambos parten de X0...
+    for _ in range(periodo):  # ...pero la liebre con una ventaja de un período completo.
+        liebre = (a * liebre) % m  # Avanza la liebre.
+    mu = 0  # Iteraciones antes de entrar al ciclo.
+    while tortuga != liebre:  # Se encuentran justo en el primer valor del ciclo.
+        tortuga = (a * tortuga) % m  # Avanza la tortuga.
+        liebre = (a * liebre) % m  # Avanza la liebre.
+        mu += 1  # Cuenta un valor más fuera del ciclo.
+    return mu, periodo  # Retorna la cola y la longitud del ciclo.
+
+def ciclo_gcm(a: int, m: int, x0: int) -> Tuple[int, int]:
+    # Retorna (mu, periodo) del GCM; si m es primo y ni X0 ni 'a' son múltiplos de m, el período es el orden de 'a' (mu = 0).
+    if x0 % m != 0 and a % m != 0 and es_primo(m):  # Camino rápido: cálculo analítico sin recorrer la secuencia.
+        return 0, orden_multiplicativo(a, m)  # Con m primo la secuencia es periódica pura desde X0.
+    return ciclo_brent(a, m, x0)  # En cualquier otro caso se recorre la secuencia con memoria constante.
+
+def subflujos_gcm(a: int, m: int, x0: int, n: int, modo: str = "bloques",
+                  longitud: Optional[int] = None) -> Tuple[List[Tuple[int, int]], int]:
+    # Divide la secuencia del GCM en n subflujos que no se traslapan y retorna ([(semilla, multiplicador), ...], limite).
+    # Cada subflujo i es el GCM X_{j+1} = (multiplicador * X_j) mod m que parte de su semilla; los n subflujos
+    # entregan valores en posiciones distintas del ciclo mientras ninguno pida más de 'limite' números.
+    #   "bloques" → el subflujo i empieza en la posición i*L (salto hacia adelante) y usa el mismo 'a'; limite = L.
+    #   "saltos"  → el subflujo i empieza en la posición i y toma uno de cada n valores con multiplicador a^n; limite = periodo // n.
+    mu, periodo = ciclo_gcm(a, m, x0)  # Los subflujos se reparten dentro del ciclo, después de la cola mu.
+    if modo == "bloques":
+        limite = longitud if longitud is not None else periodo // n  # Por omisión el ciclo se reparte en partes iguales.
+        if limite < 1 or n * limite > periodo:  # n bloques de longitud L deben caber en un solo período.
+            raise ValueError(f"{n} bloques de longitud {limite} no caben en el período {periodo}")
+        return [((x0 * pow(a, mu + i * limite, m)) % m, a) for i in range(n)], limite
+    if modo == "saltos":
+        limite = periodo // n  # Los valores i + n*j, con j = 1..limite, son distintos para todos los subflujos.
+        if limite < 1:  # Más subflujos que valores en el período.
+            raise ValueError(f"{n} subflujos intercalados no caben en el período {periodo}")
+        return [((x0 * pow(a, mu + i, m)) % m, pow(a, n, m)) for i in range(n)], limite
+    raise ValueError(f"modo debe ser 'bloques' o 'saltos', no {modo!r}")
+
+def multiplicar_mod(x, y, m: int) -> np.ndarray:
+    # Calcula (x * y) mod m elemento a elemento para 0 <= x, y < m < 2^63 sin desbordar 64 bits; retorna int64.
+    # Si m^2 cabe en int64 se multiplica directo; si no, el producto de 128 bits se arma con mitades de 32 bits
+    # (hi:lo) y se reduce tomando k = 64 - bits(m) bits de 'lo' a la vez, para que r * 2^k nunca pase de 64 bits.
+    if m * m <= 1 << 63:  # Módulos pequeños, como 32057 o 2^31-1: el producto ya cabe en int64.
+        return (np.asarray(x, dtype=np.int64) * np.asarray(y, dtype=np.int64)) % m
+    if m >= 1 << 63:
+        raise ValueError(f"m = {m} no cabe en int64")
+    x = np.asarray(x, dtype=np.int64).astype(np.uint64)  # Los estados son no negativos: se ven como uint64.
+    y = np.asarray(y, dtype=np.int64).astype(np.uint64)
+    mascara = np.uint64(0xFFFFFFFF)  # 32 bits bajos.
+    treinta_y_dos = np.uint64(32)
+    x0, x1 = x & mascara, x >> treinta_y_dos  # x = x1 * 2^32 + x0.
+    y0, y1 = y & mascara, y >> treinta_y_dos  # y = y1 * 2^32 + y0.
+    p00, p01, p10 = x0 * y0, x0 * y1, x1 * y0  # Productos parciales de 32x32 bits: caben en uint64.
+    medio = (p00 >> treinta_y_dos) + (p01 & mascara) + (p10 & mascara)  # Columna de 2^32, con acarreo.
+    lo = (p00 & mascara) | ((medio & mascara) << treinta_y_dos)  # 64 bits bajos del producto.
+    hi = x1 * y1 + (p01 >> treinta_y_dos) + (p10 >> treinta_y_dos) + (medio >> treinta_y_dos)  # 64 bits altos.
+    k = 64 - m.bit_length()  # Bits de 'lo' que se pueden agregar en cada paso sin desbordar.
+    modulo = np.uint64(m)
+    r = hi % modulo  # hi < m porque x*y < m^2 < m * 2^64; se reduce por seguridad.
+    for corrimiento in range(64, 0, -k):  # Horner en base 2^k sobre los bits de 'lo', del más alto al más bajo.
+        bits = min(k, corrimiento)  # El último grupo puede tener menos de k bits.
+        grupo = (lo >> np.uint64(corrimiento - bits)) & np.uint64((1 << bits) - 1)
+        r = ((r << np.uint64(bits)) | grupo) % modulo  # r < m < 2^(64-k): el corrimiento no se desborda.
+    return r.astype(np.int64)
+
+TAMANO_BLOQUE_GCM = 65536  # Potencias de 'a' precalculadas por generador; los bloques más largos se arman por partes.
+
+@functools.lru_cache(maxsize=64)
+def potencias_gcm(a: int, m: int) -> np.ndarray:
+    # Vector [a^1, a^2, ..., a^TAMANO_BLOQUE_GCM] mod m, calculado por duplicación una sola vez por (a, m) y compartido
+    # (de solo lectura) por todos los generadores del proyecto que usan esos parámetros.
+    potencias = np.empty(TAMANO_BLOQUE_GCM, dtype=np.int64)  # Arreglo para las potencias de 'a'.
+    potencias[0] = a % m  # Primera potencia: a^1 mod m.
+    llenos = 1  # Cantidad de potencias ya calculadas.
+    while llenos < len(potencias):  # Cada pasada duplica las potencias conocidas: a^(k+i) = a^k * a^i mod m.
+        copia = min(llenos, len(potencias) - llenos)  # Cuántas potencias nuevas se obtienen en esta pasada.
+        potencias[llenos:llenos + copia] = multiplicar_mod(potencias[:copia], potencias[llenos - 1], m)  # Multiplicación vectorizada.
+        llenos += copia  # Avanza el contador de potencias calculadas.
+    potencias.flags.writeable = False  # Se comparte entre generadores: nadie debe modificarla.
+    return potencias
+
+def generar_estados_gcm(x: int, a: int, m: int, n: int) -> np.ndarray:
+    # Los n estados X_{t+1}, ..., X_{t+n} del GCM X_{j+1} = (a * X_j) mod m a partir de X_t = x, como arreglo int64.
+    # Cada bloque se obtiene de una vez con X_{t+i} = (X_t * a^i) mod m usando multiplicar_mod, así que sirve para
+    # cualquier m < 2^63. Es el cálculo que comparten GCM_Primos y los GCM de las aplicaciones y de las pruebas.
+    estados = np.empty(n, dtype=np.int64)  # Arreglo para los n estados.
+    potencias = potencias_gcm(a, m)  # Potencias de 'a' para un bloque.
+    for inicio in range(0, n, len(potencias)):  # Recorre el arreglo en bloques del tamaño de las potencias.
+        fin = min(inicio + len(potencias), n)  # Fin del bloque actual.
+        estados[inicio:fin] = multiplicar_mod(x, potencias[:fin - inicio], m)  # X_{t+i} = (X_t * a^i) mod m, sin desbordar.
+        x = int(estados[fin - 1])  # El último estado del bloque es la base del siguiente.
+    return estados  # Retorna los n estados generados.
+
+class EstructuraCiclos:
+    # Estructura completa del grafo funcional x -> f(x) sobre los estados 0..N-1: todos los ciclos y a cuál llega cada semilla.
+    #   ciclo[x]   → identificador del ciclo al que llega x (el estado más pequeño de ese ciclo).
+    #   cola[x]    → iteraciones desde x hasta entrar al ciclo (0 si x ya está en él).
+    #   longitudes → {identificador: longitud del ciclo}.
+
+    def __init__(self, sucesores: np.ndarray):
+        # Analiza todos los estados a la vez con duplicación de apuntadores: O(N log N) operaciones vectorizadas.
+        sucesores = np.asarray(sucesores, dtype=np.int64)
+        n = len(sucesores)
+        salto = sucesores.copy()  # f^(2^k); después de ceil(log2 N) duplicaciones todo estado cae en un ciclo.
+        for _ in range(max(1, (n - 1).bit_length())):
+            salto = salto[salto]
+        en_ciclo = np.zeros(n, dtype=bool)
+        en_ciclo[salto] = True  # La imagen de f^(2^k) con 2^k >= N son exactamente los estados cíclicos.
+
+        etiqueta = np.arange(n, dtype=np.int64)  # Mínimo del ciclo, propagado también por duplicación.
+        paso = sucesores.copy()
+        for _ in range(max(1, (n - 1).bit_length())):
+            etiqueta = np.minimum(etiqueta, etiqueta[paso])  # Mínimo sobre una ventana que duplica su tamaño.
+            paso = paso[paso]
+        self.ciclo = etiqueta[salto]  # En los estados cíclicos la etiqueta ya es el mínimo de su ciclo.
+
+        self.cola = np.where(en_ciclo, 0, -1)  # Distancia al ciclo; -1 = todavía desconocida.
+        while (self.cola < 0).any():  # Cada pasada resuelve los estados un paso más lejos del ciclo.
+            pendientes = self.cola < 0
+            conocidos = pendientes & (self.cola[sucesores] >= 0)
+            self.cola[conocidos] = self.cola[sucesores[conocidos]] + 1
+
+        identificadores, longitudes = np.unique(self.ciclo[en_ciclo], return_counts=True)
+        self.longitudes = dict(zip(identificadores.tolist(), longitudes.tolist()))
+        self.en_ciclo = en_ciclo  # Indica qué estados están sobre un ciclo.
+
+    def periodo(self, semilla: int) -> int:
+        # Período de la secuencia que parte de la semilla.
+        return self.longitudes[int(self.ciclo[semilla])]
+
+    def semillas_con_periodo(self, minimo: int) -> np.ndarray:
+        # Todas las semillas cuyo ciclo tiene longitud de al menos 'minimo'.
+        buenos = [c for c, longitud in self.longitudes.items() if longitud >= minimo]
+        return np.flatnonzero(np.isin(self.ciclo, buenos))
+
+def sucesores_gcm(a: int, m: int, c: int = 0) -> np.ndarray:
+    # Arreglo con el sucesor (a*x + c) mod m de cada estado x en 0..m-1 (c = 0 es el GCM; c != 0 es el mixto).
+    estados = np.arange(m, dtype=np.int64)
+    return (multiplicar_mod(estados, np.int64(a % m), m) + c % m) % m
+
+def tipo_estados(m: int) -> np.dtype:
+    # Elige el entero sin signo más pequeño que guarda cualquier estado en [0, m-1]: uint16 si m <= 65536.
+    if m <= 1 << 16:  # Todos los estados caben en 2 bytes.
+        return np.dtype(np.uint16)
+    if m <= 1 << 32:  # Todos los estados caben en 4 bytes.
+        return np.dtype(np.uint32)
+    return np.dtype(np.uint64)  # Módulos más grandes necesitan 8 bytes.
+
+class PeriodoGCM:
+    # Guarda los estados de un período en un arreglo compacto de enteros sin signo.
+    # Los uniformes (estados / m) se calculan solo la primera vez que se piden y se reutilizan después.
+
+    def __init__(self, estados: np.ndarray, m: int):
+        # Constructor que convierte los estados al tipo entero más pequeño posible para m.
+        self.m = m  # Módulo del GCM que produjo los estados.
+        self.estados = np.asarray(estados).astype(tipo_estados(m), copy=False)  # Estados en uint16/uint32/uint64.
+        self.estados.flags.writeable = False  # El período es de solo lectura para poder compartirlo.
+        self._uniformes = None  # Vista flotante, calculada bajo demanda.
+
+    @property
+    def uniformes(self) -> np.ndarray:
+        # Devuelve los estados divididos entre m; la división se hace una sola vez.
+        if self._uniformes is None:  # Se calcula solo en el primer acceso.
+            self._uniformes = self.estados / self.m  # Arreglo float64 con los números en [0,1).
+            self._uniformes.flags.writeable = False  # También de solo lectura.
+        return self._uniformes
+
+    def __len__(self) -> int:
+        # Longitud del período guardado.
+        return len(self.estados)
+
+    def __getitem__(self, indice):
+        # Acceso directo a los estados, igual que con la lista original.
+        return self.estados[indice]
+
+def directorio_cache() -> str:
+    # Directorio donde se guardan los períodos ya generados; la variable de entorno GCM_CACHE_DIR se lee en cada llamada.
+    return os.environ.get("GCM_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "gcm_periodos"))
+
+def ruta_periodo_cache(m: int, a: int, X0: int, directorio: Optional[str] = None) -> str:
+    # Ruta del archivo .npy que guarda el período del GCM con parámetros (m, a, X0).
+    return os.path.join(directorio or directorio_cache(), f"gcm_m{m}_a{a}_x{X0}.npy")
+
+def periodo_en_cache(m: int, a: int, X0: int, directorio: Optional[str] = None) -> PeriodoGCM:
+    # Retorna el período [X0, ..., X_{p-1}] leyéndolo de la caché con np.memmap (sin copiarlo a memoria).
+    # Si no existe, se genera una vez y se guarda; los demás scripts y procesos comparten la página del sistema operativo.
+    ruta = ruta_periodo_cache(m, a, X0, directorio)  # Archivo que corresponde a estos parámetros.
+    mu, periodo = ciclo_gcm(a, m, X0)  # Longitud esperada, para validar el archivo sin leerlo completo.
+    try:
+        estados = np.load(ruta, mmap_mode="r")  # Mapea el archivo en modo de solo lectura.
+        if estados.shape == (mu + periodo,) and estados.dtype == tipo_estados(m):  # El archivo coincide con los parámetros.
+            return PeriodoGCM(estados, m)
+    except (OSError, ValueError):  # El archivo no existe o está dañado: se vuelve a generar.
+        pass
+
+    secuencia = GCM_Primos(m=m, X0=X0, a=a).generar_periodo()  # Genera el período en bloques vectorizados.
+    try:
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)  # Crea el directorio de la caché si hace falta.
+        descriptor, temporal = tempfile.mkstemp(suffix=".npy", dir=os.path.dirname(ruta))  # Archivo temporal en el mismo directorio.
+        with os.fdopen(descriptor, "wb") as archivo:
+            np.save(archivo, secuencia.estados)  # Escribe los estados en el formato .npy.
+        os.replace(temporal, ruta)  # Reemplazo atómico: ningún proceso ve un archivo a medio escribir.
+    except OSError:  # Sin permisos de escritura: se usa el período en memoria sin guardarlo.
+        return secuencia
+    return PeriodoGCM(np.load(ruta, mmap_mode="r"), m)  # Vuelve a abrirlo mapeado para compartirlo con otros procesos.
 
 class GCM_Primos:
     def __init__(self, m: int = 32057, X0: int = 20855, a: int = 9600):
@@ -29,6 +383,52 @@ class GCM_Primos:
         self._X = self._siguiente_valor_xn(self._X)  # Genera el siguiente valor en la secuencia.
         return self._X / self.m  # Convierte el valor a un número uniforme en [0,1) dividiendo entre m.
 
+    def generar_estados(self, n: int) -> np.ndarray:
+        # Avanza la secuencia n iteraciones de una vez y devuelve los estados X_{t+1}, ..., X_{t+n} como arreglo de numpy.
+        estados = generar_estados_gcm(self._X, self.a, self.m, n)  # Bloques vectorizados sin desbordar 64 bits.
+        if n > 0:  # Con n = 0 la secuencia no avanza.
+            self._X = int(estados[-1])  # El último estado es la base de la siguiente iteración.
+        return estados  # Retorna los n estados generados.
+
+    def generar_bloque(self, n: int) -> np.ndarray:
+        # Devuelve n números uniformes en [0,1) como arreglo de numpy, equivalente a n llamadas a generar_numero_aleatorio.
+        return self.generar_estados(n) / self.m  # Divide todos los estados entre m en una sola operación.
+
+    def generar_periodo(self) -> PeriodoGCM:
+        # Genera el período completo [X0, X1, ..., X_{p-1}] en un arreglo compacto, sin usar listas ni conjuntos.
+        mu, periodo = ciclo_gcm(self.a, self.m, self.X0)  # Longitud del período con memoria constante.
+        self._X = self.X0  # Reinicia la secuencia en la semilla.
+        estados = self.generar_estados(mu + periodo)  # X1, ..., X_{mu+p}; el último es la primera repetición.
+        return PeriodoGCM(np.concatenate(([self.X0], estados[:-1])), self.m)  # Incluye X0 y quita la repetición.
+
+    def saltar(self, k: int) -> int:
+        # Avanza la secuencia k iteraciones en O(log k) sin generar los valores intermedios: X_{t+k} = (X_t * a^k) mod m.
+        # Con k negativo retrocede, porque 'a' tiene inverso módulo m cuando m es primo.
+        self._X = (self._X * pow(self.a, k, self.m)) % self.m  # pow calcula a^k mod m por exponenciación binaria.
+        return self._X  # Retorna el nuevo valor actual de la secuencia.
+
+    def posicion(self, k: int) -> int:
+        # Coloca la secuencia en la iteración k contada desde la semilla: X_k = (X0 * a^k) mod m.
+        self._X = (self.X0 * pow(self.a, k, self.m)) % self.m  # Se parte de X0, sin importar el valor actual.
+        return self._X  # Retorna el valor X_k, que será la base de la siguiente iteración.
+
+    def subflujos(self, n: int, modo: str = "bloques", longitud: Optional[int] = None) -> List["GCM_Primos"]:
+        # Crea n generadores independientes que recorren partes disjuntas de esta secuencia (ver subflujos_gcm).
+        semillas, _ = subflujos_gcm(self.a, self.m, self.X0, n, modo, longitud)  # Semilla y multiplicador de cada subflujo.
+        return [GCM_Primos(m=self.m, X0=semilla, a=multiplicador) for semilla, multiplicador in semillas]
+
+    def imprimir_ultimas_iteraciones(self, n: int) -> None:
+        # Imprime las últimas n iteraciones del período saltando directamente a la iteración (periodo - n).
+        print(f"=== Últimas {n} iteraciones del GCM ===")  # Encabezado para la sección de iteraciones.
+        corte = self.periodo - n  # Iteración a partir de la cual se imprime.
+        self.posicion(corte)  # Salta a X_{corte} en O(log corte).
+        for i in range(1, n + 1):  # Recorre las últimas n iteraciones.
+            xi = self._siguiente_valor_xn(self._X)  # Calcula X_{corte+i}.
+            self._X = xi  # Actualiza el valor actual de la secuencia.
+            print(f"Iteración = {corte + i} | Núm. uniforme = {xi/self.m:.5f}")  # Muestra la iteración y su número uniforme.
+        print(f"¿La semilla X0 reaparece en la iteración {self.periodo}?: {'Sí' if self._X == self.X0 else 'No'}")  # Verifica el cierre del período.
+        print()  # Línea en blanco para mejor legibilidad.
+
     def imprimir_todas_iteraciones(self) -> None:
         # Imprime todas las iteraciones del generador con su número uniforme correspondiente.
         print(f"=== Todas las iteraciones del GCM ===")  # Encabezado para la sección de iteraciones.
@@ -58,43 +458,157 @@ class GCM_Primos:
         print(f"¿Se usaron todos los números?: {'Sí' if len(numeros_generados) == 32057 else 'No'}")  # Verifica si se usaron todos los números.
 
     def _factorizar_n(self, n: int) -> List[int]:
-        # Factoriza un número n en sus factores primos únicos usando el método de división por prueba.
-        factores = []  # Lista para almacenar los factores primos únicos.
-        num = n  # Copia del número a factorizar.
+        # Factoriza un número n en sus factores primos únicos con Miller–Rabin y rho de Pollard–Brent (ver factorizar_n).
+        return factorizar_n(n)  # Usa la función del módulo, compartida con el cálculo del período.
 
-        if num % 2 == 0:  # Verifica si el número es divisible por 2.
-            factores.append(2)  # Agrega 2 como factor primo.
-            while num % 2 == 0:  # Divide por 2 hasta que no sea divisible.
-                num //= 2  # División entera por 2.
-
-        factor = 3  # Comienza con el siguiente número primo (3).
-        while factor * factor <= num:  # Itera hasta la raíz cuadrada del número.
-            if num % factor == 0:  # Verifica si el número es divisible por el factor actual.
-                factores.append(factor)  # Agrega el factor a la lista.
-                while num % factor == 0:  # Divide por el factor hasta que no sea divisible.
-                    num //= factor  # División entera por el factor.
-            factor += 2  # Avanza al siguiente número impar.
-
-        if num > 1:  # Si queda un residuo mayor que 1, es un factor primo.
-            factores.append(num)  # Agrega el último factor primo.
-
-        return factores  # Retorna la lista de factores primos únicos.
+    def calcular_periodo(self) -> int:
+        # Calcula el período real del generador sin guardar la secuencia: de forma analítica si m es primo y con Brent si no.
+        return ciclo_gcm(self.a, self.m, self.X0)[1]  # Solo interesa la longitud del ciclo.
 
     def _generar_raiz_primitiva_aleatoria(self, m: int) -> int:
-        # Encuentra una raíz primitiva módulo m mediante prueba aleatoria de candidatos.
+        # Encuentra una raíz primitiva módulo m mediante prueba aleatoria de candidatos; funciona para cualquier m primo.
         phi = m - 1  # Calcula φ(m) = m-1 (porque m es primo).
-        factores = self._factorizar_n(phi)  # Factoriza φ(m) en sus factores primos únicos.
-
-        while True:  # Ciclo infinito hasta encontrar una raíz primitiva.
+        factores = self._factorizar_n(phi)  # Factores primos únicos de φ(m), guardados en caché por factorizar_n.
+        while True:  # Ciclo hasta encontrar una raíz primitiva.
             candidato = random.randint(2, m - 1)  # Genera un candidato aleatorio entre 2 y m-1.
-            es_raiz = True  # Bandera para verificar si el candidato es raíz primitiva.
-            for f in factores:  # Itera sobre los factores primos de φ(m).
-                if pow(candidato, phi // f, m) == 1:  # Verifica si el candidato^(φ/f) mod m = 1.
-                    es_raiz = False  # Si se cumple, el candidato no es raíz primitiva.
-                    break  # Termina la verificación para este candidato.
-            if es_raiz:  # Si el candidato es raíz primitiva.
+            if all(pow(candidato, phi // f, m) != 1 for f in factores):  # Raíz primitiva si ningún candidato^(φ/f) es 1.
                 return candidato  # Retorna la raíz primitiva encontrada.
 
+class FlujoGCM:
+    # Consume una secuencia de estados del GCM con un cursor, sin copiar ni desplazar la lista en cada número.
+    # Al agotarse el segmento actual se aplica el comportamiento indicado en 'al_terminar':
+    #   "error"     → lanza ValueError.
+    #   "reiniciar" → vuelve al inicio del mismo segmento.
+    #   "continuar" → pide al generador un segmento nuevo, opcionalmente después de saltar 'salto' iteraciones.
+    MODOS = ("error", "reiniciar", "continuar")  # Comportamientos válidos al terminar el segmento.
+
+    def __init__(self, estados=None, m: Optional[int] = None, al_terminar: str = "error",
+                 generador=None, salto: int = 0, tamano_segmento: int = 65536):
+        # Constructor del flujo a partir de estados ya generados (arreglo o PeriodoGCM) o, si no se dan, de bloques del generador.
+        if al_terminar not in self.MODOS:  # Verifica que el comportamiento sea uno de los permitidos.
+            raise ValueError(f"El comportamiento al terminar debe ser uno de {self.MODOS}")
+        if al_terminar == "continuar" and generador is None:  # Para continuar se necesita un generador.
+            raise ValueError("Para continuar después del período se necesita un generador")
+        if estados is None and generador is None:  # Sin estados ni generador no hay de dónde tomar números.
+            raise ValueError("Se necesitan los estados del período o un generador")
+        if m is None:  # Si no se indica el módulo se toma del período compacto o del generador.
+            m = estados.m if isinstance(estados, PeriodoGCM) else generador.m
+        self.m = m  # Módulo para convertir los estados en uniformes.
+        self.al_terminar = al_terminar  # Comportamiento al agotar el segmento.
+        self.generador = generador  # Generador usado para producir segmentos nuevos.
+        self.salto = salto  # Iteraciones a saltar antes de cada segmento nuevo.
+        self.tamano_segmento = tamano_segmento  # Tamaño de los segmentos pedidos al generador.
+        self.consumidos = 0  # Total de números entregados por el flujo.
+        if estados is None:  # Si no hay estados, el primer segmento se pide al generador.
+            estados = generador.generar_estados(tamano_segmento)
+        self._cargar_segmento(estados)  # Prepara el primer segmento.
+
+    def _cargar_segmento(self, estados) -> None:
+        # Convierte los estados a uniformes una sola vez y coloca el cursor al inicio.
+        if isinstance(estados, PeriodoGCM):  # Un período compacto ya tiene su vista flotante calculada o por calcular.
+            self._uniformes = estados.uniformes
+        else:
+            self._uniformes = np.asarray(estados) / self.m  # Todos los uniformes del segmento en un arreglo.
+            self._uniformes.flags.writeable = False  # Las vistas entregadas por tomar() no pueden modificar el segmento.
+        self._indice = 0  # Cursor: posición del siguiente número a entregar.
+
+    def _fin_de_segmento(self) -> None:
+        # Aplica el comportamiento configurado cuando ya no quedan números en el segmento actual.
+        if self.al_terminar == "error":  # Se prefiere un error explícito a reutilizar números en silencio.
+            raise ValueError(f"Se agotó el período del GCM después de {self.consumidos} números")
+        if self.al_terminar == "reiniciar":  # Se vuelve a recorrer el mismo segmento.
+            self._indice = 0
+            return
+        if self.salto:  # Antes del segmento nuevo se salta en O(log salto).
+            self.generador.saltar(self.salto)
+        self._cargar_segmento(self.generador.generar_estados(max(len(self._uniformes), 1)))  # Segmento del mismo tamaño.
+
+    @property
+    def restantes(self) -> int:
+        # Números que quedan en el segmento actual antes de aplicar el comportamiento de fin.
+        return len(self._uniformes) - self._indice
+
+    def siguiente(self) -> float:
+        # Devuelve el siguiente número uniforme y avanza el cursor en O(1).
+        if self._indice >= len(self._uniformes):  # Si se agotó el segmento.
+            self._fin_de_segmento()
+        numero = float(self._uniformes[self._indice])  # Número uniforme en la posición del cursor.
+        self._indice += 1  # Avanza el cursor.
+        self.consumidos += 1  # Cuenta el número entregado.
+        return numero
+
+    def tomar(self, n: int) -> np.ndarray:
+        # Devuelve los siguientes n números uniformes; si caben en el segmento actual es una vista sin copia.
+        if self.al_terminar == "error" and n > self.restantes:  # Se revisa antes de consumir para no perder números.
+            raise ValueError(f"Se pidieron {n} números pero solo quedan {self.restantes} en el período del GCM")
+        if n <= self.restantes:  # Camino rápido: una rebanada del arreglo, sin copiar.
+            vista = self._uniformes[self._indice:self._indice + n]
+            self._indice += n
+            self.consumidos += n
+            return vista
+        partes = []  # Si el pedido cruza el fin del segmento se juntan varias rebanadas.
+        faltan = n  # Números que faltan por entregar.
+        while faltan > 0:
+            if self._indice >= len(self._uniformes):  # Se aplica el comportamiento de fin de segmento.
+                self._fin_de_segmento()
+            cantidad = min(faltan, self.restantes)  # Lo que se puede tomar del segmento actual.
+            partes.append(self._uniformes[self._indice:self._indice + cantidad])
+            self._indice += cantidad
+            faltan -= cantidad
+        self.consumidos += n
+        return np.concatenate(partes)  # Única copia: la unión de las rebanadas.
+
+class GCM_Combinado:
+    # Generador combinado estilo Wichmann–Hill / L'Ecuyer: U = (X1/m1 + X2/m2 + ... + Xk/mk) mod 1.
+    # Cada componente es un GCM_Primos con módulo primo distinto; el período es el mcm de los órdenes de los
+    # componentes (~2.6·10^28 con los siete de MODULOS_PRIMOS), muy por debajo del producto de los módulos porque cada m-1 es par.
+
+    def __init__(self, componentes: Optional[List[GCM_Primos]] = None, semilla: int = 20855,
+                 modulos: Tuple[int, ...] = MODULOS_PRIMOS):
+        # Constructor a partir de componentes ya creados o, si no se dan, de los módulos con semilla y raíces reproducibles.
+        if componentes is None:
+            aleatorio = random.Random(semilla)  # Fuente local: los mismos parámetros con la misma semilla.
+            componentes = []
+            for m in modulos:
+                factores = factorizar_n(m - 1)  # Factores de φ(m) para verificar las raíces primitivas.
+                a = aleatorio.randint(2, m - 1)  # Candidato a multiplicador.
+                while orden_multiplicativo(a, m, factores) != m - 1:  # Se busca una raíz primitiva (período m-1).
+                    a = aleatorio.randint(2, m - 1)
+                componentes.append(GCM_Primos(m=m, X0=semilla % (m - 1) + 1, a=a))  # Semilla en [1, m-1].
+        if len({c.m for c in componentes}) != len(componentes):  # Con módulos repetidos el período no crece.
+            raise ValueError("Los componentes del generador combinado deben tener módulos distintos")
+        self.componentes = componentes  # Generadores que se suman módulo 1.
+
+    @property
+    def periodo(self) -> int:
+        # Período del generador combinado: mcm de los períodos de los componentes.
+        periodo = 1
+        for c in self.componentes:
+            _, periodo_c = ciclo_gcm(c.a, c.m, c.X0)  # Período del componente (orden de su multiplicador).
+            periodo = periodo * periodo_c // math.gcd(periodo, periodo_c)  # mcm acumulado.
+        return periodo
+
+    def generar_numero_aleatorio(self) -> float:
+        # Devuelve el siguiente número uniforme en [0,1) sumando los uniformes de todos los componentes.
+        return sum(c.generar_numero_aleatorio() for c in self.componentes) % 1.0
+
+    def generar_bloque(self, n: int) -> np.ndarray:
+        # Devuelve n números uniformes en [0,1) como arreglo; cada componente genera su bloque vectorizado.
+        total = np.zeros(n)  # Suma de los uniformes de los componentes.
+        for c in self.componentes:
+            total += c.generar_bloque(n)
+        return np.mod(total, 1.0, out=total)  # Parte fraccionaria, sin crear otro arreglo.
+
+    def saltar(self, k: int) -> None:
+        # Avanza k iteraciones en O(log k): cada componente salta por separado.
+        for c in self.componentes:
+            c.saltar(k)
+
+    def posicion(self, k: int) -> None:
+        # Coloca todos los componentes en la iteración k contada desde sus semillas.
+        for c in self.componentes:
+            c.posicion(k)
+
 if __name__ == "__main__":
     generador = GCM_Primos()  # Crea una instancia del generador con parámetros por defecto.
     generador.imprimir_parametros()  # Muestra los parámetros del generador.
@@ -0,0 +1,142 @@
+import math  # Importa math para raíces y redondeos.
+import random  # Importa random para tomar muestras de candidatos.
+from concurrent.futures import ProcessPoolExecutor  # Importa el grupo de procesos para repartir los candidatos.
+from typing import Dict, Iterable, List, Optional, Tuple  # Importa tipos para diccionarios, iterables y listas.
+from GCM_ParametrosDefinidos import raices_primitivas  # Candidatos con período completo para un módulo primo.
+
+# Constante de Hermite elevada a la t: γ_t^t para t = 2..8. La red dual de cualquier (a, m) en dimensión t
+# tiene un vector más corto de longitud a lo más γ_t^(1/2) * m^(1/t); la prueba se normaliza contra esa cota.
+HERMITE_POTENCIA = {2: 4 / 3, 3: 2, 4: 4, 5: 8, 6: 64 / 3, 7: 64, 8: 256}
+
+def base_red_dual(a: int, m: int, t: int) -> List[List[int]]:
+    # Base de la red dual en dimensión t: los vectores x con x1 + a*x2 + ... + a^(t-1)*xt ≡ 0 (mod m).
+    base = [[m] + [0] * (t - 1)]  # (m, 0, ..., 0).
+    for i in range(1, t):  # (-a^i mod m, 0, ..., 1, ..., 0) con el 1 en la posición i.
+        fila = [0] * t
+        fila[0] = -pow(a, i, m)
+        fila[i] = 1
+        base.append(fila)
+    return base
+
+def _gram_schmidt(base: List[List[int]]) -> Tuple[List[List[float]], List[float]]:
+    # Coeficientes mu[i][j] y normas al cuadrado B[i] de la ortogonalización de Gram–Schmidt.
+    n = len(base)
+    ortogonales, mu, B = [], [[0.0] * n for _ in range(n)], []
+    for i in range(n):
+        v = [float(x) for x in base[i]]
+        for j in range(i):
+            mu[i][j] = sum(x * y for x, y in zip(base[i], ortogonales[j])) / B[j]
+            v = [x - mu[i][j] * y for x, y in zip(v, ortogonales[j])]
+        ortogonales.append(v)
+        B.append(sum(x * x for x in v))
+    return mu, B
+
+def reducir_lll(base: List[List[int]], delta: float = 0.99) -> List[List[int]]:
+    # Reducción LLL de una base entera (aritmética exacta en los vectores, flotante en Gram–Schmidt).
+    b = [list(v) for v in base]
+    mu, B = _gram_schmidt(b)
+    k = 1
+    while k < len(b):
+        for j in range(k - 1, -1, -1):  # Reducción de tamaño de b_k contra los anteriores.
+            q = round(mu[k][j])
+            if q:
+                b[k] = [x - q * y for x, y in zip(b[k], b[j])]
+                for i in range(j):
+                    mu[k][i] -= q * mu[j][i]
+                mu[k][j] -= q
+        if B[k] >= (delta - mu[k][k - 1] ** 2) * B[k - 1]:  # Condición de Lovász: se avanza.
+            k += 1
+        else:  # Se intercambian b_k y b_{k-1} y se recalcula la ortogonalización.
+            b[k], b[k - 1] = b[k - 1], b[k]
+            mu, B = _gram_schmidt(b)
+            k = max(k - 1, 1)
+    return b
+
+def vector_mas_corto(base: List[List[int]]) -> Tuple[int, List[int]]:
+    # Vector no nulo más corto de la red (norma al cuadrado exacta y vector), por enumeración de Fincke–Pohst
+    # sobre la base ya reducida con LLL.
+    b = reducir_lll(base)
+    mu, B = _gram_schmidt(b)
+    n = len(b)
+    mejor = min((sum(x * x for x in v), v) for v in b)  # Cota inicial: el vector más corto de la base reducida.
+    mejor = [mejor[0], mejor[1]]
+    x = [0] * n  # Coeficientes de la combinación que se está explorando.
+
+    def enumerar(i: int, parcial: float) -> None:
+        # Recorre los valores de x_i compatibles con la cota, de la última coordenada a la primera.
+        centro = -sum(x[j] * mu[j][i] for j in range(i + 1, n))
+        radio = math.sqrt(max(mejor[0] * (1 + 1e-9) - parcial, 0.0) / B[i])
+        for xi in range(math.ceil(centro - radio), math.floor(centro + radio) + 1):
+            suma = parcial + (xi - centro) ** 2 * B[i]
+            if suma > mejor[0] * (1 + 1e-9):  # La cota pudo bajar dentro de este mismo ciclo.
+                continue
+            x[i] = xi
+            if i > 0:
+                enumerar(i - 1, suma)
+            elif any(x):  # Combinación completa y no nula: se evalúa en aritmética exacta.
+                v = [sum(x[k] * b[k][c] for k in range(n)) for c in range(n)]
+                norma = sum(c * c for c in v)
+                if norma < mejor[0]:
+                    mejor[0], mejor[1] = norma, v
+        x[i] = 0
+
+    enumerar(n - 1, 0.0)
+    return mejor[0], mejor[1]
+
+def prueba_espectral(a: int, m: int, dimensiones: Iterable[int] = range(2, 9)) -> Dict[int, float]:
+    # Figura de mérito S_t = ν_t / (γ_t^(1/2) m^(1/t)) en cada dimensión t; 1 es la red ideal y valores cercanos a 0
+    # indican que las t-tuplas consecutivas caen en pocos hiperplanos.
+    resultado = {}
+    for t in dimensiones:
+        norma, _ = vector_mas_corto(base_red_dual(a, m, t))  # ν_t^2.
+        cota = math.sqrt(HERMITE_POTENCIA[t] ** (1 / t)) * m ** (1 / t)  # γ_t^(1/2) m^(1/t).
+        resultado[t] = math.sqrt(norma) / cota
+    return resultado
+
+def _evaluar(argumentos: Tuple[int, int, Tuple[int, ...]]) -> Tuple[int, Dict[int, float]]:
+    # Evalúa un candidato; función de módulo para que el grupo de procesos la pueda enviar a los trabajadores.
+    a, m, dimensiones = argumentos
+    return a, prueba_espectral(a, m, dimensiones)
+
+def clasificar_multiplicadores(m: int, candidatos: Optional[Iterable[int]] = None,
+                               dimensiones: Iterable[int] = range(2, 9),
+                               procesos: Optional[int] = None) -> List[Tuple[int, float, Dict[int, float]]]:
+    # Aplica la prueba espectral a muchos multiplicadores en paralelo y los ordena de mejor a peor según min_t S_t.
+    # Por omisión se evalúan todas las raíces primitivas de m. Retorna [(a, min S_t, {t: S_t}), ...].
+    candidatos = [int(a) for a in (raices_primitivas(m) if candidatos is None else candidatos)]
+    dimensiones = tuple(dimensiones)
+    tareas = [(a, m, dimensiones) for a in candidatos]
+    if procesos == 1:  # Sin procesos: útil para depurar o para pocos candidatos.
+        evaluados = map(_evaluar, tareas)
+        resultados = list(evaluados)
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as grupo:  # Los candidatos se envían en lotes grandes.
+            resultados = list(grupo.map(_evaluar, tareas, chunksize=max(1, len(tareas) // 64)))
+    tabla = [(a, min(figuras.values()), figuras) for a, figuras in resultados]
+    tabla.sort(key=lambda fila: fila[1], reverse=True)
+    return tabla
+
+def imprimir_tabla(tabla: List[Tuple[int, float, Dict[int, float]]], n: int = 10) -> None:
+    # Muestra los n mejores multiplicadores con su figura de mérito en cada dimensión.
+    dimensiones = sorted(tabla[0][2]) if tabla else []
+    encabezado = "Lugar | a      | " + " | ".join(f"S{t}   " for t in dimensiones) + " | Mín."
+    print(encabezado)
+    print("-" * len(encabezado))
+    for lugar, (a, minimo, figuras) in enumerate(tabla[:n], start=1):
+        print(f"{lugar:5} | {a:<6} | " + " | ".join(f"{figuras[t]:.3f}" for t in dimensiones) + f" | {minimo:.3f}")
+
+if __name__ == "__main__":
+    m = 32057  # Módulo de las aplicaciones.
+    figuras = prueba_espectral(9600, m)  # Multiplicador usado en las aplicaciones.
+    print(f"=== Prueba espectral de a = 9600, m = {m} ===")
+    for t, s in figuras.items():
+        print(f"S{t} = {s:.4f}")
+    print(f"Mínimo: {min(figuras.values()):.4f}")
+    print()
+
+    muestra = random.Random(m).sample(list(raices_primitivas(m)), 500)  # Muestra reproducible de raíces primitivas.
+    tabla = clasificar_multiplicadores(m, muestra + [9600])
+    print(f"=== Mejores multiplicadores entre {len(muestra)} raíces primitivas de {m} ===")
+    imprimir_tabla(tabla)
+    lugar = next(i for i, fila in enumerate(tabla, start=1) if fila[0] == 9600)
+    print(f"\nLugar de a = 9600: {lugar} de {len(tabla)}")
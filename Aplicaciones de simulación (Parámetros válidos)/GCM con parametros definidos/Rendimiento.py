@@ -0,0 +1,189 @@
+import argparse  # Importa argparse para las opciones de la línea de comandos.
+import json  # Importa json para guardar y leer la línea base.
+import os  # Importa os para revisar si ya existe el archivo de la línea base.
+import platform  # Importa platform para registrar la máquina en la que se midió.
+import random  # Importa random para elegir las distancias de los saltos.
+import sys  # Importa sys para la versión de Python y el código de salida.
+import time  # Importa time para medir con perf_counter.
+from datetime import datetime  # Importa datetime para fechar cada corrida.
+from typing import Callable, Dict, List, Optional, Tuple  # Importa tipos para funciones, diccionarios y listas.
+import numpy as np  # Importa numpy para registrar su versión.
+from GCM_ParametrosDefinidos import FlujoGCM, GCM_Primos  # Generador y flujo con cursor que se miden.
+
+# Módulos medidos, con un multiplicador de período completo para cada uno: el de las aplicaciones, uno de 20 bits,
+# el estándar mínimo de Park–Miller (2^31-1) y uno de 61 bits que obliga a usar la multiplicación de 128 bits.
+CONFIGURACIONES = ((32057, 9600), (1000003, 2), (2147483647, 16807), ((1 << 61) - 1, 437799614237992725))
+TAMANOS_BLOQUE = (64, 1024, 16384, 65536)  # Tamaños de bloque para generar_bloque.
+LIMITE_PERIODO = 1 << 21  # El período completo solo se materializa si cabe holgado en memoria.
+LLAMADAS_POR_RONDA = 1000  # Llamadas escalares por ronda, para que el costo de medir no pese.
+TOLERANCIA = 0.15  # Un camino más lento que la corrida anterior en más de este porcentaje es una regresión.
+ARCHIVO_LINEA_BASE = "rendimiento_gcm.json"  # Archivo donde se acumulan las corridas.
+
+def medir(ronda: Callable[[], int], repeticiones: int = 5, minimo: float = 0.05) -> float:
+    # Nanosegundos por número de una operación. ronda() hace una parte del trabajo y retorna cuántos números produjo;
+    # cada repetición llama a ronda() hasta durar al menos 'minimo' segundos y se reporta la repetición más rápida,
+    # que es la menos afectada por otros procesos de la máquina.
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        numeros, inicio = 0, time.perf_counter()
+        while True:
+            numeros += ronda()
+            transcurrido = time.perf_counter() - inicio
+            if transcurrido >= minimo:
+                break
+        mejor = min(mejor, transcurrido * 1e9 / numeros)
+    return mejor
+
+def _ronda_escalar(generador: GCM_Primos) -> Callable[[], int]:
+    # generar_numero_aleatorio llamado una vez por número, como el generar_numero de las aplicaciones.
+    def ronda() -> int:
+        for _ in range(LLAMADAS_POR_RONDA):
+            generador.generar_numero_aleatorio()
+        return LLAMADAS_POR_RONDA
+    return ronda
+
+def _ronda_lista_pop(uniformes: List[float]) -> Callable[[], int]:
+    # Referencia del esquema anterior de las aplicaciones: lista.pop(0) sobre el período completo, que desplaza toda
+    # la lista en cada número. El número se vuelve a agregar al final para que la lista no cambie de tamaño.
+    lista = list(uniformes)
+    def ronda() -> int:
+        for _ in range(LLAMADAS_POR_RONDA):
+            lista.append(lista.pop(0))
+        return LLAMADAS_POR_RONDA
+    return ronda
+
+def _ronda_cursor(flujo: FlujoGCM) -> Callable[[], int]:
+    # FlujoGCM.siguiente, el reemplazo de pop(0) que usan ahora las aplicaciones.
+    def ronda() -> int:
+        for _ in range(LLAMADAS_POR_RONDA):
+            flujo.siguiente()
+        return LLAMADAS_POR_RONDA
+    return ronda
+
+def _ronda_bloque(generador: GCM_Primos, tamano: int) -> Callable[[], int]:
+    # Un bloque vectorizado de 'tamano' números.
+    def ronda() -> int:
+        generador.generar_bloque(tamano)
+        return tamano
+    return ronda
+
+def _ronda_salto(generador: GCM_Primos, m: int) -> Callable[[], int]:
+    # Saltos de longitud aleatoria en O(log k); aquí "número" significa un salto completo.
+    aleatorio = random.Random(m)  # Mismas distancias en todas las corridas.
+    distancias = [aleatorio.randrange(1, m - 1) for _ in range(LLAMADAS_POR_RONDA)]
+    def ronda() -> int:
+        for k in distancias:
+            generador.saltar(k)
+        return LLAMADAS_POR_RONDA
+    return ronda
+
+def _ronda_periodo(generador: GCM_Primos) -> Callable[[], int]:
+    # El período completo, incluida su vista en flotantes, como lo construyen las aplicaciones.
+    def ronda() -> int:
+        return len(generador.generar_periodo().uniformes)
+    return ronda
+
+def casos(configuraciones=CONFIGURACIONES, tamanos=TAMANOS_BLOQUE) -> List[Tuple[str, int, Optional[int], Callable[[], int]]]:
+    # Lista de (camino, m, tamaño de bloque o None, ronda) para todas las combinaciones que se miden.
+    lista = []
+    for m, a in configuraciones:
+        generador = GCM_Primos(m=m, X0=20855 % m, a=a)
+        lista.append(("escalar", m, None, _ronda_escalar(generador)))
+        if m - 1 <= LIMITE_PERIODO:  # Los caminos que recorren el período completo solo para módulos chicos.
+            periodo = generador.generar_periodo()
+            lista.append(("lista_pop", m, None, _ronda_lista_pop(periodo.uniformes.tolist())))
+            lista.append(("cursor", m, None, _ronda_cursor(FlujoGCM(periodo, al_terminar="reiniciar"))))
+            lista.append(("periodo", m, None, _ronda_periodo(GCM_Primos(m=m, X0=generador.X0, a=a))))
+        else:  # Para los grandes el flujo avanza por segmentos pedidos al generador.
+            lista.append(("cursor", m, None, _ronda_cursor(FlujoGCM(al_terminar="continuar", generador=generador))))
+        for tamano in tamanos:
+            lista.append(("bloque", m, tamano, _ronda_bloque(GCM_Primos(m=m, X0=generador.X0, a=a), tamano)))
+        lista.append(("salto", m, None, _ronda_salto(GCM_Primos(m=m, X0=generador.X0, a=a), m)))
+    return lista
+
+def clave(camino: str, m: int, tamano: Optional[int]) -> str:
+    # Identificador de un caso en el archivo JSON, estable entre corridas.
+    return f"{camino}/m={m}" + (f"/n={tamano}" if tamano is not None else "")
+
+def ejecutar(repeticiones: int = 5, minimo: float = 0.05, configuraciones=CONFIGURACIONES,
+             tamanos=TAMANOS_BLOQUE) -> Dict:
+    # Mide todos los casos y retorna la corrida con su fecha, el entorno y los resultados por clave.
+    resultados = {}
+    for camino, m, tamano, ronda in casos(configuraciones, tamanos):
+        ns = medir(ronda, repeticiones, minimo)
+        resultados[clave(camino, m, tamano)] = {"camino": camino, "m": m, "tamano_bloque": tamano,
+                                                "ns_por_numero": ns, "numeros_por_segundo": 1e9 / ns}
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "entorno": {"python": sys.version.split()[0], "numpy": np.__version__,
+                    "maquina": platform.machine(), "sistema": platform.platform()},
+        "resultados": resultados,
+    }
+
+def leer_corridas(ruta: str) -> List[Dict]:
+    # Corridas guardadas en el archivo de la línea base, de la más antigua a la más reciente.
+    if not os.path.exists(ruta):
+        return []
+    with open(ruta, encoding="utf-8") as archivo:
+        return json.load(archivo)["corridas"]
+
+def guardar_corrida(corrida: Dict, ruta: str) -> None:
+    # Agrega la corrida al historial del archivo de la línea base.
+    corridas = leer_corridas(ruta) + [corrida]
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump({"corridas": corridas}, archivo, indent=2, ensure_ascii=False)
+
+def comparar(actual: Dict, anterior: Dict, tolerancia: float = TOLERANCIA) -> List[Tuple[str, float, float, float]]:
+    # Cambio relativo de ns por número de cada caso presente en ambas corridas: (clave, antes, ahora, cambio);
+    # un cambio positivo significa que el camino se volvió más lento.
+    cambios = []
+    for nombre, resultado in actual["resultados"].items():
+        if nombre in anterior["resultados"]:
+            antes, ahora = anterior["resultados"][nombre]["ns_por_numero"], resultado["ns_por_numero"]
+            cambios.append((nombre, antes, ahora, ahora / antes - 1))
+    return cambios
+
+def imprimir_corrida(corrida: Dict) -> None:
+    # Tabla de la corrida actual.
+    print(f"=== Rendimiento de los generadores ({corrida['fecha']}) ===")
+    print(f"{'Caso':<38} | {'ns/número':>12} | {'números/s':>14}")
+    print("-" * 70)
+    for nombre, resultado in corrida["resultados"].items():
+        print(f"{nombre:<38} | {resultado['ns_por_numero']:>12.2f} | {resultado['numeros_por_segundo']:>14,.0f}")
+
+def imprimir_comparacion(cambios: List[Tuple[str, float, float, float]], tolerancia: float = TOLERANCIA) -> int:
+    # Tabla de cambios contra la corrida anterior; retorna cuántas regresiones hubo.
+    print(f"\n=== Comparación con la corrida anterior (tolerancia {tolerancia:.0%}) ===")
+    print(f"{'Caso':<38} | {'antes':>10} | {'ahora':>10} | {'cambio':>8}")
+    print("-" * 76)
+    regresiones = 0
+    for nombre, antes, ahora, cambio in cambios:
+        marca = ""
+        if cambio > tolerancia:
+            marca = "  REGRESIÓN"
+            regresiones += 1
+        elif cambio < -tolerancia:
+            marca = "  mejora"
+        print(f"{nombre:<38} | {antes:>10.2f} | {ahora:>10.2f} | {cambio:>+8.1%}{marca}")
+    print(f"\nRegresiones: {regresiones} de {len(cambios)} casos")
+    return regresiones
+
+if __name__ == "__main__":
+    opciones = argparse.ArgumentParser(description="Mide cuántos números por segundo produce cada camino del GCM.")
+    opciones.add_argument("--archivo", default=ARCHIVO_LINEA_BASE, help="archivo JSON con las corridas anteriores")
+    opciones.add_argument("--rapido", action="store_true", help="menos repeticiones, para una revisión rápida")
+    opciones.add_argument("--no-guardar", action="store_true", help="no agrega esta corrida al archivo")
+    opciones.add_argument("--tolerancia", type=float, default=TOLERANCIA, help="cambio relativo que cuenta como regresión")
+    opciones.add_argument("--estricto", action="store_true", help="termina con código 1 si hay regresiones")
+    argumentos = opciones.parse_args()
+
+    anteriores = leer_corridas(argumentos.archivo)
+    corrida = ejecutar(repeticiones=2 if argumentos.rapido else 5, minimo=0.02 if argumentos.rapido else 0.05)
+    imprimir_corrida(corrida)
+    regresiones = 0
+    if anteriores:
+        regresiones = imprimir_comparacion(comparar(corrida, anteriores[-1], argumentos.tolerancia), argumentos.tolerancia)
+    if not argumentos.no_guardar:
+        guardar_corrida(corrida, argumentos.archivo)
+        print(f"\nCorrida guardada en {argumentos.archivo} ({len(anteriores) + 1} en total)")
+    sys.exit(1 if argumentos.estricto and regresiones else 0)
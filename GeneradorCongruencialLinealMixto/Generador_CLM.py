@@ -0,0 +1,135 @@
+import math  # Importa el módulo math para el máximo común divisor.
+import random  # Importa el módulo random para elegir parámetros aleatorios.
+import numpy as np  # Importa numpy para generar bloques con aritmética uint64.
+from typing import List, Optional, Tuple  # Importa tipos para listas, valores opcionales y tuplas.
+
+def factores_primos(n: int) -> List[int]:
+    # Factores primos únicos de n por división de prueba (para m = 2^d termina de inmediato).
+    factores = []  # Lista de factores primos únicos.
+    factor = 2  # Primer candidato.
+    while factor * factor <= n:  # Basta con probar hasta la raíz cuadrada.
+        if n % factor == 0:  # El candidato divide a n.
+            factores.append(factor)
+            while n % factor == 0:  # Se elimina por completo ese factor.
+                n //= factor
+        factor += 1 if factor == 2 else 2  # Después del 2 solo se prueban impares.
+    if n > 1:  # Lo que queda es primo.
+        factores.append(n)
+    return factores
+
+def verificar_hull_dobell(a: int, c: int, m: int) -> List[str]:
+    # Revisa el teorema de Hull–Dobell: X_{n+1} = (a*X_n + c) mod m tiene período m para toda semilla si y solo si
+    #   1) c y m son primos relativos,
+    #   2) a-1 es divisible por todos los factores primos de m,
+    #   3) a-1 es divisible por 4 si m es divisible por 4.
+    # Retorna la lista de condiciones que no se cumplen (vacía si el período es completo).
+    fallas = []  # Condiciones incumplidas.
+    if math.gcd(c, m) != 1:
+        fallas.append(f"c = {c} y m = {m} no son primos relativos")
+    for p in factores_primos(m):
+        if (a - 1) % p != 0:
+            fallas.append(f"a - 1 = {a - 1} no es divisible por el factor primo {p} de m")
+    if m % 4 == 0 and (a - 1) % 4 != 0:
+        fallas.append(f"m es múltiplo de 4 pero a - 1 = {a - 1} no lo es")
+    return fallas
+
+def componer_saltos(a: int, c: int, m: int, k: int) -> Tuple[int, int]:
+    # Coeficientes (A, C) tales que X_{n+k} = (A*X_n + C) mod m, calculados en O(log k) por duplicación.
+    A, C = 1, 0  # Transformación identidad (k = 0).
+    a_pot, c_pot = a % m, c % m  # Transformación de 2^i pasos, empezando con un paso.
+    while k > 0:
+        if k & 1:  # Este bit de k se incluye: primero (A, C) y luego 2^i pasos.
+            A, C = (a_pot * A) % m, (a_pot * C + c_pot) % m
+        a_pot, c_pot = (a_pot * a_pot) % m, (a_pot * c_pot + c_pot) % m  # 2^(i+1) pasos = 2^i pasos dos veces.
+        k >>= 1
+    return A, C
+
+class Generador_CLM:
+    # Generador Congruencial Lineal Mixto X_{n+1} = (a * X_n + c) mod m con m = 2^d (por omisión 2^64).
+    # Los bloques se generan con aritmética uint64 de numpy, cuyo desbordamiento natural es la reducción mod 2^64.
+    TAMANO_BLOQUE = 65536  # Máximo de coeficientes precalculados que se reutilizan en cada bloque.
+
+    def __init__(self, Xo: Optional[int] = None, a: Optional[int] = None, c: Optional[int] = None,
+                 d: int = 64, semilla: Optional[int] = None):
+        # Constructor; los parámetros que no se indiquen se eligen al azar como en Generador_CLM.java.
+        if not 1 <= d <= 64:  # Los estados deben caber en un uint64.
+            raise ValueError("El número de bits d debe estar entre 1 y 64")
+        self.aleatorio = random.Random(semilla)  # Fuente para los parámetros; reproducible si se da una semilla.
+        self.d = d  # Número de bits del módulo.
+        self.m = 1 << d  # Módulo 2^d.
+        self.Xo = Xo % self.m if Xo is not None else self.aleatorio.randrange(self.m)  # Semilla inicial en [0, m-1].
+        self.c = c % self.m if c is not None else self.aleatorio.randrange(self.m) | 1  # Incremento impar.
+        self.a = a % self.m if a is not None else self.generarA()  # Multiplicador.
+        fallas = verificar_hull_dobell(self.a, self.c, self.m)  # El período completo no se supone: se comprueba.
+        if fallas:
+            raise ValueError("Los parámetros no cumplen Hull–Dobell: " + "; ".join(fallas))
+        self.periodo = self.m  # Con Hull–Dobell el período es m para cualquier semilla.
+        self._X = self.Xo  # Valor actual de la secuencia.
+        self._mascara = np.uint64(self.m - 1)  # Reducción mod 2^d para d < 64.
+        self._A = np.empty(0, dtype=np.uint64)  # Coeficientes A_i = a^i mod m de los bloques.
+        self._C = np.empty(0, dtype=np.uint64)  # Coeficientes C_i = c(a^i - 1)/(a - 1) mod m de los bloques.
+
+    def generarA(self) -> int:
+        # Multiplicador impar, no divisible entre 3 ni 5 y con (a - 1) mod 4 = 0, igual que en Generador_CLM.java.
+        while True:
+            a = self.aleatorio.randrange(self.m) | 1  # Número impar menor que m.
+            if a % 3 != 0 and a % 5 != 0 and (a - 1) % 4 == 0:
+                return a
+
+    def imprimir_parametros(self) -> None:
+        # Muestra los parámetros del generador en el mismo formato que el programa de Java.
+        print(f"Xo: {self.Xo}")
+        print(f"a: {self.a}")
+        print(f"c: {self.c}")
+        print(f"m: {self.m}")
+
+    def generar_numero_aleatorio(self) -> float:
+        # Avanza una iteración y devuelve el valor uniforme en [0,1).
+        self._X = (self.a * self._X + self.c) % self.m  # X_{n+1} = (a * X_n + c) mod m.
+        return self._X / self.m
+
+    def _coeficientes(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        # Devuelve (A_i, C_i) para i = 1..n tales que X_{t+i} = A_i * X_t + C_i; se calculan por duplicación.
+        if len(self._A) < n:  # Solo se recalcula si el bloque pedido es más grande que el guardado.
+            A = np.empty(n, dtype=np.uint64)
+            C = np.empty(n, dtype=np.uint64)
+            A[0], C[0] = self.a, self.c  # Un paso.
+            llenos = 1  # Cantidad de coeficientes ya calculados.
+            while llenos < n:  # Paso llenos+i = i pasos después de 'llenos' pasos.
+                copia = min(llenos, n - llenos)
+                A_l, C_l = A[llenos - 1], C[llenos - 1]
+                A[llenos:llenos + copia] = (A[:copia] * A_l) & self._mascara  # Desbordamiento uint64 = mod 2^64.
+                C[llenos:llenos + copia] = (A[:copia] * C_l + C[:copia]) & self._mascara
+                llenos += copia
+            self._A, self._C = A, C  # Se guardan para los siguientes bloques.
+        return self._A[:n], self._C[:n]
+
+    def generar_estados(self, n: int) -> np.ndarray:
+        # Avanza n iteraciones y devuelve los estados X_{t+1}, ..., X_{t+n} como arreglo uint64.
+        estados = np.empty(n, dtype=np.uint64)
+        A, C = self._coeficientes(max(1, min(n, self.TAMANO_BLOQUE)))
+        for inicio in range(0, n, len(A)):  # Recorre el arreglo en bloques del tamaño de los coeficientes.
+            fin = min(inicio + len(A), n)
+            estados[inicio:fin] = (A[:fin - inicio] * np.uint64(self._X) + C[:fin - inicio]) & self._mascara
+            self._X = int(estados[fin - 1])  # El último estado del bloque es la base del siguiente.
+        return estados
+
+    def generar_bloque(self, n: int) -> np.ndarray:
+        # Devuelve n números uniformes en [0,1); se usan los 53 bits altos para que float64 nunca redondee a 1.0.
+        bits = min(self.d, 53)  # Bits de mantisa que se conservan.
+        return (self.generar_estados(n) >> np.uint64(self.d - bits)) * (2.0 ** -bits)
+
+    def saltar(self, k: int) -> int:
+        # Avanza la secuencia k iteraciones en O(log k): X_{t+k} = (A*X_t + C) mod m.
+        A, C = componer_saltos(self.a, self.c, self.m, k % self.m)  # El período es m, así que basta k mod m.
+        self._X = (A * self._X + C) % self.m
+        return self._X
+
+    def posicion(self, k: int) -> int:
+        # Coloca la secuencia en la iteración k contada desde la semilla Xo.
+        self._X = self.Xo
+        return self.saltar(k)
+
+if __name__ == "__main__":
+    generador = Generador_CLM()  # Crea un generador con parámetros aleatorios.
+    generador.imprimir_parametros()  # Muestra los parámetros, como el main de Java.
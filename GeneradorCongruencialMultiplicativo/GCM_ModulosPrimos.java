@@ -180,7 +180,39 @@ public class GCM_ModulosPrimos {
     }
 
     /**
-     * Para este módulo en particular (m, X0, a), avanza la secuencia hasta la iteración (periodo − n),
+     * Calcula directamente el valor de la iteración k contada desde la semilla:
+     *   X_k = (X0 * a^k) mod m
+     * usando exponenciación modular, es decir, en O(log k) en lugar de k pasos.
+     *
+     * @param k Número de iteraciones a saltar desde X0
+     * @return  El valor X_k de la secuencia
+     */
+    public long posicion(long k) {
+        return (X0 * powMod(a, k, m)) % m; // Saltamos k iteraciones de una sola vez
+    }
+
+    /**
+     * Calcula el período real de la secuencia, que para m primo es el orden multiplicativo de 'a':
+     * el menor k que divide a φ(m) = m − 1 tal que a^k mod m = 1.
+     *
+     * Proceso:
+     *  1) Parte de k = φ(m)
+     *  2) Para cada factor primo f de φ(m), divide k entre f mientras a^(k/f) mod m siga siendo 1
+     *
+     * @return El período real (orden de 'a' módulo m)
+     */
+    public long periodoReal() {
+        long orden = periodo;                  // Empezamos con el período teórico φ(m)
+        for (long f : factorizarN(periodo)) {  // Quitamos cada factor primo mientras sea posible
+            while (orden % f == 0 && powMod(a, orden / f, m) == 1) {
+                orden /= f;                    // a^(orden/f) = 1, así que el orden es más pequeño
+            }
+        }
+        return orden;
+    }
+
+    /**
+     * Para este módulo en particular (m, X0, a), salta directamente a la iteración (periodo − n)
      * y luego imprime las últimas n iteraciones junto con su valor uniforme [0,1).
      *
      * @param n Número de iteraciones finales que deseamos imprimir
@@ -188,22 +220,19 @@ public class GCM_ModulosPrimos {
     public void imprimirIteraciones(int n) {
         System.out.println("=== Últimas " + n + " iteraciones para m = " + m + " ===");
 
-        long xi = X0;                  // Iniciamos con la semilla X0
         long corte = periodo - n;      // Calculamos en qué punto debemos empezar a imprimir
 
-        // Avanzamos la secuencia hasta la iteración X_{corte}, comprobando si la semilla reaparece antes
-        for (long i = 1; i <= corte; i++) {
-            xi = siguienteValorXn(xi); // Calculamos X_i = (a * X_{i−1}) mod m
-
-            // Si en algún punto regresamos a X0, el período es menor de lo teórico
-            if (xi == X0) {
-                System.out.println("Semilla X0 reapareció en iteración " + i + ", período incompleto. Período = " + i);
-                System.out.println();
-                return; // Salimos porque ya no tiene sentido imprimir las últimas n
-            }
+        // X0 reaparece por primera vez en la iteración periodoReal(); solo se aborta si eso ocurre a más tardar en X_{corte}
+        long periodoReal = periodoReal();
+        if (periodoReal <= corte) {
+            System.out.println("Semilla X0 reapareció en iteración " + periodoReal + ", período incompleto. Período = " + periodoReal);
+            System.out.println();
+            return; // Salimos porque ya no tiene sentido imprimir las últimas n
         }
 
-        // Si llegamos aquí, la semilla no reapareció antes de X_{corte}. Imprimimos las últimas n iteraciones:
+        long xi = posicion(corte);     // Saltamos directamente a X_{corte} en O(log corte)
+
+        // Imprimimos las últimas n iteraciones:
         for (int i = 1; i <= n; i++) {
             xi = siguienteValorXn(xi);               // Calculamos X_{corte+i}
             double uniforme = xi / (double) m;        // Convertimos Xi a número uniforme en [0,1)
@@ -0,0 +1,148 @@
+# Importamos importlib para cargar cada prueba desde su carpeta (los nombres de las carpetas tienen espacios).
+import importlib.util
+# Importamos os para construir las rutas de los módulos de las pruebas.
+import os
+# Importamos numpy para la muestra compartida y su validación vectorizada.
+import numpy as np
+# Importamos el grupo de procesos para ejecutar las pruebas en paralelo.
+from concurrent.futures import ProcessPoolExecutor
+# Importamos herramientas para definir los tipos de datos que usaremos.
+from typing import Dict, Iterable, Optional, Union
+# Importamos la muestra compartida, que guarda la vista ordenada, los conteos y los resultados para todas las pruebas.
+from MuestraUniforme import MuestraUniforme
+
+# Carpeta y módulo de cada prueba, en el orden en que se ejecutan.
+PRUEBAS = {
+    "frecuencias": ("Prueba de las Frecuencias", "PruebaFrecuencias"),
+    "promedios": ("Prueba de los Promedios", "PruebaPromedios"),
+    "series": ("Prueba de Series", "PruebaSeries"),
+    "kolmogorov_smirnov": ("Prueba de Kolmogorov Smirnov", "PruebaKolmogorovSmirnov"),
+    "poker": ("Prueba del Poker", "PruebaPoker"),
+}
+
+_MODULOS = {}  # Módulos ya cargados, para no ejecutar cada archivo más de una vez por proceso.
+_MUESTRA = None  # Muestra compartida de un proceso trabajador; se recibe una sola vez al crear el proceso.
+
+def cargar_modulo(nombre: str):
+    # Carga el módulo de una prueba a partir de su ruta y lo guarda para las siguientes llamadas.
+    if nombre not in _MODULOS:
+        carpeta, modulo = PRUEBAS[nombre]
+        ruta = os.path.join(os.path.dirname(os.path.abspath(__file__)), carpeta, modulo + ".py")
+        especificacion = importlib.util.spec_from_file_location(modulo, ruta)
+        _MODULOS[nombre] = importlib.util.module_from_spec(especificacion)
+        especificacion.loader.exec_module(_MODULOS[nombre])
+    return _MODULOS[nombre]
+
+def validar_muestra(numeros) -> MuestraUniforme:
+    # Convierte la muestra en un arreglo float64 de solo lectura y la valida una sola vez para todas las pruebas.
+    if isinstance(numeros, MuestraUniforme):
+        numeros.validar()  # Si ya se había validado, la revisión de rango está guardada.
+        return numeros
+    return MuestraUniforme(numeros)
+
+def obtener_muestra(m: int = 32057, X0: int = 20855, a: int = 9600, n: int = 10000,
+                    ruta: Optional[str] = None) -> np.ndarray:
+    # Lee la muestra de un archivo (.npy o texto con un número por línea) o la genera con el GCM de las pruebas.
+    if ruta is not None:
+        return np.load(ruta) if ruta.endswith(".npy") else np.loadtxt(ruta, dtype=np.float64)
+    gcm = cargar_modulo("frecuencias").GCM(m, X0, a)  # Todas las pruebas traen la misma clase GCM.
+    return gcm.generar_bloque(n)
+
+def _resultado(estadistico: float, valor_critico: float, decision: str, **extra) -> Dict[str, Union[float, str, bool]]:
+    # Resultado de una prueba con las mismas llaves para todas.
+    return {"estadistico": float(estadistico), "valor_critico": float(valor_critico), "decision": decision,
+            "aprobada": decision.startswith("No se rechaza"), **extra}
+
+def ejecutar_prueba(nombre: str, muestra: MuestraUniforme, alpha: float = 0.05) -> Dict[str, Union[float, str, bool]]:
+    # Ejecuta una prueba sobre la muestra ya validada, sin volver a revisarla ni a copiarla; lo que una prueba
+    # calcula sobre la muestra (vista ordenada, conteos, celdas de pares) queda disponible para las demás.
+    if nombre not in PRUEBAS:  # Antes de buscar su carpeta, para no terminar en un KeyError.
+        raise ValueError(f"Prueba desconocida: {nombre}; las disponibles son {list(PRUEBAS)}")
+    modulo = cargar_modulo(nombre)
+    if nombre == "frecuencias":
+        prueba = modulo.PruebaFrecuencias(muestra, n_intervalos=5, alpha=alpha, validar=False)
+        r = prueba.ejecutar_prueba()
+        return _resultado(r["chi_cuadrada"], r["valor_critico"], r["decision"])
+    if nombre == "promedios":
+        prueba = modulo.PruebaPromedios(muestra, alpha=alpha, validar=False)
+        r = prueba.ejecutar_prueba()
+        return _resultado(abs(r["z_estadistico"]), r["z_critico"], r["decision"])
+    if nombre == "series":
+        prueba = modulo.PruebaSeries()
+        prueba.alpha = alpha
+        prueba.cargar_numeros_pseudoaleatorios(muestra)
+        r = prueba.ejecutar_prueba_tuplas()
+        return _resultado(r["chi_cuadrado"], r["valor_critico"], r["decision"], p_value=r["p_value"])
+    if nombre == "kolmogorov_smirnov":
+        prueba = modulo.PruebaKolmogorovSmirnov(muestra, alpha=alpha, validar=False)
+        r = prueba.ejecutar_prueba()
+        return _resultado(r["d_estadistico"], r["d_critico"], r["decision"], p_value=float(r["p_value"]))
+    if nombre == "poker":
+        prueba = modulo.PruebaPoker()
+        prueba.alpha = alpha
+        prueba.calcular(muestra, validar=False)
+        return _resultado(prueba.estadistico_chi, prueba.valor_critico, prueba.decision)
+
+def _iniciar_trabajador(muestra: MuestraUniforme) -> None:
+    # Guarda la muestra en el proceso trabajador, para enviarla una vez por proceso y no una vez por prueba.
+    global _MUESTRA
+    _MUESTRA = muestra
+
+def _ejecutar_en_trabajador(argumentos) -> Dict[str, Union[float, str, bool]]:
+    # Ejecuta una prueba dentro de un proceso trabajador sobre su copia de la muestra.
+    nombre, alpha = argumentos
+    return ejecutar_prueba(nombre, _MUESTRA, alpha)
+
+def ejecutar_bateria(numeros, alpha: float = 0.05, pruebas: Iterable[str] = PRUEBAS,
+                     procesos: Optional[int] = 1) -> Dict:
+    # Valida la muestra una vez y le aplica todas las pruebas; con procesos=1 se ejecutan una tras otra y con
+    # cualquier otro valor (None = tantos como núcleos) en un grupo de procesos. Retorna un solo diccionario.
+    if not 0 < alpha < 1:
+        raise ValueError("El nivel de significancia (alpha) debe estar entre 0 y 1")
+    pruebas = list(pruebas)
+    desconocidas = [nombre for nombre in pruebas if nombre not in PRUEBAS]
+    if desconocidas:  # Se revisa antes de validar la muestra o de crear procesos.
+        raise ValueError(f"Pruebas desconocidas: {desconocidas}; las disponibles son {list(PRUEBAS)}")
+    muestra = validar_muestra(numeros)
+    if procesos == 1:
+        resultados = [ejecutar_prueba(nombre, muestra, alpha) for nombre in pruebas]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador, initargs=(muestra,)) as grupo:
+            resultados = list(grupo.map(_ejecutar_en_trabajador, [(nombre, alpha) for nombre in pruebas]))
+    por_prueba = dict(zip(pruebas, resultados))
+    return {
+        "tamaño_muestra": muestra.N,
+        "nivel_significancia": alpha,
+        "pruebas": por_prueba,
+        "aprobadas": sum(r["aprobada"] for r in por_prueba.values()),
+        "total": len(por_prueba),
+    }
+
+def generar_reporte(bateria: Dict) -> str:
+    # Resumen de la batería: una fila por prueba con su estadístico, su valor crítico y si se rechazó H₀.
+    reporte = "\n" + "="*80
+    reporte += "\nBATERÍA DE PRUEBAS - VALIDACIÓN DE NÚMEROS PSEUDOALEATORIOS"
+    reporte += "\n" + "="*80
+    reporte += f"\n- Tamaño de muestra      (N) : {bateria['tamaño_muestra']}"
+    reporte += f"\n- Nivel de significancia (α) : {bateria['nivel_significancia']}"
+    reporte += "\n\n" + f"{'Prueba':<22}{'Estadístico':>14}{'Valor crítico':>16}   Resultado"
+    reporte += "\n" + "-"*80
+    for nombre, r in bateria["pruebas"].items():
+        reporte += f"\n{nombre:<22}{r['estadistico']:>14.5f}{r['valor_critico']:>16.5f}   {'No se rechaza H₀' if r['aprobada'] else 'Se rechaza H₀'}"
+    reporte += "\n" + "-"*80
+    reporte += f"\nPruebas aprobadas: {bateria['aprobadas']} de {bateria['total']}"
+    reporte += "\n" + "="*80
+    return reporte
+
+if __name__ == "__main__":
+    # Parámetros del GCM, los mismos de cada prueba por separado.
+    parametros = [
+        {"m": 32057, "X0": 20855, "a": 9600}
+    ]
+
+    # Aplicar la batería a cada conjunto de parámetros con una sola muestra por generador.
+    for params in parametros:
+        print(f"\nProbando con m={params['m']}, X0={params['X0']}, a={params['a']}")
+        print("="*80)
+        numeros = obtener_muestra(params['m'], params['X0'], params['a'], n=10000)
+        print(generar_reporte(ejecutar_bateria(numeros, alpha=0.05)))
@@ -0,0 +1,134 @@
+# Importamos numpy para guardar la muestra y calcular sus estadísticas de forma vectorizada.
+import numpy as np
+# Importamos herramientas para definir los tipos de datos que usaremos.
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+MAXIMO_CELDAS_DENSAS = 1 << 22  # Hasta estas celdas se cuenta con bincount en una tabla completa; más allá, solo las ocupadas.
+
+def indices_intervalo(numeros: np.ndarray, k: int) -> np.ndarray:
+    # Intervalo [i/k, (i+1)/k) de cada número, con el 1.0 en el último intervalo, igual que np.histogram con
+    # límites np.linspace(0, 1, k+1): floor(x*k) se corrige contra los límites para no fallar por redondeo.
+    numeros = np.asarray(numeros, dtype=np.float64)
+    limites = np.linspace(0, 1, k + 1)
+    indices = np.minimum((numeros * k).astype(np.int64), k - 1)
+    indices -= numeros < limites[indices]  # El redondeo de x*k pudo subir un intervalo.
+    indices += (numeros >= limites[indices + 1]) & (indices < k - 1)  # O bajarlo.
+    return indices
+
+class MuestraUniforme:
+    # Muestra de números pseudoaleatorios en [0,1] que comparten todas las pruebas.
+    # Cada estadística (vista ordenada, índices de intervalo para un k, conteos, media, varianza, celdas de los pares
+    # consecutivos) se calcula la primera vez que alguna prueba la pide y se guarda; las demás pruebas, los reportes
+    # o un cambio de alpha la reutilizan sin volver a recorrer la muestra.
+
+    def __init__(self, numeros, validar: bool = True):
+        # Guarda una copia float64 de solo lectura; el arreglo de quien llama no se congela ni se comparte.
+        self.numeros = np.array(numeros, dtype=np.float64)
+        if self.numeros.ndim != 1:
+            raise ValueError("La muestra debe ser un arreglo de una dimensión")
+        self.numeros.flags.writeable = False  # Las estadísticas guardadas solo valen si la muestra no cambia.
+        self.N = len(self.numeros)
+        self._cache: Dict[Hashable, Any] = {}  # Estadísticas y resultados ya calculados.
+        if validar:
+            self.validar()
+
+    def __len__(self) -> int:
+        # Tamaño de la muestra, para usarla donde se espera una lista de números.
+        return self.N
+
+    def memorizar(self, clave: Hashable, calcular: Callable[[], Any]) -> Any:
+        # Devuelve el valor guardado con esa clave o lo calcula con calcular() la primera vez.
+        if clave not in self._cache:
+            self._cache[clave] = calcular()
+        return self._cache[clave]
+
+    @property
+    def en_rango(self) -> bool:
+        # Indica si todos los números están en [0,1]; NaN no cumple ninguna comparación y queda fuera.
+        return self.memorizar("en_rango", lambda: bool(np.all((self.numeros >= 0.0) & (self.numeros <= 1.0))))
+
+    def validar(self) -> None:
+        # Revisa una sola vez que la muestra no esté vacía y que todos los números estén en [0,1].
+        if self.N == 0:
+            raise ValueError("La lista de números no puede estar vacía")
+        if not self.en_rango:
+            raise ValueError("Todos los números deben estar en el intervalo [0.0, 1.0]")
+
+    @property
+    def ordenados(self) -> np.ndarray:
+        # Vista ordenada de la muestra, de menor a mayor.
+        def ordenar() -> np.ndarray:
+            ordenados = np.sort(self.numeros)
+            ordenados.flags.writeable = False
+            return ordenados
+        return self.memorizar("ordenados", ordenar)
+
+    @property
+    def media(self) -> float:
+        # Promedio aritmético de la muestra.
+        return self.memorizar("media", lambda: float(np.mean(self.numeros)))
+
+    @property
+    def varianza(self) -> float:
+        # Varianza muestral (con N-1), a partir de la media ya guardada.
+        return self.memorizar("varianza", lambda: float(np.sum((self.numeros - self.media) ** 2) / max(self.N - 1, 1)))
+
+    def indices(self, k: int) -> np.ndarray:
+        # Intervalo de cada número entre k intervalos iguales de [0,1] (ver indices_intervalo).
+        def calcular() -> np.ndarray:
+            indices = indices_intervalo(self.numeros, k)
+            indices.flags.writeable = False
+            return indices
+        return self.memorizar(("indices", k), calcular)
+
+    def conteos(self, k: int) -> np.ndarray:
+        # Cuántos números caen en cada uno de los k intervalos iguales de [0,1].
+        return self.memorizar(("conteos", k), lambda: np.bincount(self.indices(k), minlength=k))
+
+    def celdas_pares(self, k: int) -> np.ndarray:
+        # Celda i*k + j del par consecutivo (x_t, x_{t+1}) en la cuadrícula de k x k, para los N-1 pares.
+        def calcular() -> np.ndarray:
+            indices = self.indices(k)
+            celdas = indices[:-1] * k + indices[1:]
+            celdas.flags.writeable = False
+            return celdas
+        return self.memorizar(("celdas_pares", k), calcular)
+
+    def conteos_pares(self, k: int) -> np.ndarray:
+        # Matriz k x k con cuántos pares consecutivos caen en cada celda.
+        return self.memorizar(("conteos_pares", k), lambda: np.bincount(self.celdas_pares(k), minlength=k * k).reshape(k, k))
+
+    def celdas_tuplas(self, k: int, d: int, traslape: bool = True) -> np.ndarray:
+        # Celda de cada d-tupla en la cuadrícula de k^d celdas, con código Σ i_j * k^(d-1-j) (el de celdas_pares para d=2).
+        # Con traslape las tuplas son (x_t, ..., x_{t+d-1}) para los N valores de t, dando la vuelta al final de la
+        # muestra (tuplas circulares, como en la prueba de Good); sin traslape son los N//d bloques disjuntos.
+        if d < 1 or k < 2:
+            raise ValueError("Se necesitan d >= 1 y k >= 2")
+        if k ** d >= 1 << 63:
+            raise ValueError(f"k^d = {k}^{d} no cabe en un código de 64 bits")
+        def calcular() -> np.ndarray:
+            indices = self.indices(k)
+            if traslape:
+                extendidos = np.concatenate((indices, indices[:d - 1]))  # Las últimas tuplas siguen con los primeros números.
+                tuplas = np.lib.stride_tricks.sliding_window_view(extendidos, d)  # Vista de N x d sin copiar.
+            else:
+                tuplas = indices[:self.N // d * d].reshape(-1, d)
+            celdas = np.zeros(len(tuplas), dtype=np.int64)
+            for j in range(d):  # Regla de Horner, una columna de la vista a la vez.
+                celdas *= k
+                celdas += tuplas[:, j]
+            celdas.flags.writeable = False
+            return celdas
+        return self.memorizar(("celdas_tuplas", k, d, traslape), calcular)
+
+    def conteos_tuplas(self, k: int, d: int, traslape: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        # (celdas ocupadas, cuántas tuplas hay en cada una). Con pocas celdas se cuenta con bincount; si k^d pasa de
+        # MAXIMO_CELDAS_DENSAS solo se cuentan las ocupadas con np.unique, así que la memoria depende de N y no de k^d.
+        def calcular() -> Tuple[np.ndarray, np.ndarray]:
+            celdas = self.celdas_tuplas(k, d, traslape)
+            if k ** d <= MAXIMO_CELDAS_DENSAS:
+                conteos = np.bincount(celdas, minlength=k ** d)
+                ocupadas = np.flatnonzero(conteos)
+                return ocupadas, conteos[ocupadas]
+            return np.unique(celdas, return_counts=True)
+        return self.memorizar(("conteos_tuplas", k, d, traslape), calcular)
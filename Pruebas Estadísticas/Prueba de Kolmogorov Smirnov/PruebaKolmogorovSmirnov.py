@@ -10,6 +10,15 @@ from scipy.stats import uniform
 from scipy.stats import kstest
 # Importamos herramientas para definir los tipos de datos que usaremos.
 from typing import Dict, Union
+# Importamos os y sys para agregar la carpeta de las pruebas a la ruta de búsqueda de módulos.
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# Importamos la muestra compartida, que guarda la vista ordenada y los resultados para todas las pruebas.
+from MuestraUniforme import MuestraUniforme
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Aplicaciones de simulación (Parámetros válidos)", "GCM con parametros definidos"))
+# Importamos la detección del ciclo y los bloques vectorizados del GCM compartido, que no desbordan 64 bits.
+from GCM_ParametrosDefinidos import ciclo_gcm, generar_estados_gcm
 
 class GCM:
     def __init__(self, m: int, X0: int, a: int):
@@ -18,27 +27,25 @@ class GCM:
         self.X0 = X0
         self.a = a
         self.Xn = X0
-        self.numeros_generados = set()
         
     def generar_numero(self) -> float:
         # Genera un número pseudoaleatorio usando el método congruencial multiplicativo.
         self.Xn = (self.a * self.Xn) % self.m
         return self.Xn / self.m
+
+    def generar_bloque(self, n: int) -> np.ndarray:
+        # Genera n números pseudoaleatorios de una vez como arreglo de numpy: X_{t+i} = (X_t * a^i) mod m (ver generar_estados_gcm).
+        estados = generar_estados_gcm(self.Xn, self.a, self.m, n)
+        if n > 0:
+            self.Xn = int(estados[-1])
+        return estados / self.m
         
     def generar_hasta_periodo(self) -> List[float]:
         # Genera números hasta que se complete el período del GCM.
-        numeros = []
+        # Primero se detecta el ciclo con memoria constante y después se generan todos los números en un solo bloque.
+        mu, periodo = ciclo_gcm(self.a, self.m, self.X0)
         self.Xn = self.X0  # Reiniciamos el generador
-        self.numeros_generados = set()
-        
-        while True:
-            numero = self.generar_numero()
-            if numero in self.numeros_generados:
-                break
-            numeros.append(numero)
-            self.numeros_generados.add(numero)
-            
-        return numeros
+        return self.generar_bloque(max(mu - 1, 0) + periodo).tolist()
 
 # Definición de la clase llamada PruebaKolmogorovSmirnov. Esta clase agrupa todos los datos y métodos necesarios para realizar la prueba de Kolmogorov-Smirnov en un conjunto de números pseudoaleatorios.
 class PruebaKolmogorovSmirnov:
@@ -53,21 +60,24 @@ class PruebaKolmogorovSmirnov:
     # 5. Se toma la decisión estadística basada en esta comparación.
     
     # Este es el método especial constructor de la clase. Se ejecuta automáticamente cuando se crea una nueva instancia (objeto) de PruebaKolmogorovSmirnov.
-    def __init__(self, numeros: List[float], alpha: float = 0.05):
+    def __init__(self, numeros: Union[List[float], MuestraUniforme], alpha: float = 0.05, validar: bool = True):
         # Inicializa la prueba con los números a analizar y el nivel de significancia.
         # Args:
-        #   numeros (List[float]): Lista de números pseudoaleatorios a probar.
+        #   numeros (List[float] | MuestraUniforme): Números pseudoaleatorios a probar, o una muestra compartida con otras pruebas.
         #   alpha (float): Nivel de significancia para la prueba (usualmente 0.05).
+        #   validar (bool): Si es False no se revisan los números (por ejemplo, si una batería ya los validó).
         
-        # Guardamos la lista de números en un array de numpy para facilitar las operaciones matemáticas.
-        self.numeros = np.array(numeros)
+        # Guardamos los números en una muestra compartida, que ordena una sola vez aunque se repita la prueba o el reporte.
+        self.muestra = numeros if isinstance(numeros, MuestraUniforme) else MuestraUniforme(numeros, validar=False)
+        self.numeros = self.muestra.numeros
         # Guardamos el nivel de significancia que usaremos para la decisión.
         self.alpha = alpha
         # Obtenemos el tamaño de la muestra (cuántos números tenemos).
         self.N = len(numeros)
         
         # Validamos que los datos de entrada sean correctos antes de proceder.
-        self._validar_entradas()
+        if validar:
+            self._validar_entradas()
         
     def _validar_entradas(self) -> None:
         # Verifica que los parámetros cumplan con los requisitos necesarios para la prueba.
@@ -85,7 +95,7 @@ class PruebaKolmogorovSmirnov:
             raise ValueError("La lista de números no puede estar vacía.")
             
         # Comprobamos que todos los números estén en el rango esperado [0, 1].
-        if any(not (0.0 <= num <= 1.0) for num in self.numeros):
+        if not self.muestra.en_rango:  # Revisión vectorizada, hecha una sola vez por muestra.
             raise ValueError("Todos los números deben estar en el intervalo [0.0, 1.0].")
             
     def ejecutar_prueba(self) -> Dict[str, Union[float, str, np.ndarray]]:
@@ -93,24 +103,23 @@ class PruebaKolmogorovSmirnov:
         # Este método coordina todos los pasos de la prueba.
         # Returns:
         #   Dict: Diccionario que contiene todos los resultados de la prueba.
+        # El resultado se guarda en la muestra para cada alpha, así que generar_reporte() no vuelve a ordenar ni a llamar a kstest.
+        return dict(self.muestra.memorizar(("kolmogorov_smirnov", self.alpha), self._calcular_resultado))
+
+    def _calcular_resultado(self) -> Dict[str, Union[float, str, np.ndarray]]:
+        # Hace los cálculos de la prueba la primera vez que se ejecuta con un alpha.
         
         # Ordenamos los números de menor a mayor, lo cual es necesario para calcular la distribución empírica.
-        numeros_ordenados = np.sort(self.numeros)
+        numeros_ordenados = self.muestra.ordenados
         
-        # Calculamos el estadístico D manualmente para el reporte detallado.
-        diferencias = []
-        for i, xi in enumerate(numeros_ordenados):
-            fn_xi = (i + 1) / self.N
-            f_xi = xi
-            diferencia = abs(fn_xi - f_xi)
-            diferencias.append(diferencia)
-        d_estadistico = max(diferencias)
+        # Calculamos el estadístico D = max |Fn(xᵢ) - F(xᵢ)| con Fn(xᵢ) = (i+1)/N, para todos los i a la vez.
+        d_estadistico = self.muestra.memorizar("d_kolmogorov_smirnov", lambda: np.max(np.abs(np.arange(1, self.N + 1) / self.N - numeros_ordenados)))
         
         # Calculamos el valor crítico usando la fórmula de Coss Bu para α=0.05.
         d_critico = 1.36 / np.sqrt(self.N)
         
-        # Calculamos el p-value usando kstest para la decisión.
-        _, p_value = kstest(numeros_ordenados, 'uniform')
+        # Calculamos el p-value usando kstest para la decisión; no depende de alpha, así que se guarda una vez por muestra.
+        _, p_value = self.muestra.memorizar("kstest", lambda: kstest(numeros_ordenados, 'uniform'))
         
         # La decisión se basa en el p-value.
         if p_value < self.alpha:
@@ -3,7 +3,16 @@ import numpy as np
 # Importamos la función chi2 que nos ayudará a calcular valores de la distribución chi-cuadrada.
 from scipy.stats import chi2
 # Importamos herramientas para definir tipos de datos que usaremos en el código.
-from typing import List, Tuple
+from typing import Dict, List, Tuple, Union
+# Importamos os y sys para agregar la carpeta de las pruebas a la ruta de búsqueda de módulos.
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# Importamos la muestra compartida, que guarda las celdas de los pares consecutivos para todas las pruebas.
+from MuestraUniforme import MuestraUniforme
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Aplicaciones de simulación (Parámetros válidos)", "GCM con parametros definidos"))
+# Importamos los bloques vectorizados del GCM compartido, que no desbordan 64 bits.
+from GCM_ParametrosDefinidos import generar_estados_gcm
 
 class GCM:
     def __init__(self, m: int, X0: int, a: int):
@@ -18,6 +27,13 @@ class GCM:
         self.Xn = (self.a * self.Xn) % self.m
         return self.Xn / self.m
 
+    def generar_bloque(self, n: int) -> np.ndarray:
+        # Genera n números pseudoaleatorios de una vez como arreglo de numpy: X_{t+i} = (X_t * a^i) mod m (ver generar_estados_gcm).
+        estados = generar_estados_gcm(self.Xn, self.a, self.m, n)
+        if n > 0:
+            self.Xn = int(estados[-1])
+        return estados / self.m
+
 class PruebaSeries:
     # Implementa la Prueba de Series para validar números pseudoaleatorios.
     # Esta prueba estadística verifica si los números consecutivos son independientes mediante una prueba chi-cuadrada.
@@ -28,25 +44,44 @@ class PruebaSeries:
     # 4. Se calcula el estadístico chi-cuadrado usando la fórmula: χ² = (k²/(N-1)) * Σ(FO-FE)².
     # 5. Se compara con el valor crítico de la distribución chi-cuadrada.
     # 6. Se toma la decisión estadística basada en esta comparación.
+    # Además del modo "coss_bu" (pares, el del libro y el que se usa por omisión), la prueba se generaliza a d-tuplas
+    # en la cuadrícula de k^d celdas:
+    # - "sin_traslape": los N//d bloques disjuntos (x_1..x_d), (x_{d+1}..x_{2d}), ...; son independientes entre sí,
+    #   así que χ² = Σ(FO-FE)²/FE sigue una chi-cuadrada con k^d - 1 grados de libertad.
+    # - "con_traslape": las N tuplas (x_t, ..., x_{t+d-1}), circulares. Las tuplas vecinas comparten números y su χ²
+    #   no es chi-cuadrada; se usa la segunda diferencia de Good, Ψ²_d - 2Ψ²_{d-1} + Ψ²_{d-2}, que sí lo es con
+    #   k^(d-2)(k-1)² grados de libertad (k-1 para d=1, donde es la prueba de frecuencias).
+    MODOS = ("coss_bu", "sin_traslape", "con_traslape")
     
-    def __init__(self):
+    def __init__(self, k: int = 5, d: int = 2, modo: str = "coss_bu"):
         # Inicializa la prueba de series con los parámetros necesarios.
+        if modo not in self.MODOS:
+            raise ValueError(f"Modo desconocido: {modo}; los disponibles son {self.MODOS}")
+        if modo == "coss_bu" and d != 2:
+            raise ValueError("El modo de Coss Bu es para pares (d=2)")
+        if not 1 <= d <= 8 or k < 2:
+            raise ValueError("Se necesitan 1 <= d <= 8 y k >= 2")
+        # Modo de la prueba y dimensión de las tuplas.
+        self.modo: str = modo
+        self.d: int = d
         # Creamos una lista vacía donde guardaremos nuestros números aleatorios.
         self.numeros: List[float] = []
+        # Muestra compartida con las demás pruebas; se crea al cargar los números.
+        self.muestra: MuestraUniforme = None
         # Creamos una variable para contar cuántos números tenemos (N).
         self.n: int = 0
-        # Definimos que usaremos 5 intervalos en cada dimensión (k=5 según Coss Bu).
-        self.k: int = 5
+        # Definimos cuántos intervalos usaremos en cada dimensión (k=5 según Coss Bu).
+        self.k: int = k
         # Calculamos el tamaño de cada intervalo dividiendo 1 entre 5 (1/k).
         self.intervalo: float = 1.0 / self.k
-        # Creamos una lista vacía donde guardaremos los pares de números consecutivos.
-        self.pares: List[Tuple[float, float]] = []
+        # Creamos un arreglo vacío donde guardaremos los pares de números consecutivos.
+        self.pares: np.ndarray = np.empty((0, 2))
         # Creamos una matriz de 5x5 llena de ceros para guardar las frecuencias observadas.
         self.frecuencias_obs: np.ndarray = np.zeros((self.k, self.k))
         # Definimos el nivel de significancia α=0.05 para nuestra prueba estadística.
         self.alpha: float = 0.05
         
-    def cargar_numeros_pseudoaleatorios(self, numeros: List[float]) -> None:
+    def cargar_numeros_pseudoaleatorios(self, numeros: Union[List[float], MuestraUniforme]) -> None:
         # Carga los números pseudoaleatorios y realiza los cálculos iniciales.
         # Este método:
         # 1. Carga la lista de números pseudoaleatorios.
@@ -55,7 +90,8 @@ class PruebaSeries:
         # 4. Forma los pares consecutivos.
         # 5. Calcula las frecuencias observadas.
         try:
-            self.numeros = numeros
+            self.muestra = numeros if isinstance(numeros, MuestraUniforme) else MuestraUniforme(numeros, validar=False)
+            self.numeros = self.muestra.numeros
             self.n = len(self.numeros)
             self.intervalo = 1.0 / self.k
             self.formar_pares_consecutivos()
@@ -68,9 +104,8 @@ class PruebaSeries:
     def formar_pares_consecutivos(self) -> None:
         # Forma pares consecutivos de números para la prueba.
         # Para cada número en la lista (excepto el último), creamos un par con el siguiente número.
-        # Esto nos da N-1 pares en total.
-        self.pares = [(self.numeros[i], self.numeros[i+1]) 
-                     for i in range(len(self.numeros)-1)]
+        # Esto nos da N-1 pares en total, como una vista de (N-1) x 2 sobre la muestra, sin copiar los números.
+        self.pares = np.lib.stride_tricks.sliding_window_view(self.numeros, 2)
         
     def determinar_celda(self, x: float, y: float) -> Tuple[int, int]:
         # Determina la celda de la matriz a la que pertenece un par (x,y).
@@ -94,25 +129,104 @@ class PruebaSeries:
         # 1. Inicializa la matriz de frecuencias con ceros.
         # 2. Para cada par (x,y), determina su celda.
         # 3. Incrementa el contador en esa celda.
-        # Creamos una matriz de 5x5 llena de ceros.
-        self.frecuencias_obs = np.zeros((self.k, self.k))
-        # Para cada par de números, incrementamos el contador en su celda correspondiente.
-        for x, y in self.pares:
-            celda_x, celda_y = self.determinar_celda(x, y)
-            self.frecuencias_obs[celda_x][celda_y] += 1
+        # La muestra cuenta todos los pares con np.bincount sobre sus celdas la primera vez y guarda la matriz;
+        # cada celda es la que daría determinar_celda para el par.
+        if self.modo == "coss_bu":
+            self.frecuencias_obs = self.muestra.conteos_pares(self.k).astype(float)
+        else:
+            # Para d-tuplas se guardan solo las celdas ocupadas y sus conteos (ver MuestraUniforme.conteos_tuplas).
+            self.frecuencias_obs = self.muestra.conteos_tuplas(self.k, self.d, self.modo == "con_traslape")[1]
             
     def calcular_estadistico(self) -> float:
         # Calcula el estadístico chi-cuadrado según la fórmula de Coss Bu.
         # Returns:
         #   float: Valor del estadístico chi-cuadrado.
+        # El valor se guarda en la muestra: el reporte y las repeticiones de la prueba no vuelven a calcularlo.
+        if self.modo == "coss_bu":
+            return self.muestra.memorizar(("series", self.k), self._calcular_estadistico)
+        return self.muestra.memorizar(("series", self.k, self.d, self.modo), self._calcular_estadistico_tuplas)
+
+    def _calcular_estadistico(self) -> float:
+        # Hace el cálculo del estadístico chi-cuadrado la primera vez.
         # Calculamos la frecuencia esperada: (N-1)/(k²).
         fe = (self.n - 1) / (self.k * self.k)
         # Calculamos la suma de las diferencias cuadradas entre lo observado y lo esperado.
-        suma_diferencias = sum(((self.frecuencias_obs[i][j] - fe) ** 2) 
-                             for i in range(self.k) for j in range(self.k))
+        suma_diferencias = np.sum((self.frecuencias_obs - fe) ** 2)
         # Calculamos el estadístico chi-cuadrado: (k²/(N-1)) * Σ(FO-FE)².
         chi_cuadrado = (self.k * self.k / (self.n - 1)) * suma_diferencias
-        return chi_cuadrado
+        return float(chi_cuadrado)
+
+    def _psi_cuadrada(self, d: int, traslape: bool) -> float:
+        # χ² de Pearson de las d-tuplas: Σ(FO-FE)²/FE = Σ FO²/FE - n, que solo necesita las celdas ocupadas.
+        if d == 0:
+            return 0.0
+        _, conteos = self.muestra.conteos_tuplas(self.k, d, traslape)
+        n_tuplas = int(conteos.sum())
+        fe = n_tuplas / self.k ** d
+        return float(np.sum(conteos.astype(float) ** 2) / fe - n_tuplas)
+
+    def _calcular_estadistico_tuplas(self) -> float:
+        # Estadístico de las d-tuplas según el modo (ver la descripción de la clase).
+        if self.modo == "sin_traslape":
+            return self._psi_cuadrada(self.d, False)
+        if self.d == 1:
+            return self._psi_cuadrada(1, True)
+        return self._psi_cuadrada(self.d, True) - 2 * self._psi_cuadrada(self.d - 1, True) + self._psi_cuadrada(self.d - 2, True)
+
+    def grados_libertad(self) -> int:
+        # Grados de libertad del estadístico en el modo de la prueba.
+        if self.modo == "coss_bu":
+            return (self.k - 1) ** 2
+        if self.modo == "sin_traslape":
+            return self.k ** self.d - 1
+        if self.d == 1:
+            return self.k - 1
+        return self.k ** (self.d - 2) * (self.k - 1) ** 2
+
+    def ejecutar_prueba_tuplas(self) -> Dict[str, Union[float, int, str]]:
+        # Estadístico, grados de libertad, valor crítico, p-value y decisión de la prueba en cualquier modo.
+        chi_cuadrado = self.calcular_estadistico()
+        gl = self.grados_libertad()
+        valor_critico = chi2.ppf(1 - self.alpha, gl)
+        if chi_cuadrado > valor_critico:
+            decision = "Se rechaza H₀: Los números consecutivos son dependientes ( presentan dependencia)."
+        else:
+            decision = "No se rechaza H₀: Los números consecutivos son independientes (no presentan dependencia)."
+        n_tuplas = self.n - 1 if self.modo == "coss_bu" else (self.n if self.modo == "con_traslape" else self.n // self.d)
+        return {"modo": self.modo, "k": self.k, "d": self.d, "tamaño_muestra": self.n, "tuplas": n_tuplas,
+                "celdas": self.k ** self.d, "frecuencia_esp": n_tuplas / self.k ** self.d,
+                "chi_cuadrado": chi_cuadrado, "grados_libertad": gl, "valor_critico": valor_critico,
+                "p_value": float(chi2.sf(chi_cuadrado, gl)), "decision": decision}
+
+    def _generar_reporte_tuplas(self) -> str:
+        # Reporte resumido para las d-tuplas, donde la tabla de k^d celdas no se puede mostrar como matriz.
+        r = self.ejecutar_prueba_tuplas()
+        reporte = "\n" + "="*80
+        reporte += f"\nPRUEBA DE SERIES EN {self.d} DIMENSIONES ({'con' if self.modo == 'con_traslape' else 'sin'} traslape)"
+        reporte += "\n" + "="*80
+        reporte += "\n\nPARÁMETROS DE LA PRUEBA:"
+        reporte += f"\n- Tamaño de muestra      (N) : {self.n}"
+        reporte += f"\n- Número de intervalos   (k) : {self.k}"
+        reporte += f"\n- Dimensión              (d) : {self.d}"
+        reporte += f"\n- Nivel de significancia (α) : {self.alpha}"
+        reporte += f"\n- Total de tuplas            : {r['tuplas']}"
+        reporte += f"\n- Celdas (k^d)               : {r['celdas']} ({len(self.frecuencias_obs)} ocupadas)"
+        reporte += f"\n- Frecuencia esperada   (FE) : {r['frecuencia_esp']:.4f}"
+        if r["frecuencia_esp"] < 5:
+            reporte += "\n  Advertencia: FE < 5, la aproximación chi-cuadrada no es confiable; use menos celdas o más números."
+        reporte += "\n\nESTADÍSTICO:"
+        if self.modo == "sin_traslape":
+            reporte += "\nχ² = Σ(FO-FE)²/FE"
+        else:
+            reporte += "\nχ² = Ψ²_d - 2Ψ²_(d-1) + Ψ²_(d-2)  (segunda diferencia de Good)"
+        reporte += f"\nχ² = {r['chi_cuadrado']:.5f}"
+        reporte += f"\nGrados de libertad = {r['grados_libertad']}"
+        reporte += f"\nValor crítico χ²(α={self.alpha}, gl={r['grados_libertad']}) = {r['valor_critico']:.5f}"
+        reporte += f"\np-value = {r['p_value']:.5f}"
+        reporte += "\n\nDECISIÓN:"
+        reporte += "\n" + r["decision"]
+        reporte += "\n" + "="*80
+        return reporte
     
     def generar_reporte(self) -> str:
         # Genera un reporte detallado de la prueba con todos los resultados y cálculos.
@@ -125,6 +239,8 @@ class PruebaSeries:
         # - Decisión estadística
         # Returns:
         #   str: Reporte formateado de la prueba.
+        if self.modo != "coss_bu":
+            return self._generar_reporte_tuplas()
         # Creamos el encabezado del reporte con líneas decorativas.
         reporte = "\n" + "="*80
         reporte += "\nPRUEBA DE SERIES - VALIDACIÓN DE NÚMEROS PSEUDOALEATORIOS"
@@ -241,7 +357,7 @@ if __name__ == "__main__":
         
         # Generar números pseudoaleatorios usando el GCM.
         gcm = GCM(params['m'], params['X0'], params['a'])
-        numeros = [gcm.generar_numero() for _ in range(10000)]
+        numeros = gcm.generar_bloque(10000)
         
         # Crear y ejecutar la prueba de series.
         prueba = PruebaSeries()
@@ -1,6 +1,12 @@
 import numpy as np # Importamos numpy para operaciones matemáticas eficientes con arrays y matrices.
 from scipy.stats import chi2 # Importamos la distribución chi-cuadrada para calcular el valor crítico de la prueba.
 from typing import List, Dict, Union # Importamos tipos para mejorar la documentación y el tipado del código.
+import os # Importamos os para construir la ruta a la carpeta de las pruebas.
+import sys # Importamos sys para agregar esa carpeta a la ruta de búsqueda de módulos.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")) # Carpeta con la muestra compartida por las pruebas.
+from MuestraUniforme import MuestraUniforme # Importamos la muestra que guarda sus estadísticas para todas las pruebas.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Aplicaciones de simulación (Parámetros válidos)", "GCM con parametros definidos")) # Carpeta del generador compartido.
+from GCM_ParametrosDefinidos import generar_estados_gcm # Importamos los bloques vectorizados del GCM, sin desbordar 64 bits.
 
 class GCM:
     def __init__(self, m: int, X0: int, a: int):
@@ -13,14 +19,22 @@ class GCM:
         self.Xn = (self.a * self.Xn) % self.m
         return self.Xn / self.m
 
+    def generar_bloque(self, n: int) -> np.ndarray:
+        # Genera n números pseudoaleatorios de una vez como arreglo de numpy: X_{t+i} = (X_t * a^i) mod m (ver generar_estados_gcm).
+        estados = generar_estados_gcm(self.Xn, self.a, self.m, n)
+        if n > 0:
+            self.Xn = int(estados[-1])
+        return estados / self.m
+
 class PruebaFrecuencias:
     # Clase que implementa la Prueba de Frecuencias para validar números pseudoaleatorios, dividiendo el intervalo [0,1] en n subintervalos y comparando las frecuencias observadas con las esperadas mediante la prueba chi-cuadrada.
     # La prueba verifica si los números siguen una distribución uniforme mediante la hipótesis H₀: los números provienen de una distribución uniforme (0,1) vs H₁: los números no provienen de una distribución uniforme (0,1).
     # El estadístico de prueba es χ² = Σ(FO-FE)²/FE, donde FO son las frecuencias observadas y FE es la frecuencia esperada (N/n).
     # La decisión se toma comparando χ² con el valor crítico de la distribución chi-cuadrada con n-1 grados de libertad y nivel de significancia α.
     
-    def __init__(self, numeros: List[float], n_intervalos: int = 5, alpha: float = 0.05): # Constructor que inicializa la prueba con los números a analizar, número de intervalos y nivel de significancia.
-        self.numeros = np.array(numeros) # Convertimos la lista de números a un array de numpy para operaciones vectorizadas.
+    def __init__(self, numeros: Union[List[float], MuestraUniforme], n_intervalos: int = 5, alpha: float = 0.05, validar: bool = True): # Constructor que inicializa la prueba con los números a analizar, número de intervalos y nivel de significancia.
+        self.muestra = numeros if isinstance(numeros, MuestraUniforme) else MuestraUniforme(numeros, validar=False) # Muestra que guarda los conteos para otras pruebas y otros valores de alpha.
+        self.numeros = self.muestra.numeros # Array de numpy de la muestra, para operaciones vectorizadas.
         self.n_intervalos = n_intervalos # Número de subintervalos en los que dividiremos el rango [0,1].
         self.alpha = alpha # Nivel de significancia para la prueba (probabilidad de error tipo I).
         self.N = len(numeros) # Tamaño total de la muestra (cantidad de números a analizar).
@@ -32,7 +46,8 @@ class PruebaFrecuencias:
         self.valor_critico = None # Valor crítico de la distribución chi-cuadrada.
         self.decision = None # Decisión final de la prueba.
         
-        self._validar_entradas() # Validamos que los parámetros cumplan con los requisitos necesarios.
+        if validar: # Una batería que ya validó la muestra puede omitir este paso.
+            self._validar_entradas() # Validamos que los parámetros cumplan con los requisitos necesarios.
     
     def _validar_entradas(self) -> None: # Método que verifica que los parámetros de entrada sean válidos para la prueba.
         if not (0 < self.alpha < 1): # El nivel de significancia debe estar entre 0 y 1.
@@ -41,7 +56,7 @@ class PruebaFrecuencias:
         if self.N == 0: # La muestra no puede estar vacía.
             raise ValueError("La lista de números no puede estar vacía") # Si no, se lanza un error.
         
-        if any(not (0.0 <= num <= 1.0) for num in self.numeros): # Todos los números deben estar en [0,1].
+        if not self.muestra.en_rango: # Todos los números deben estar en [0,1]; la revisión vectorizada se hace una vez por muestra.
             raise ValueError("Todos los números deben estar en el intervalo [0.0, 1.0]") # Si no, se lanza un error.
         
         if self.n_intervalos < 2: # Debe haber al menos 2 intervalos para la prueba.
@@ -49,8 +64,7 @@ class PruebaFrecuencias:
     
     def calcular_frecuencias(self) -> None:
         # Método que calcula las frecuencias observadas y esperadas para cada intervalo.
-        limites = np.linspace(0, 1, self.n_intervalos + 1) # Generamos los límites de los intervalos uniformemente espaciados.
-        self.frecuencias_obs = np.histogram(self.numeros, bins=limites)[0] # Calculamos las frecuencias observadas usando histograma.
+        self.frecuencias_obs = self.muestra.conteos(self.n_intervalos) # Conteos por intervalo, los mismos de np.histogram; se calculan una vez por muestra y por k.
         self.frecuencia_esp = self.N / self.n_intervalos # La frecuencia esperada es N/n (total de números entre número de intervalos).
     
     def calcular_chi_cuadrada(self) -> float:
@@ -83,6 +97,16 @@ class PruebaFrecuencias:
         return self.decision # Devolvemos la decisión final.
     
     def ejecutar_prueba(self) -> Dict[str, Union[float, str, np.ndarray]]: # Método que ejecuta la prueba completa y devuelve todos los resultados en un diccionario.
+        # El resultado se guarda en la muestra para cada (n_intervalos, alpha): repetir la prueba o generar el reporte no recalcula nada.
+        resultado = self.muestra.memorizar(("frecuencias", self.n_intervalos, self.alpha), self._calcular_resultado)
+        self.frecuencias_obs = resultado["frecuencias_obs"] # Restauramos los atributos que usa el reporte.
+        self.frecuencia_esp = resultado["frecuencia_esp"]
+        self.chi_cuadrada = resultado["chi_cuadrada"]
+        self.valor_critico = resultado["valor_critico"]
+        self.decision = resultado["decision"]
+        return dict(resultado) # Copia, para que quien la reciba no altere el resultado guardado.
+    
+    def _calcular_resultado(self) -> Dict[str, Union[float, str, np.ndarray]]: # Método que hace los cálculos de la prueba la primera vez.
         self.calcular_frecuencias() # Calculamos frecuencias observadas y esperadas.
         self.calcular_chi_cuadrada() # Calculamos el estadístico chi-cuadrada.
         self.obtener_valor_critico() # Obtenemos el valor crítico.
@@ -101,8 +125,7 @@ class PruebaFrecuencias:
         }
     
     def generar_reporte(self) -> str: # Método que genera un reporte detallado de la prueba con todos los cálculos.
-        if self.chi_cuadrada is None: # Si no se ha ejecutado la prueba, la ejecutamos.
-            self.ejecutar_prueba()
+        self.ejecutar_prueba() # Obtenemos el resultado guardado para el alpha actual (o lo calculamos la primera vez).
         
         # Generamos el encabezado del reporte.
         reporte = "\n" + "="*80 # Agregamos una línea de separación.
@@ -172,7 +195,7 @@ if __name__ == "__main__":
         
         # Generar números pseudoaleatorios.
         gcm = GCM(params['m'], params['X0'], params['a'])
-        numeros = [gcm.generar_numero() for _ in range(10000)]
+        numeros = gcm.generar_bloque(10000)
         
         # Crear y ejecutar la prueba.
         prueba = PruebaFrecuencias(numeros=numeros, n_intervalos=5, alpha=0.05)
@@ -1,6 +1,12 @@
 import numpy as np #Proporciona estructuras de datos eficientes para arrays y matrices.
 from scipy.stats import norm #Es una biblioteca para computación científica y estadística que importa la "Distribución normal estándar".
 from typing import List, Dict, Union #Es una biblioteca para anotaciones de tipos en Python. Nos ayuda a documentar los tipos de datos que esperamos.
+import os #Construye la ruta a la carpeta de las pruebas.
+import sys #Agrega esa carpeta a la ruta de búsqueda de módulos.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")) #Carpeta con la muestra compartida por las pruebas.
+from MuestraUniforme import MuestraUniforme #Muestra que guarda sus estadísticas para todas las pruebas.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Aplicaciones de simulación (Parámetros válidos)", "GCM con parametros definidos")) #Carpeta del generador compartido.
+from GCM_ParametrosDefinidos import generar_estados_gcm #Bloques vectorizados del GCM, sin desbordar 64 bits.
 
 class GCM:
     def __init__(self, m: int, X0: int, a: int):
@@ -13,6 +19,13 @@ class GCM:
         self.Xn = (self.a * self.Xn) % self.m
         return self.Xn / self.m
 
+    def generar_bloque(self, n: int) -> np.ndarray:
+        # Genera n números pseudoaleatorios de una vez como arreglo de numpy: X_{t+i} = (X_t * a^i) mod m (ver generar_estados_gcm).
+        estados = generar_estados_gcm(self.Xn, self.a, self.m, n)
+        if n > 0:
+            self.Xn = int(estados[-1])
+        return estados / self.m
+
 class PruebaPromedios:
     # Implementa la Prueba de los Promedios para validar números pseudoaleatorios.
     # Esta prueba estadística verifica si los números provienen de una distribución uniforme (0,1) con promedio teórico de 0.5 mediante una prueba de hipótesis estadística.
@@ -22,14 +35,16 @@ class PruebaPromedios:
     # 3. Se compara |Z₀| con el valor crítico Zα/2 de la distribución normal estándar.
     # 4. Se toma la decisión estadística basada en esta comparación.
     
-    def __init__(self, numeros: List[float], alpha: float = 0.05):
+    def __init__(self, numeros: Union[List[float], MuestraUniforme], alpha: float = 0.05, validar: bool = True):
         # Inicializa la prueba de promedios con los números y el nivel de significancia.
         # Args:
-        # numeros (List[float]): Lista de números pseudoaleatorios a probar
+        # numeros (List[float] | MuestraUniforme): Números pseudoaleatorios a probar, o una muestra compartida con otras pruebas
         # alpha (float): Nivel de significancia (default 0.05)
+        # validar (bool): Si es False no se revisan los números (por ejemplo, si una batería ya los validó)
         #Estamos creando un atributo "self." que pertenece a esta instancia específica de la clase actual.
         # Convertir la lista a array de numpy para cálculos más eficientes; por ejemplo, para usar la función np.mean() que calcula el promedio.
-        self.numeros = np.array(numeros) #Es una lista de números pseudoaleatorios.
+        self.muestra = numeros if isinstance(numeros, MuestraUniforme) else MuestraUniforme(numeros, validar=False) #Guarda la media para otras pruebas y otros valores de alpha.
+        self.numeros = self.muestra.numeros #Es el arreglo de números pseudoaleatorios.
         self.alpha = alpha #Es el nivel de significancia.
         self.N = len(numeros) #Es el tamaño de la muestra.
         
@@ -40,7 +55,8 @@ class PruebaPromedios:
         self.decision = None          # Decisión final de la prueba.
         
         # Validar que los datos cumplan con los requisitos.
-        self._validar_entradas()
+        if validar:
+            self._validar_entradas()
     
     def _validar_entradas(self) -> None:
         # Verifica que los parámetros cumplan con los requisitos necesarios para la prueba.
@@ -54,7 +70,7 @@ class PruebaPromedios:
         if self.N == 0: #Si el tamaño de la muestra es 0, se lanza un error.
             raise ValueError("La lista de números no puede estar vacía")
             
-        if any(not (0.0 <= num <= 1.0) for num in self.numeros): #any() es una función que verifica si algún elemento de la lista cumple con la condición.
+        if not self.muestra.en_rango: #La revisión vectorizada se hace una sola vez por muestra.
             raise ValueError("Todos los números deben estar en el intervalo [0.0, 1.0]")
     
     def calcular_promedio_muestral(self) -> float:
@@ -62,7 +78,7 @@ class PruebaPromedios:
         # El promedio se calcula como: x̄ = (U₁ + U₂ + ... + Uₙ) / N
         # Returns:
         # float: Promedio muestral (x̄)
-        self.promedio_muestral = np.mean(self.numeros) #np.mean() es una función de numpy que calcula el promedio de los elementos de un array.
+        self.promedio_muestral = self.muestra.media #La muestra calcula np.mean() la primera vez y lo guarda.
         return self.promedio_muestral
     
     def calcular_z_estadistico(self) -> float:
@@ -126,6 +142,16 @@ class PruebaPromedios:
         # 4. Tomar la decisión estadística
         # Returns:
         # Dict: Diccionario con todos los resultados de la prueba
+        # El resultado se guarda en la muestra para cada alpha: repetir la prueba o generar el reporte no recalcula nada.
+        resultado = self.muestra.memorizar(("promedios", self.alpha), self._calcular_resultado)
+        self.promedio_muestral = resultado["promedio_muestral"] #Restauramos los atributos que usa el reporte.
+        self.z_estadistico = resultado["z_estadistico"]
+        self.z_critico = resultado["z_critico"]
+        self.decision = resultado["decision"]
+        return dict(resultado) #Copia, para que quien la reciba no altere el resultado guardado.
+    
+    def _calcular_resultado(self) -> Dict[str, Union[float, str]]:
+        # Hace los cálculos de la prueba la primera vez que se ejecuta con un alpha.
         self.calcular_promedio_muestral() 
         self.calcular_z_estadistico()
         self.obtener_z_critico()
@@ -151,8 +177,7 @@ class PruebaPromedios:
         # Returns:
         # str: Imprimir el reporte formateado de la prueba
         # Asegurar que la prueba se haya ejecutado
-        if self.promedio_muestral is None: #Si el promedio muestral no está calculado, se ejecuta la prueba.
-            self.ejecutar_prueba()
+        self.ejecutar_prueba() #Resultado guardado para el alpha actual (o calculado la primera vez).
             
         reporte = "\n" + "="*80 #Es una línea de 80 caracteres.
         reporte += "\nPRUEBA DE LOS PROMEDIOS"
@@ -197,7 +222,7 @@ if __name__ == "__main__":
         
         # Generar números pseudoaleatorios
         gcm = GCM(params['m'], params['X0'], params['a'])
-        numeros = [gcm.generar_numero() for _ in range(10000)]
+        numeros = gcm.generar_bloque(10000)
         
         # Crear y ejecutar la prueba
         prueba = PruebaPromedios(numeros=numeros, alpha=0.05)
@@ -4,6 +4,14 @@ from scipy.stats import chi2  # Para obtener valores críticos de χ².
 from typing import List, Dict, Union  # Para indicar tipos de listas, diccionarios y uniones de tipos
 # Importamos Counter para contar frecuencias de dígitos en cada número.
 from collections import Counter  # Para contar apariciones de cada dígito.
+# Importamos numpy para generar los números pseudoaleatorios por bloques.
+import numpy as np  # Para arreglos y operaciones vectorizadas.
+import os  # Para construir la ruta a la carpeta de las pruebas.
+import sys  # Para agregar esa carpeta a la ruta de búsqueda de módulos.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))  # Carpeta con la muestra compartida.
+from MuestraUniforme import MuestraUniforme  # Muestra que guarda sus estadísticas para todas las pruebas.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Aplicaciones de simulación (Parámetros válidos)", "GCM con parametros definidos"))  # Carpeta del generador compartido.
+from GCM_ParametrosDefinidos import generar_estados_gcm  # Bloques vectorizados del GCM, sin desbordar 64 bits.
 
 class GCM:
     def __init__(self, m: int, X0: int, a: int):
@@ -18,6 +26,13 @@ class GCM:
         self.Xn = (self.a * self.Xn) % self.m
         return self.Xn / self.m
 
+    def generar_bloque(self, n: int) -> np.ndarray:
+        # Genera n números pseudoaleatorios de una vez como arreglo de numpy: X_{t+i} = (X_t * a^i) mod m (ver generar_estados_gcm).
+        estados = generar_estados_gcm(self.Xn, self.a, self.m, n)
+        if n > 0:
+            self.Xn = int(estados[-1])
+        return estados / self.m
+
 class PruebaPoker:
     # Implementa la Prueba de Póker para validar números pseudoaleatorios.
     # Analiza los primeros cinco dígitos decimales de cada número y clasifica en categorías de póker.
@@ -26,6 +41,7 @@ class PruebaPoker:
     def __init__(self):
         # Inicializa la prueba de póker con los parámetros necesarios.
         self.numeros: List[float] = []
+        self.muestra: MuestraUniforme = None  # Muestra compartida; se crea al calcular la prueba.
         self.n: int = 0
         self.probabilidades: Dict[str, float] = {
             "Todos diferentes": 0.3024,
@@ -63,11 +79,13 @@ class PruebaPoker:
         return patrones.get(tuple(frecuencias), "Todos diferentes")
 
     def calcular_frecuencias_observadas(self) -> None:
-        # Calcula las frecuencias observadas para cada categoría de póker.
-        self.frecuencias_obs = {cat: 0 for cat in self.probabilidades}
-        for numero in self.numeros:
-            categoria = self.clasificar(numero)
-            self.frecuencias_obs[categoria] += 1
+        # Calcula las frecuencias observadas para cada categoría de póker; la muestra guarda los conteos.
+        def contar() -> Dict[str, int]:
+            frecuencias = {cat: 0 for cat in self.probabilidades}
+            for numero in self.numeros:
+                frecuencias[self.clasificar(numero)] += 1
+            return frecuencias
+        self.frecuencias_obs = dict(self.muestra.memorizar("poker", contar))
 
     def calcular_frecuencias_esperadas(self) -> None:
         # Calcula las frecuencias esperadas multiplicando probabilidad por tamaño de muestra.
@@ -131,7 +149,7 @@ class PruebaPoker:
             raise ValueError("El nivel de significancia (alpha) debe estar entre 0 y 1.")
         if self.n == 0:
             raise ValueError("La lista de números pseudoaleatorios no puede estar vacía.")
-        if not all(0 <= x <= 1 for x in self.numeros):
+        if not self.muestra.en_rango:  # Revisión vectorizada, hecha una sola vez por muestra.
             raise ValueError("Los números pseudoaleatorios deben estar entre 0 y 1.")
 
     def _verificar_frecuencias_esperadas(self) -> bool:
@@ -191,22 +209,28 @@ class PruebaPoker:
         reporte += "\n" + "=" * 80 
         return reporte
 
-    def realizar_prueba(self, numeros: List[float]) -> None:
-        # Ejecuta el flujo completo de la prueba del póker.
-        self.numeros = numeros
+    def calcular(self, numeros: Union[List[float], MuestraUniforme], validar: bool = True) -> None:
+        # Calcula la prueba completa sin imprimir; validar=False omite la revisión si una batería ya validó los números.
+        self.muestra = numeros if isinstance(numeros, MuestraUniforme) else MuestraUniforme(numeros, validar=False)
+        self.numeros = self.muestra.numeros
         self.n = len(self.numeros)
-        self._validar_entradas()
+        if validar:
+            self._validar_entradas()
         
         self.calcular_frecuencias_observadas()
         self.calcular_frecuencias_esperadas()
-        
-        if not self._verificar_frecuencias_esperadas():
-            print("ADVERTENCIA: Algunas frecuencias esperadas son < 5")
-        
         self.combinar_categorías()
         self.calcular_chi_cuadrada()
         self.obtener_valor_critico()
         self.tomar_decision()
+
+    def realizar_prueba(self, numeros: Union[List[float], MuestraUniforme]) -> None:
+        # Ejecuta el flujo completo de la prueba del póker.
+        self.calcular(numeros)
+        
+        if not self._verificar_frecuencias_esperadas():
+            print("ADVERTENCIA: Algunas frecuencias esperadas son < 5")
+        
         print(self.generar_reporte())
 
 # Bloque principal: ejecuta la prueba cuando el script se corre directamente.
@@ -223,7 +247,7 @@ if __name__ == "__main__":
         
         # Generar números pseudoaleatorios usando el GCM.
         gcm = GCM(params['m'], params['X0'], params['a'])
-        numeros = [gcm.generar_numero() for _ in range(10000)]
+        numeros = gcm.generar_bloque(10000)
         
         # Crear y ejecutar la prueba de póker.
         prueba = PruebaPoker()
@@ -0,0 +1,365 @@
+# Importamos numpy para procesar cada bloque de números de forma vectorizada.
+import numpy as np
+# Importamos os para saber cuántos núcleos hay y sys para encontrar el generador compartido.
+import os
+import sys
+# Importamos el grupo de procesos para repartir los segmentos del flujo entre núcleos.
+from concurrent.futures import ProcessPoolExecutor
+# Importamos las distribuciones para los valores críticos y el p-value de Kolmogorov-Smirnov.
+from scipy.stats import chi2, kstwo, norm
+# Importamos herramientas para definir los tipos de datos que usaremos.
+from typing import Callable, Dict, Optional, Union
+# Importamos la asignación de intervalos que usa la muestra compartida, para contar exactamente igual que np.histogram.
+from MuestraUniforme import indices_intervalo
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Aplicaciones de simulación (Parámetros válidos)", "GCM con parametros definidos"))
+# Importamos el GCM compartido, que genera los estados enteros sin desbordar 64 bits para cualquier m < 2^63.
+from GCM_ParametrosDefinidos import GCM_Primos
+
+# Versiones incrementales de las cinco pruebas para muestras que no caben en memoria.
+# Cada acumulador recibe la muestra por bloques con actualizar(bloque) y guarda solo lo que su estadístico necesita
+# (conteos, sumas), así que la memoria no crece con el tamaño de la muestra. resultado(alpha) devuelve un diccionario
+# con las mismas llaves que ejecutar_prueba() de la prueba en memoria. combinar(otro) junta el acumulador de un segmento
+# con el del segmento que le sigue en la secuencia, como si un solo acumulador hubiera visto los dos: así la muestra
+# se puede repartir entre procesos y reducir al final.
+
+class AcumuladorFrecuencias:
+    # Prueba de frecuencias: conteos de cada uno de los k intervalos.
+
+    def __init__(self, n_intervalos: int = 5):
+        if n_intervalos < 2:
+            raise ValueError("El número de intervalos debe ser al menos 2")
+        self.n_intervalos = n_intervalos
+        self.conteos = np.zeros(n_intervalos, dtype=np.int64)  # Frecuencias observadas acumuladas.
+        self.N = 0  # Números vistos.
+
+    def actualizar(self, bloque) -> None:
+        # Suma los conteos del bloque.
+        bloque = np.asarray(bloque, dtype=np.float64)
+        self.conteos += np.bincount(indices_intervalo(bloque, self.n_intervalos), minlength=self.n_intervalos)
+        self.N += len(bloque)
+
+    def combinar(self, otro: "AcumuladorFrecuencias") -> "AcumuladorFrecuencias":
+        # Suma los conteos del otro segmento.
+        if otro.n_intervalos != self.n_intervalos:
+            raise ValueError("Solo se pueden combinar acumuladores con el mismo número de intervalos")
+        self.conteos += otro.conteos
+        self.N += otro.N
+        return self
+
+    def resultado(self, alpha: float = 0.05) -> Dict[str, Union[float, str, np.ndarray]]:
+        # χ² = Σ(FO-FE)²/FE con n-1 grados de libertad, como PruebaFrecuencias.
+        frecuencia_esp = self.N / self.n_intervalos
+        chi_cuadrada = float(np.sum((self.conteos - frecuencia_esp) ** 2 / frecuencia_esp))
+        valor_critico = chi2.ppf(1 - alpha, self.n_intervalos - 1)
+        if chi_cuadrada < valor_critico:
+            decision = "No se rechaza H₀: Los números provienen de una distribución uniforme."
+        else:
+            decision = "Se rechaza H₀: Los números no provienen de una distribución uniforme."
+        return {"tamaño_muestra": self.N, "n_intervalos": self.n_intervalos, "nivel_significancia": alpha,
+                "frecuencias_obs": self.conteos.copy(), "frecuencia_esp": frecuencia_esp,
+                "chi_cuadrada": chi_cuadrada, "valor_critico": valor_critico, "decision": decision}
+
+class AcumuladorPromedios:
+    # Prueba de los promedios: suma de los números, con compensación de Neumaier entre bloques para que el error
+    # de redondeo no crezca con miles de millones de sumandos.
+
+    def __init__(self):
+        self.suma = 0.0  # Suma acumulada.
+        self.compensacion = 0.0  # Parte de la suma que el redondeo de 'suma' perdió.
+        self.N = 0
+
+    def actualizar(self, bloque) -> None:
+        # Suma el bloque (np.sum ya suma por pares dentro del bloque) y lo agrega con compensación.
+        bloque = np.asarray(bloque, dtype=np.float64)
+        self._sumar(float(np.sum(bloque)))
+        self.N += len(bloque)
+
+    def _sumar(self, parcial: float) -> None:
+        # Agrega un sumando a la suma compensada (Neumaier).
+        total = self.suma + parcial
+        if abs(self.suma) >= abs(parcial):
+            self.compensacion += (self.suma - total) + parcial
+        else:
+            self.compensacion += (parcial - total) + self.suma
+        self.suma = total
+
+    def combinar(self, otro: "AcumuladorPromedios") -> "AcumuladorPromedios":
+        # Agrega la suma del otro segmento y su compensación, sin perder lo que cada una había corregido.
+        self._sumar(otro.suma)
+        self.compensacion += otro.compensacion
+        self.N += otro.N
+        return self
+
+    def resultado(self, alpha: float = 0.05) -> Dict[str, Union[float, str]]:
+        # Z₀ = [(x̄ - 0.5) * √N] / √(1/12), comparado con Zα/2, como PruebaPromedios.
+        promedio = (self.suma + self.compensacion) / self.N
+        z_estadistico = (promedio - 0.5) * np.sqrt(self.N) / np.sqrt(1 / 12)
+        z_critico = norm.ppf(1 - alpha / 2)
+        if abs(z_estadistico) < z_critico:
+            decision = "No se rechaza H₀: Los números provienen de una distribución uniforme con promedio 0.5"
+        else:
+            decision = "Se rechaza H₀: Los números no provienen de una distribución uniforme con promedio 0.5"
+        return {"tamaño_muestra": self.N, "nivel_significancia": alpha, "promedio_muestral": promedio,
+                "z_estadistico": z_estadistico, "z_critico": z_critico, "decision": decision}
+
+class AcumuladorSeries:
+    # Prueba de series: conteos de los pares consecutivos en la cuadrícula de k x k. El último intervalo de cada
+    # bloque se guarda para formar el par que cruza al bloque siguiente, así que los pares son los mismos N-1.
+
+    def __init__(self, k: int = 5):
+        self.k = k
+        self.conteos = np.zeros(k * k, dtype=np.int64)  # Celda i*k + j de cada par (x_t, x_{t+1}).
+        self.primero: Optional[int] = None  # Intervalo del primer número visto, para el par con el segmento anterior.
+        self.ultimo: Optional[int] = None  # Intervalo del último número visto.
+        self.N = 0
+
+    def actualizar(self, bloque) -> None:
+        # Cuenta los pares del bloque, incluido el que lo une con el bloque anterior.
+        bloque = np.asarray(bloque, dtype=np.float64)
+        if len(bloque) == 0:
+            return
+        indices = indices_intervalo(bloque, self.k)
+        if self.ultimo is not None:
+            indices = np.concatenate(([self.ultimo], indices))
+        else:
+            self.primero = int(indices[0])
+        self.conteos += np.bincount(indices[:-1] * self.k + indices[1:], minlength=self.k * self.k)
+        self.ultimo = int(indices[-1])
+        self.N += len(bloque)
+
+    def combinar(self, otro: "AcumuladorSeries") -> "AcumuladorSeries":
+        # Suma las matrices y cuenta el par que une el último número de este segmento con el primero del otro.
+        if otro.k != self.k:
+            raise ValueError("Solo se pueden combinar acumuladores con el mismo k")
+        if otro.N == 0:
+            return self
+        self.conteos += otro.conteos
+        if self.ultimo is not None:
+            self.conteos[self.ultimo * self.k + otro.primero] += 1
+        else:
+            self.primero = otro.primero
+        self.ultimo = otro.ultimo
+        self.N += otro.N
+        return self
+
+    def resultado(self, alpha: float = 0.05) -> Dict[str, Union[float, str, np.ndarray]]:
+        # χ² = (k²/(N-1)) * Σ(FO-FE)² con (k-1)² grados de libertad, como PruebaSeries.
+        fe = (self.N - 1) / (self.k * self.k)
+        chi_cuadrado = float((self.k * self.k / (self.N - 1)) * np.sum((self.conteos - fe) ** 2))
+        gl = (self.k - 1) ** 2
+        valor_critico = chi2.ppf(1 - alpha, gl)
+        if chi_cuadrado > valor_critico:
+            decision = "Se rechaza H₀: Los números consecutivos son dependientes ( presentan dependencia)."
+        else:
+            decision = "No se rechaza H₀: Los números consecutivos son independientes (no presentan dependencia)."
+        return {"tamaño_muestra": self.N, "nivel_significancia": alpha, "k": self.k,
+                "frecuencias_obs": self.conteos.reshape(self.k, self.k).copy(), "frecuencia_esp": fe,
+                "chi_cuadrado": chi_cuadrado, "grados_libertad": gl, "valor_critico": valor_critico, "decision": decision}
+
+# Categorías de la prueba del póker y sus probabilidades, en el orden de PruebaPoker.
+CATEGORIAS_POKER = ("Todos diferentes", "Un par", "Dos pares", "Tercia", "Full", "Póker", "Quintilla")
+PROBABILIDADES_POKER = (0.3024, 0.5040, 0.1080, 0.0720, 0.0090, 0.0045, 0.0001)
+
+def _tabla_patrones() -> np.ndarray:
+    # Categoría según cuáles de los 4 pares de dígitos vecinos (ya ordenados) son iguales, codificados en 4 bits.
+    tabla = np.zeros(16, dtype=np.int64)
+    for codigo in range(16):
+        iguales = [(codigo >> b) & 1 for b in range(4)]
+        total = sum(iguales)
+        if total == 4:
+            tabla[codigo] = 6  # Quintilla: aaaaa.
+        elif total == 3:
+            tabla[codigo] = 5 if iguales[0] == 0 or iguales[3] == 0 else 4  # Póker (abbbb, aaaab) o full.
+        elif total == 2:
+            contiguos = any(iguales[b] and iguales[b + 1] for b in range(3))
+            tabla[codigo] = 3 if contiguos else 2  # Tercia (tres iguales seguidos) o dos pares.
+        else:
+            tabla[codigo] = total  # 1: un par; 0: todos diferentes.
+    return tabla
+
+_PATRONES_POKER = _tabla_patrones()
+
+def categorias_poker(numeros) -> np.ndarray:
+    # Índice en CATEGORIAS_POKER de cada número según sus cinco primeros decimales (los de f"{x:.5f}"), vectorizado.
+    cinco = np.rint(np.asarray(numeros, dtype=np.float64) * 100000).astype(np.int64) % 100000
+    digitos = np.sort(cinco[:, None] // np.array([10000, 1000, 100, 10, 1]) % 10, axis=1)
+    iguales = digitos[:, 1:] == digitos[:, :-1]
+    return _PATRONES_POKER[iguales @ np.array([1, 2, 4, 8])]
+
+class AcumuladorPoker:
+    # Prueba del póker: cuántos números caen en cada categoría.
+
+    def __init__(self):
+        self.conteos = np.zeros(len(CATEGORIAS_POKER), dtype=np.int64)
+        self.N = 0
+
+    def actualizar(self, bloque) -> None:
+        # Clasifica el bloque completo y suma sus conteos.
+        bloque = np.asarray(bloque, dtype=np.float64)
+        if len(bloque):
+            self.conteos += np.bincount(categorias_poker(bloque), minlength=len(CATEGORIAS_POKER))
+        self.N += len(bloque)
+
+    def combinar(self, otro: "AcumuladorPoker") -> "AcumuladorPoker":
+        # Suma los conteos por categoría del otro segmento.
+        self.conteos += otro.conteos
+        self.N += otro.N
+        return self
+
+    def resultado(self, alpha: float = 0.05) -> Dict[str, Union[float, str, Dict]]:
+        # χ² sobre las categorías con full, póker y quintilla combinadas, como PruebaPoker.
+        observadas = dict(zip(CATEGORIAS_POKER, self.conteos.tolist()))
+        esperadas = {c: p * self.N for c, p in zip(CATEGORIAS_POKER, PROBABILIDADES_POKER)}
+        combinadas = {c: {"observada": observadas[c], "esperada": esperadas[c]} for c in CATEGORIAS_POKER[:4]}
+        combinadas["Full+Póker+Quintilla"] = {"observada": sum(observadas[c] for c in CATEGORIAS_POKER[4:]),
+                                              "esperada": sum(esperadas[c] for c in CATEGORIAS_POKER[4:])}
+        estadistico = sum((f["observada"] - f["esperada"]) ** 2 / f["esperada"] for f in combinadas.values() if f["esperada"] > 0)
+        valor_critico = chi2.ppf(1 - alpha, df=len(combinadas) - 1)
+        if estadistico <= valor_critico:
+            decision = "No se rechaza H₀: Los números provienen de una distribución uniforme."
+        else:
+            decision = "Se rechaza H₀: Los números no provienen de una distribución uniforme."
+        return {"tamaño_muestra": self.N, "nivel_significancia": alpha, "frecuencias_obs": observadas,
+                "categorias_combinadas": combinadas, "estadistico_chi": estadistico,
+                "valor_critico": valor_critico, "decision": decision}
+
+class AcumuladorKS:
+    # Prueba de Kolmogorov-Smirnov sin guardar la muestra.
+    # - Camino exacto: si se indica m y los bloques son los estados enteros X del generador (x = X/m), se cuenta
+    #   cuántas veces aparece cada estado; con esos conteos la muestra ordenada se conoce completa y D es el mismo
+    #   que en PruebaKolmogorovSmirnov. La memoria depende de m, no de N.
+    # - Camino aproximado: para números reales se usa un histograma fino de 'resolucion' intervalos. Dentro de un
+    #   intervalo no se sabe dónde cayó cada número, así que se toma el peor caso: el resultado es una cota superior
+    #   de D (la decisión es conservadora) que excede al valor real en a lo más 1/resolucion ("error_maximo").
+    MAXIMO_EXACTO = 1 << 24  # Módulo más grande para el camino exacto (128 MB de conteos).
+
+    def __init__(self, m: Optional[int] = None, resolucion: int = 1 << 16):
+        if m is not None and not 1 < m <= self.MAXIMO_EXACTO:
+            raise ValueError(f"El camino exacto necesita 1 < m <= {self.MAXIMO_EXACTO}; para m mayores use el histograma")
+        self.m = m
+        self.exacto = m is not None
+        self.resolucion = resolucion
+        self.conteos = np.zeros(m if self.exacto else resolucion, dtype=np.int64)
+        self.N = 0
+
+    def actualizar(self, bloque) -> None:
+        # Camino exacto: cuenta los estados enteros; aproximado: cuenta los números en el histograma.
+        bloque = np.asarray(bloque)
+        if self.exacto:
+            if not np.issubdtype(bloque.dtype, np.integer):
+                raise ValueError("El camino exacto recibe los estados enteros del generador, no los números en [0,1]")
+            if len(bloque) and (bloque.min() < 0 or bloque.max() >= self.m):
+                raise ValueError(f"Los estados deben estar en [0, {self.m - 1}]")
+            self.conteos += np.bincount(bloque, minlength=self.m)
+        else:
+            self.conteos += np.bincount(indices_intervalo(bloque, self.resolucion), minlength=self.resolucion)
+        self.N += len(bloque)
+
+    def combinar(self, otro: "AcumuladorKS") -> "AcumuladorKS":
+        # Suma los conteos por estado o por intervalo; la distribución empírica no depende del orden de la muestra.
+        if (otro.exacto, otro.m, len(otro.conteos)) != (self.exacto, self.m, len(self.conteos)):
+            raise ValueError("Solo se pueden combinar acumuladores con el mismo m o la misma resolución")
+        self.conteos += otro.conteos
+        self.N += otro.N
+        return self
+
+    def _estadisticos(self):
+        # (D, D bilateral, error máximo). Los números iguales ocupan posiciones consecutivas i de la muestra ordenada,
+        # de previos*N + 1 a acumulados*N, así que basta revisar los extremos de cada grupo.
+        # D = max |i/N - xᵢ| es el de Coss Bu que reporta PruebaKolmogorovSmirnov; el bilateral max(D⁺, D⁻), con
+        # D⁻ = max(xᵢ - (i-1)/N), es el que sigue la distribución de Kolmogorov y da el p-value.
+        presentes = self.conteos > 0
+        acumulados = (np.cumsum(self.conteos) / self.N)[presentes]  # Fn(x) al final de cada grupo.
+        previos = acumulados - self.conteos[presentes] / self.N  # Fn justo antes del grupo.
+        if self.exacto:
+            menor = mayor = np.flatnonzero(presentes) / self.m  # El número del grupo se conoce exacto.
+            error = 0.0
+        else:
+            menor = np.flatnonzero(presentes) / self.resolucion  # El grupo está en algún punto del intervalo.
+            mayor = menor + 1 / self.resolucion
+            error = 1 / self.resolucion
+        d_mas = np.max(acumulados - menor)
+        d_menos = np.max(mayor - previos)
+        d_coss_bu = max(d_mas, np.max(mayor - previos - 1 / self.N))  # El primero del grupo está en i = previos*N + 1.
+        return float(d_coss_bu), float(max(d_mas, d_menos)), error
+
+    def resultado(self, alpha: float = 0.05) -> Dict[str, Union[float, str, bool]]:
+        # D, su p-value con la distribución exacta de Kolmogorov (kstwo) y el valor crítico de Coss Bu 1.36/√N;
+        # la decisión usa el p-value, como PruebaKolmogorovSmirnov.
+        d_estadistico, d_bilateral, error = self._estadisticos()
+        p_value = float(kstwo.sf(d_bilateral, self.N))
+        if p_value < alpha:
+            decision = "Se rechaza H₀: Los números no provienen de una distribución uniforme (0,1)."
+        else:
+            decision = "No se rechaza H₀: Los números provienen de una distribución uniforme (0,1)."
+        return {"tamaño_muestra": self.N, "nivel_significancia": alpha, "d_estadistico": d_estadistico,
+                "d_bilateral": d_bilateral, "error_maximo": error, "exacto": self.exacto, "p_value": p_value,
+                "d_critico": 1.36 / np.sqrt(self.N), "decision": decision}
+
+def acumuladores(m: Optional[int] = None) -> Dict[str, object]:
+    # Un acumulador por prueba; con m, Kolmogorov-Smirnov usa el camino exacto y recibe los estados enteros.
+    return {"frecuencias": AcumuladorFrecuencias(), "promedios": AcumuladorPromedios(), "series": AcumuladorSeries(),
+            "kolmogorov_smirnov": AcumuladorKS(m), "poker": AcumuladorPoker()}
+
+def probar_flujo(generar_estados: Callable[[int], np.ndarray], m: int, total: int, tamano_bloque: int = 1 << 20,
+                 pruebas: Optional[Dict[str, object]] = None) -> Dict[str, object]:
+    # Pasa 'total' números de un generador por los acumuladores, un bloque a la vez. generar_estados(n) devuelve
+    # los siguientes n estados enteros; los números en [0,1) son estados/m. Retorna los acumuladores.
+    pruebas = acumuladores(m if m <= AcumuladorKS.MAXIMO_EXACTO else None) if pruebas is None else pruebas
+    restantes = total
+    while restantes > 0:
+        estados = generar_estados(min(tamano_bloque, restantes))
+        uniformes = estados / m
+        for acumulador in pruebas.values():
+            exacto = isinstance(acumulador, AcumuladorKS) and acumulador.exacto
+            acumulador.actualizar(estados if exacto else uniformes)
+        restantes -= len(estados)
+    return pruebas
+
+def _probar_segmento(argumentos) -> Dict[str, object]:
+    # Trabajador: coloca un GCM_Primos en la posición 'inicio' (X_inicio = X0 * a^inicio mod m, en O(log inicio)) y
+    # pasa sus 'cantidad' estados por acumuladores nuevos. Retorna los acumuladores, que solo llevan conteos y sumas.
+    m, X0, a, inicio, cantidad, tamano_bloque = argumentos
+    gcm = GCM_Primos(m=m, X0=X0, a=a)
+    gcm.posicion(inicio)
+    return probar_flujo(gcm.generar_estados, m, cantidad, tamano_bloque)
+
+def probar_en_paralelo(m: int, X0: int, a: int, total: int, procesos: Optional[int] = None, segmentos: Optional[int] = None,
+                       tamano_bloque: int = 1 << 20) -> Dict[str, object]:
+    # Aplica las cinco pruebas a los 'total' números del GCM (X0·a, X0·a², ...) repartiéndolos en segmentos
+    # contiguos: cada proceso salta al inicio de su segmento y acumula por su cuenta, y los acumuladores se combinan
+    # en el orden de la secuencia. El resultado es el mismo que con probar_flujo sobre la secuencia completa.
+    # Con procesos=1 los segmentos se recorren en este proceso; None usa tantos procesos como núcleos.
+    segmentos = segmentos if segmentos is not None else (procesos or os.cpu_count() or 1)
+    limites = np.linspace(0, total, segmentos + 1).astype(np.int64)
+    tareas = [(m, X0, a, int(inicio), int(fin - inicio), tamano_bloque) for inicio, fin in zip(limites[:-1], limites[1:])]
+    if procesos == 1:
+        parciales = [_probar_segmento(tarea) for tarea in tareas]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as grupo:
+            parciales = list(grupo.map(_probar_segmento, tareas))
+    pruebas = parciales[0]
+    for parcial in parciales[1:]:
+        for nombre, acumulador in pruebas.items():
+            acumulador.combinar(parcial[nombre])
+    return pruebas
+
+if __name__ == "__main__":
+    # Las pruebas sobre la misma muestra de 10000 números del GCM, leída en bloques de 1000 como si no cupiera en memoria.
+    m, X0, a = 32057, 20855, 9600
+    gcm = GCM_Primos(m=m, X0=X0, a=a)
+
+    print(f"\nProbando con m={m}, X0={X0}, a={a} (10000 números en bloques de 1000)")
+    print("="*80)
+    for nombre, acumulador in probar_flujo(gcm.generar_estados, m, 10000, tamano_bloque=1000).items():
+        r = acumulador.resultado(0.05)
+        estadistico = next(r[c] for c in ("chi_cuadrada", "z_estadistico", "chi_cuadrado", "d_estadistico", "estadistico_chi") if c in r)
+        print(f"{nombre:<22}{estadistico:>14.5f}   {r['decision']}")
+
+    # La misma muestra en 4 segmentos procesados en paralelo y reducidos: los estadísticos coinciden.
+    print("\nLos mismos 10000 números en 4 segmentos en paralelo")
+    print("="*80)
+    for nombre, acumulador in probar_en_paralelo(m, X0, a, 10000, procesos=2, segmentos=4).items():
+        r = acumulador.resultado(0.05)
+        estadistico = next(r[c] for c in ("chi_cuadrada", "z_estadistico", "chi_cuadrado", "d_estadistico", "estadistico_chi") if c in r)
+        print(f"{nombre:<22}{estadistico:>14.5f}   {r['decision']}")
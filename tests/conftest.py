@@ -0,0 +1,18 @@
+import importlib.util  # Importamos importlib para cargar cada aplicación desde su carpeta, que no es un paquete.
+import os  # Importamos os para construir las rutas de las carpetas del proyecto.
+import sys  # Importamos sys para agregarlas a la ruta de búsqueda de módulos.
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")  # Carpeta raíz del repositorio.
+
+# Las carpetas tienen espacios y no son paquetes: se agregan a la ruta como lo hacen las aplicaciones y las pruebas.
+sys.path.append(os.path.join(RAIZ, "Aplicaciones de simulación (Parámetros válidos)", "GCM con parametros definidos"))
+sys.path.append(os.path.join(RAIZ, "Pruebas Estadísticas"))
+sys.path.append(os.path.join(RAIZ, "GeneradorCongruencialLinealMixto"))
+
+def cargar_aplicacion(carpeta: str, archivo: str):
+    # Carga el módulo de una aplicación con un nombre propio, porque todas definen su clase GCM.
+    ruta = os.path.join(RAIZ, "Aplicaciones de simulación (Parámetros válidos)", carpeta, archivo)
+    especificacion = importlib.util.spec_from_file_location("aplicacion_" + archivo[:-3], ruta)
+    modulo = importlib.util.module_from_spec(especificacion)
+    especificacion.loader.exec_module(modulo)
+    return modulo
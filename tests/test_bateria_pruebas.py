@@ -0,0 +1,21 @@
+import pytest  # Importamos pytest para verificar las excepciones y comparar flotantes.
+from BateriaPruebas import cargar_modulo, ejecutar_bateria, obtener_muestra  # Batería y carga de las pruebas.
+
+def test_prueba_desconocida_se_rechaza_antes_de_ejecutar():
+    # Un nombre que no está en PRUEBAS se reporta con ValueError antes de cargar módulos o crear procesos.
+    with pytest.raises(ValueError, match="poquer"):
+        ejecutar_bateria(obtener_muestra(n=1000), pruebas=["frecuencias", "poquer"])
+    with pytest.raises(ValueError, match="poquer"):
+        ejecutar_bateria(obtener_muestra(n=1000), pruebas=["poquer"], procesos=2)
+
+def test_series_usa_el_resultado_de_la_prueba():
+    # La batería reporta exactamente el estadístico, el valor crítico y la decisión de PruebaSeries.
+    numeros = obtener_muestra(n=5000)
+    prueba = cargar_modulo("series").PruebaSeries()
+    prueba.alpha = 0.1
+    prueba.cargar_numeros_pseudoaleatorios(numeros)
+    esperado = prueba.ejecutar_prueba_tuplas()
+    obtenido = ejecutar_bateria(numeros, alpha=0.1, pruebas=["series"])["pruebas"]["series"]
+    assert obtenido["estadistico"] == pytest.approx(esperado["chi_cuadrado"])
+    assert obtenido["valor_critico"] == pytest.approx(esperado["valor_critico"])
+    assert obtenido["decision"] == esperado["decision"]
@@ -0,0 +1,108 @@
+import math  # Importamos math para las fórmulas escalares originales del camión.
+import numpy as np  # Importamos numpy para las fuentes de uniformes y los conteos.
+import pytest  # Importamos pytest para repetir la prueba en cada tabla.
+from scipy.stats import norm  # Importamos norm para la masa exacta de la cola de la normal.
+from conftest import cargar_aplicacion  # Carga una aplicación por su ruta.
+from Distribuciones import (_BORDES_ZIGURAT, TablaAlias, empirica_continua, exponencial, gamma, normal_box_muller,
+                            normal_zigurat, triangular)  # Transformaciones continuas, tabla de alias y bordes del zigurat.
+from GCM_ParametrosDefinidos import GCM_Primos  # Un período completo de uniformes del curso.
+
+# Tablas de las cadenas "if r < límite: return valor ... else: return último" que reemplazó DistribucionDiscreta.
+CADENAS = {
+    "camiones_iniciales": ([0, 1, 2, 3], [0.50, 0.75, 0.90]),
+    "tiempo_entre_llegadas": ([20, 25, 30, 35, 40, 45, 50, 55, 60], [0.02, 0.10, 0.22, 0.47, 0.67, 0.82, 0.92, 0.97]),
+    "servicio_3": ([20, 25, 30, 35, 40, 45, 50, 55, 60], [0.05, 0.15, 0.35, 0.60, 0.72, 0.82, 0.90, 0.96]),
+    "servicio_4": ([15, 20, 25, 30, 35, 40, 45, 50, 55], [0.05, 0.20, 0.40, 0.60, 0.75, 0.87, 0.95, 0.99]),
+    "servicio_5": ([10, 15, 20, 25, 30, 35, 40, 45, 50], [0.10, 0.28, 0.50, 0.68, 0.78, 0.86, 0.92, 0.97]),
+    "servicio_6": ([5, 10, 15, 20, 25, 30, 35, 40, 45], [0.12, 0.27, 0.53, 0.68, 0.80, 0.88, 0.94, 0.98]),
+    "demanda_base": (list(range(35, 61)), [0.010, 0.025, 0.045, 0.065, 0.087, 0.110, 0.135, 0.162, 0.190, 0.219, 0.254,
+                                            0.299, 0.359, 0.424, 0.494, 0.574, 0.649, 0.719, 0.784, 0.844, 0.894, 0.934,
+                                            0.964, 0.980, 0.995]),
+}
+
+def cadena_if_elif(r: float, valores, limites):
+    # Lo que hacían las cadenas originales: el primer valor cuyo límite es mayor que r; si ninguno, el último.
+    for valor, limite in zip(valores, limites):
+        if r < limite:
+            return valor
+    return valores[-1]
+
+def tablas_de_las_aplicaciones():
+    # Las DistribucionDiscreta que usan ahora las aplicaciones, con el mismo nombre que en CADENAS.
+    colas = cargar_aplicacion("Ejemplo 5.5 Sistema de Colas", "SistemaDeColas.py")
+    inventarios = cargar_aplicacion("Ejemplo 5.4 Sistema de Inventarios", "SistemaInventarios.py")
+    tablas = {"camiones_iniciales": colas.CAMIONES_INICIALES, "tiempo_entre_llegadas": colas.TIEMPO_ENTRE_LLEGADAS,
+              "demanda_base": inventarios.DEMANDA_BASE}
+    tablas.update({f"servicio_{k}": tabla for k, tabla in colas.TIEMPO_SERVICIO.items()})
+    return tablas
+
+@pytest.mark.parametrize("nombre", sorted(CADENAS))
+def test_tablas_discretas_igual_a_las_cadenas(nombre):
+    # Mismo valor para cada r (incluidos los límites y el número justo debajo) y mismas frecuencias en un período del GCM.
+    valores, limites = CADENAS[nombre]
+    tabla = tablas_de_las_aplicaciones()[nombre]
+    bordes = np.array(limites)
+    r = np.concatenate((np.linspace(0, 1, 20001, endpoint=False), bordes, np.nextafter(bordes, 0)))
+    esperados = [cadena_if_elif(x, valores, limites) for x in r]
+    assert [tabla.muestra(x) for x in r] == esperados
+    assert tabla.muestras(r).tolist() == esperados
+    uniformes = GCM_Primos().generar_periodo().uniformes
+    frecuencias = np.unique([cadena_if_elif(x, valores, limites) for x in uniformes], return_counts=True)
+    obtenidas = np.unique(tabla.muestras(uniformes), return_counts=True)
+    assert np.array_equal(frecuencias[0], obtenidas[0]) and np.array_equal(frecuencias[1], obtenidas[1])
+
+def test_triangular_igual_a_las_formulas_del_camion():
+    # Con (190, 210, 230) la transformada inversa da lo mismo que las dos fórmulas que usaba Camiones.
+    uniformes = GCM_Primos().generar_periodo().uniformes
+    formulas = [190 + math.sqrt(800 * r) if r < 0.5 else 230 - math.sqrt(800 * (1 - r)) for r in uniformes]
+    assert np.allclose(triangular(uniformes, 190, 210, 230), formulas, rtol=0, atol=1e-12)
+
+def test_exponencial_y_empirica_son_transformadas_inversas():
+    # La acumulada de cada transformación, evaluada en su resultado, devuelve el uniforme.
+    u = np.linspace(0, 0.999, 1000)
+    assert np.allclose(1 - np.exp(-exponencial(u, 4.0) / 4.0), u)
+    datos = [3.0, 1.0, 2.0, 5.0]
+    assert np.allclose(empirica_continua([0, 1 / 3, 0.5, 1], datos), [1.0, 2.0, 2.5, 5.0])
+
+def test_momentos_de_las_normales_y_la_gamma():
+    # Media y varianza muestrales con un millón de variables: normal (0, 1) y gamma con forma mayor y menor que 1.
+    fuente = np.random.default_rng(99).random
+    n = 1_000_000
+    for z in (normal_box_muller(fuente(n)), normal_zigurat(fuente, n)):
+        assert abs(z.mean()) < 5 / np.sqrt(n) and abs(z.var() - 1) < 10 * np.sqrt(2 / n)
+    for forma, escala in ((2.5, 2.0), (0.5, 1.0)):
+        g = gamma(fuente, n, forma, escala)
+        assert g.mean() == pytest.approx(forma * escala, rel=0.01)
+        assert g.var() == pytest.approx(forma * escala ** 2, rel=0.02)
+
+def test_zigurat_masa_de_la_cola():
+    # La fracción de |z| > r debe coincidir con 2 * P(Z > r); con 8 millones se esperan unas 4609 en la cola.
+    n, r = 8_000_000, _BORDES_ZIGURAT[1]
+    z = normal_zigurat(np.random.default_rng(20241018).random, n)
+    esperado = 2 * norm.sf(r) * n
+    observado = np.count_nonzero(np.abs(z) > r)
+    assert abs(observado - esperado) < 3 * np.sqrt(esperado)
+
+@pytest.mark.parametrize("nombre", sorted(CADENAS))
+def test_alias_mismas_frecuencias_que_las_cadenas(nombre):
+    # Sobre una rejilla de un millón de uniformes, cada valor sale tantas veces como en la cadena, salvo el redondeo
+    # de la rejilla en los bordes de cada columna (a lo más dos por columna).
+    valores, limites = CADENAS[nombre]
+    alias = tablas_de_las_aplicaciones()[nombre].alias
+    n = 1_000_000
+    r = (np.arange(n) + 0.5) / n
+    esperados = np.searchsorted(limites, r, side="right")  # Índice del valor que daría la cadena.
+    obtenidos = alias.muestras(r)
+    for i, valor in enumerate(valores):
+        assert abs(np.count_nonzero(obtenidos == valor) - np.count_nonzero(esperados == i)) <= 2 * len(valores)
+    muestra = r[::997]
+    assert [alias.muestra(x) for x in muestra] == obtenidos[::997].tolist()
+
+def test_alias_con_probabilidades_arbitrarias():
+    # Con probabilidades que no suman 1 ni son múltiplos de 1/n, las frecuencias son las normalizadas.
+    pesos = np.random.default_rng(7).random(13)
+    alias = TablaAlias(list("abcdefghijklm"), pesos)
+    n = 1_000_000
+    obtenidos = alias.muestras((np.arange(n) + 0.5) / n)
+    frecuencias = np.array([np.count_nonzero(obtenidos == v) for v in "abcdefghijklm"]) / n
+    assert np.allclose(frecuencias, pesos / pesos.sum(), atol=30 / n)
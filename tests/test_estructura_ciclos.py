@@ -0,0 +1,40 @@
+import numpy as np  # Importamos numpy para los mapeos aleatorios.
+import pytest  # Importamos pytest para repetir la prueba con varias semillas.
+from GCM_ParametrosDefinidos import EstructuraCiclos, ciclo_brent, sucesores_gcm  # Analizador y recorridos de referencia.
+
+def recorrer(sucesores, x):
+    # Recorre x, f(x), ... guardando las posiciones hasta repetir un estado; retorna (cola, estados del ciclo).
+    vistos = {}
+    while x not in vistos:
+        vistos[x] = len(vistos)
+        x = int(sucesores[x])
+    recorrido = list(vistos)
+    return vistos[x], recorrido[vistos[x]:]
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_mapeos_aleatorios_contra_fuerza_bruta(semilla):
+    # Para cada estado: ciclo (su mínimo), cola, pertenencia al ciclo y longitud, igual que al recorrerlo paso a paso.
+    aleatorio = np.random.default_rng(semilla)
+    n = int(aleatorio.integers(1, 400))
+    sucesores = aleatorio.integers(0, n, size=n)
+    estructura = EstructuraCiclos(sucesores)
+    longitudes = {}
+    for x in range(n):
+        cola, ciclo = recorrer(sucesores, x)
+        assert estructura.ciclo[x] == min(ciclo)
+        assert estructura.cola[x] == cola
+        assert estructura.en_ciclo[x] == (cola == 0)
+        assert estructura.periodo(x) == len(ciclo)
+        longitudes[min(ciclo)] = len(ciclo)
+    assert estructura.longitudes == longitudes
+    minimo = max(longitudes.values())
+    esperadas = [x for x in range(n) if estructura.periodo(x) >= minimo]
+    assert estructura.semillas_con_periodo(minimo).tolist() == esperadas
+
+def test_gcm_con_modulo_compuesto():
+    # Con m = 1000 (no primo) cada semilla tiene la cola y el período que da el algoritmo de Brent.
+    a, m = 21, 1000
+    estructura = EstructuraCiclos(sucesores_gcm(a, m))
+    for x0 in range(m):
+        mu, periodo = ciclo_brent(a, m, x0)
+        assert (estructura.cola[x0], estructura.periodo(x0)) == (mu, periodo)
@@ -0,0 +1,58 @@
+import threading  # Importamos threading para detectar una lectura que se queda bloqueada.
+import numpy as np  # Importamos numpy para los bloques de la fuente de prueba.
+from FuentesAleatorias import FuenteGCM, FuentePrecargada  # Fuente envuelta y envoltura con precarga.
+
+class FuenteQueFalla:
+    # Fuente que entrega un bloque y después falla, para simular un productor que muere.
+
+    def __init__(self):
+        self.llamadas = 0
+
+    def bloque(self, n: int) -> np.ndarray:
+        self.llamadas += 1
+        if self.llamadas > 1:
+            raise RuntimeError("fallo del generador")
+        return np.zeros(n)
+
+def leer_sin_bloquear(lectura, limite: float = 5.0):
+    # Ejecuta lectura() en otro hilo y retorna su excepción (o None); falla si no termina en 'limite' segundos.
+    resultado = {}
+    def ejecutar():
+        try:
+            lectura()
+        except Exception as error:
+            resultado["error"] = error
+    hilo = threading.Thread(target=ejecutar, daemon=True)
+    hilo.start()
+    hilo.join(limite)
+    assert not hilo.is_alive(), "la lectura se quedó bloqueada"
+    return resultado.get("error")
+
+def test_error_del_productor_se_relanza_en_cada_lectura():
+    fuente = FuentePrecargada(FuenteQueFalla(), tamano_bloque=4, profundidad=1)
+    assert len(fuente.bloque(4)) == 4
+    for _ in range(3):  # La primera lectura recibe el error; las siguientes lo vuelven a lanzar sin esperar.
+        assert isinstance(leer_sin_bloquear(fuente.siguiente), RuntimeError)
+    fuente.cerrar()
+
+def test_leer_despues_de_cerrar_no_bloquea():
+    fuente = FuentePrecargada(FuenteGCM(), tamano_bloque=8, profundidad=2)
+    fuente.bloque(8)  # Arranca el productor y agota el bloque actual.
+    fuente.cerrar()
+    assert isinstance(leer_sin_bloquear(fuente.siguiente), ValueError)
+    nunca_usada = FuentePrecargada(FuenteGCM())
+    nunca_usada.cerrar()
+    assert isinstance(leer_sin_bloquear(lambda: nunca_usada.bloque(3)), ValueError)
+
+def test_cerrar_desde_otro_hilo_libera_al_consumidor():
+    class FuenteLenta:
+        def bloque(self, n: int) -> np.ndarray:
+            threading.Event().wait(0.5)  # El consumidor queda esperando el primer bloque.
+            return np.zeros(n)
+    fuente = FuentePrecargada(FuenteLenta(), tamano_bloque=4, profundidad=1)
+    threading.Timer(0.1, fuente.cerrar).start()
+    assert isinstance(leer_sin_bloquear(fuente.siguiente), ValueError)
+
+def test_misma_secuencia_que_la_fuente():
+    with FuentePrecargada(FuenteGCM(), tamano_bloque=100, profundidad=2) as fuente:
+        assert np.array_equal(fuente.bloque(250), FuenteGCM().bloque(250))
@@ -0,0 +1,37 @@
+import numpy as np  # Importamos numpy para comparar los bloques de estados.
+from Generador_CLM import Generador_CLM, verificar_hull_dobell  # Generador mixto y su validación de parámetros.
+
+def periodo_desde_cero(a: int, c: int, m: int) -> int:
+    # Período de X_{n+1} = (a * X_n + c) mod m partiendo de 0, recorriendo la secuencia paso a paso.
+    x, pasos = (c % m), 1
+    while x != 0 and pasos <= m:
+        x, pasos = (a * x + c) % m, pasos + 1
+    return pasos
+
+def test_hull_dobell_coincide_con_fuerza_bruta():
+    # Con d = 5, Hull–Dobell se cumple exactamente para los (a, c) cuyo período recorrido es m = 32.
+    m = 1 << 5
+    for a in range(m):
+        for c in range(m):
+            assert (not verificar_hull_dobell(a, c, m)) == (periodo_desde_cero(a, c, m) == m), (a, c)
+
+def test_periodo_completo_para_d_pequeno():
+    # Con parámetros válidos y d = 10, un período de estados recorre los 1024 valores y vuelve a la semilla.
+    generador = Generador_CLM(Xo=7, a=4 * 37 + 1, c=123, d=10)
+    estados = generador.generar_estados(generador.m)
+    assert len(np.unique(estados)) == generador.m
+    assert int(estados[-1]) == 7
+
+def test_estados_y_posicion_igual_a_la_recurrencia():
+    # Los bloques de 64 bits (más de uno) y los saltos dan lo mismo que X_{n+1} = (a * X_n + c) mod 2^64 con enteros.
+    generador = Generador_CLM(semilla=2024)
+    m, a, c, x = generador.m, generador.a, generador.c, generador.Xo
+    n = Generador_CLM.TAMANO_BLOQUE + 1000
+    escalares = []
+    for _ in range(n):
+        x = (a * x + c) % m
+        escalares.append(x)
+    assert [int(e) for e in generador.generar_estados(n)] == escalares
+    for k in (1, 12345, n):
+        assert generador.posicion(k) == escalares[k - 1]
+    assert generador.posicion(0) == generador.Xo
@@ -0,0 +1,13 @@
+import numpy as np  # Importamos numpy para la muestra de quien llama.
+import pytest  # Importamos pytest para verificar las excepciones.
+from MuestraUniforme import MuestraUniforme  # Muestra compartida por las pruebas.
+
+def test_no_congela_el_arreglo_de_quien_llama():
+    # La muestra guarda su propia copia: el arreglo original sigue siendo modificable y no altera la muestra.
+    numeros = np.linspace(0.05, 0.95, 10)
+    muestra = MuestraUniforme(numeros)
+    numeros[0] = 0.5
+    assert numeros.flags.writeable
+    assert muestra.numeros[0] == 0.05
+    with pytest.raises(ValueError):
+        muestra.numeros[0] = 0.5
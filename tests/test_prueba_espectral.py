@@ -0,0 +1,21 @@
+import math  # Importamos math para la figura de mérito esperada.
+import pytest  # Importamos pytest para repetir la prueba en cada dimensión.
+from PruebaEspectral import base_red_dual, prueba_espectral, vector_mas_corto  # Red dual y su vector más corto.
+
+# ν_t^2 del generador mínimo estándar a = 16807, m = 2^31-1 (ν_2 a ν_6 ≈ 16807, 638.9, 147.2, 66.6, 29.9).
+M, A = 2147483647, 16807
+NU_CUADRADA = {2: 282475250, 3: 408197, 4: 21682, 5: 4439, 6: 895}
+
+@pytest.mark.parametrize("t", sorted(NU_CUADRADA))
+def test_vector_mas_corto_de_16807(t):
+    # La norma es la publicada y el vector pertenece a la red dual: x1 + a*x2 + ... + a^(t-1)*xt ≡ 0 (mod m).
+    norma, vector = vector_mas_corto(base_red_dual(A, M, t))
+    assert norma == NU_CUADRADA[t]
+    assert sum(x * x for x in vector) == norma
+    assert sum(x * pow(A, i, M) for i, x in enumerate(vector)) % M == 0
+
+def test_figura_de_merito_de_16807():
+    # S_t = ν_t / (γ_t^(1/2) m^(1/t)); en dimensión 2 es ν_2 / ((4/3)^(1/4) sqrt(m)).
+    figuras = prueba_espectral(A, M, range(2, 7))
+    assert figuras[2] == pytest.approx(math.sqrt(NU_CUADRADA[2]) / ((4 / 3) ** 0.25 * math.sqrt(M)))
+    assert all(0 < s <= 1 for s in figuras.values())
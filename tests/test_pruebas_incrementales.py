@@ -0,0 +1,28 @@
+import numpy as np  # Importamos numpy para comparar los conteos de los acumuladores.
+import pytest  # Importamos pytest para comparar flotantes con tolerancia.
+from GCM_ParametrosDefinidos import GCM_Primos  # Generador de referencia para la pasada secuencial.
+from PruebasIncrementales import probar_en_paralelo, probar_flujo  # Los dos caminos que deben coincidir.
+
+@pytest.mark.parametrize("m, a", [(2147483647, 16807), ((1 << 61) - 1, 437799614237992725)])
+def test_paralelo_igual_a_una_pasada(m, a):
+    # Los segmentos repartidos con salto hacia adelante y combinados dan lo mismo que una sola pasada del generador,
+    # también con un módulo de 61 bits, donde el producto de dos estados no cabe en int64.
+    X0, total = 20855, 200003
+    secuencial = probar_flujo(GCM_Primos(m=m, X0=X0, a=a).generar_estados, m, total, tamano_bloque=4096)
+    paralelo = probar_en_paralelo(m, X0, a, total, procesos=2, segmentos=5, tamano_bloque=4096)
+    for nombre, acumulador in secuencial.items():
+        if hasattr(acumulador, "conteos"):
+            assert np.array_equal(acumulador.conteos, paralelo[nombre].conteos), nombre
+        esperado, obtenido = acumulador.resultado(), paralelo[nombre].resultado()
+        assert obtenido["tamaño_muestra"] == total
+        assert obtenido["decision"] == esperado["decision"]
+    assert paralelo["promedios"].resultado()["promedio_muestral"] == pytest.approx(
+        secuencial["promedios"].resultado()["promedio_muestral"], rel=1e-12)
+
+def test_estados_son_los_del_generador():
+    # El flujo recibe los estados exactos de GCM_Primos: X_{t+1} = a * X_t mod m con enteros de Python.
+    m, a, X = (1 << 61) - 1, 437799614237992725, 20855
+    estados = GCM_Primos(m=m, X0=X, a=a).generar_estados(1000)
+    for estado in estados:
+        X = a * X % m
+        assert int(estado) == X
@@ -0,0 +1,24 @@
+import random  # Importamos random para fijar la semilla del muestreo por rechazo.
+import pytest  # Importamos pytest para repetir la prueba con varios módulos.
+from GCM_ParametrosDefinidos import GCM_Primos, factorizar_n, raices_primitivas  # Muestreo y enumeración de raíces.
+
+@pytest.mark.parametrize("m", [32057, 2147483647, (1 << 61) - 1])
+def test_raiz_primitiva_aleatoria(m):
+    # El muestreo por rechazo funciona también con módulos de 31 y 61 bits, donde no se pueden enumerar todas.
+    random.seed(12345)
+    g = GCM_Primos(m=m)._generar_raiz_primitiva_aleatoria(m)
+    assert 2 <= g <= m - 1
+    assert all(pow(g, (m - 1) // q, m) != 1 for q in factorizar_n(m - 1))
+
+def test_raiz_aleatoria_esta_entre_las_enumeradas():
+    # Para un módulo pequeño, las raíces del muestreo son las mismas que enumera raices_primitivas.
+    m = 32057
+    random.seed(2024)
+    generador = GCM_Primos(m=m)
+    raices = set(int(r) for r in raices_primitivas(m))
+    assert all(generador._generar_raiz_primitiva_aleatoria(m) in raices for _ in range(50))
+
+def test_enumerar_modulo_grande_se_rechaza():
+    # Enumerar todas las raíces de 2^61-1 no cabe en memoria: se rechaza antes de reservar el arreglo.
+    with pytest.raises(ValueError):
+        raices_primitivas((1 << 61) - 1)
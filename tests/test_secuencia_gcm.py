@@ -0,0 +1,43 @@
+import pytest  # Importamos pytest para repetir la prueba en cada aplicación.
+from conftest import cargar_aplicacion  # Carga una aplicación por su ruta.
+from GCM_ParametrosDefinidos import periodo_en_cache, ruta_periodo_cache  # Caché de períodos en disco.
+
+APLICACIONES = [
+    ("Ejemplo 5.2 Camión Transportador", "Camiones.py"),
+    ("Ejemplo 5.3 Estimación de PI", "AproximarPI.py"),
+    ("Ejemplo 5.4 Sistema de Inventarios", "SistemaInventarios.py"),
+]
+
+@pytest.fixture(autouse=True)
+def cache_temporal(tmp_path, monkeypatch):
+    # Los períodos se guardan en un directorio temporal, nunca en la caché real del usuario.
+    monkeypatch.setenv("GCM_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+@pytest.mark.parametrize("carpeta, archivo", APLICACIONES)
+def test_continuar_despues_de_secuencia(carpeta, archivo):
+    # Después de pedir el período, el generador debe entregar exactamente X_{mu+p} = a * X_{mu+p-1} mod m.
+    gcm = cargar_aplicacion(carpeta, archivo).GCM(al_terminar="continuar")
+    ultimo = int(gcm.secuencia[-1])  # X_{mu+p-1}, el último estado guardado.
+    siguiente = gcm.a * ultimo % gcm.m
+    assert int(gcm.generar_estados(1)[0]) == siguiente
+
+@pytest.mark.parametrize("carpeta, archivo", APLICACIONES)
+def test_flujo_continua_sin_saltar_valores(carpeta, archivo):
+    # Al agotar el período con "continuar", el flujo sigue con el estado siguiente sin saltarse ninguno.
+    gcm = cargar_aplicacion(carpeta, archivo).GCM(al_terminar="continuar")
+    total = len(gcm.secuencia)
+    for _ in range(total):
+        gcm.flujo.siguiente()
+    siguiente = gcm.a * int(gcm.secuencia[-1]) % gcm.m
+    assert gcm.flujo.siguiente() == siguiente / gcm.m
+    assert gcm.flujo.siguiente() == gcm.a * siguiente % gcm.m / gcm.m
+
+def test_cache_en_el_directorio_indicado(tmp_path, cache_temporal):
+    # El directorio explícito y GCM_CACHE_DIR se respetan en cada llamada, no solo al importar el módulo.
+    explicito = tmp_path / "explicito"
+    periodo_en_cache(101, 2, 1, directorio=str(explicito))
+    assert (explicito / "gcm_m101_a2_x1.npy").exists()
+    periodo_en_cache(101, 2, 1)
+    assert ruta_periodo_cache(101, 2, 1) == str(cache_temporal / "gcm_m101_a2_x1.npy")
+    assert (cache_temporal / "gcm_m101_a2_x1.npy").exists()